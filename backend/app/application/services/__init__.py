@@ -1,3 +1,23 @@
 from app.application.services.feature_flag_service import FeatureFlagService
+from app.application.services.idempotency_store import (
+    IdempotencyRecord,
+    IdempotencyStore,
+    StoredResponse,
+)
+from app.application.services.immutable_result_cache import ImmutableResultCache
+from app.application.services.product_code_index import ProductCodeIndex
+from app.application.services.session_event_publisher import (
+    SessionEvent,
+    SessionEventPublisher,
+)
 
-__all__ = ["FeatureFlagService"]
+__all__ = [
+    "FeatureFlagService",
+    "IdempotencyRecord",
+    "IdempotencyStore",
+    "ImmutableResultCache",
+    "ProductCodeIndex",
+    "SessionEvent",
+    "SessionEventPublisher",
+    "StoredResponse",
+]
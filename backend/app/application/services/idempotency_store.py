@@ -0,0 +1,42 @@
+"""
+Idempotency keys for retried POSTs.
+
+Handhelds that lose connectivity queue their submissions and resend them on reconnect,
+each with the Idempotency-Key it was first sent with. The first request claims the key
+and, once it succeeds, stores its response; a replay with the same key and payload gets
+that response back without running validation or writes again.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    body: bytes
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    """What a key already holds: response is None while the first request is in flight."""
+
+    fingerprint: bytes
+    response: StoredResponse | None
+
+
+class IdempotencyStore(ABC):
+    @abstractmethod
+    def claim(self, key: str, fingerprint: bytes) -> IdempotencyRecord | None:
+        """Claim a free key (returns None) or return the record already stored under it."""
+        pass
+
+    @abstractmethod
+    def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response of a claimed key for replays."""
+        pass
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Drop a claim whose request failed, so a retry runs normally."""
+        pass
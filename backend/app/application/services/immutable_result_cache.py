@@ -0,0 +1,34 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class ImmutableResultCache:
+    """Small in-process LRU for results that can never change once computed
+    (e.g. reports over closed sessions). Keys must identify the inputs exactly.
+
+    Kept apart from the cache-aside layer (app.infrastructure.cache.get_cache) on
+    purpose: entries here are never stale, so they need no TTL, tags or invalidation,
+    and a hit hands back the report object itself instead of unpickling a whole
+    month of rows from Redis. Use get_cache for data that writes can change."""
+
+    def __init__(self, max_entries: int = 64):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,53 @@
+"""
+In-process product code -> id map for scanner submissions (POST .../counts/by-code).
+
+The catalog changes rarely, so the whole map is loaded in one query on first use and
+dropped whenever this process writes a product (invalidate). Writes made by other
+workers are picked up after ttl_seconds, or sooner on a miss: an unknown code reloads
+the map at most once every miss_reload_seconds, so new products are found right away
+and a stream of bad scans cannot turn into a query per scan.
+"""
+
+import time
+from threading import Lock
+from typing import Callable, Optional
+from uuid import UUID
+
+CodeLoader = Callable[[], dict[str, UUID]]
+
+
+class ProductCodeIndex:
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        miss_reload_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl_seconds
+        self._miss_reload = miss_reload_seconds
+        self._clock = clock
+        self._codes: Optional[dict[str, UUID]] = None
+        self._loaded_at = 0.0
+        self._lock = Lock()
+
+    def lookup(self, code: str, load: CodeLoader) -> Optional[UUID]:
+        """Product id for code, loading the map through load() when needed."""
+        with self._lock:
+            now = self._clock()
+            if self._codes is None or now - self._loaded_at >= self._ttl:
+                self._reload(load, now)
+            assert self._codes is not None
+            product_id = self._codes.get(code)
+            if product_id is None and now - self._loaded_at >= self._miss_reload:
+                self._reload(load, now)
+                product_id = self._codes.get(code)
+            return product_id
+
+    def invalidate(self) -> None:
+        """Drop the map; the next lookup reloads it."""
+        with self._lock:
+            self._codes = None
+
+    def _reload(self, load: CodeLoader, now: float) -> None:
+        self._codes = load()
+        self._loaded_at = now
@@ -0,0 +1,52 @@
+"""
+Inventory session progress events.
+
+Use cases publish an event after their change is committed; the infrastructure fans it
+out to live subscribers (GET /inventory-sessions/{id}/events). Delivery is best effort:
+clients that miss events re-read the session, so publishing never fails a use case.
+Payloads stay small and bounded (Postgres NOTIFY rejects 8000 bytes or more): events
+carry one row or a count, never a list that grows with the batch.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+COUNT_REGISTERED = "count_registered"
+PRODUCTS_ADDED = "products_added"
+SESSION_CLOSED = "session_closed"
+
+
+@dataclass(frozen=True)
+class SessionEvent:
+    type: str
+    session_id: UUID
+    data: dict[str, Any] = field(default_factory=dict)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "session_id": str(self.session_id),
+            "occurred_at": self.occurred_at.isoformat(),
+            "data": self.data,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> "SessionEvent":
+        return cls(
+            type=raw["type"],
+            session_id=UUID(raw["session_id"]),
+            data=raw.get("data") or {},
+            occurred_at=datetime.fromisoformat(raw["occurred_at"]),
+        )
+
+
+class SessionEventPublisher(ABC):
+    """Port used by use cases; implementations must not raise on delivery problems."""
+
+    @abstractmethod
+    def publish(self, event: SessionEvent) -> None:
+        pass
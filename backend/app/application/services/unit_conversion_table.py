@@ -0,0 +1,110 @@
+"""
+Precomputed unit conversion table: counts in any unit normalized to inventory units.
+
+The graph has one edge per unit_conversions row (1 from = factor to, walkable both
+ways) plus, for every product, packaging_unit -> inventory_unit = conversion_factor.
+Global edges are closed into an all-pairs table when the table is built; products
+with overrides get their own closure over global + override edges. A lookup is then
+at most two dict reads: straight to the inventory unit, or to the packaging unit and
+across the product's own factor, which covers every path in the graph.
+
+Factors compose exactly (Decimal). On inconsistent cycles the shortest path wins.
+The table is immutable; UnitConversionTableCache holds the current one per process.
+"""
+
+import time
+from collections import defaultdict, deque
+from decimal import Decimal
+from threading import Lock
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from app.domain.entities.product import Product
+from app.domain.entities.unit_conversion import UnitConversion
+from app.domain.services.unit_conversion_service import exact_factor
+
+Pairs = dict[tuple[UUID, UUID], Decimal]
+ConversionLoader = Callable[[], list[UnitConversion]]
+
+
+def _closure(edges: Iterable[UnitConversion]) -> Pairs:
+    graph: dict[UUID, list[tuple[UUID, Decimal]]] = defaultdict(list)
+    for e in edges:
+        factor = exact_factor(e.factor)
+        graph[e.from_unit_id].append((e.to_unit_id, factor))
+        graph[e.to_unit_id].append((e.from_unit_id, 1 / factor))
+    pairs: Pairs = {}
+    for source in graph:
+        # BFS: fewest hops first, so a direct edge beats any longer path
+        reached = {source: Decimal(1)}
+        queue = deque([source])
+        while queue:
+            unit = queue.popleft()
+            for target, factor in graph[unit]:
+                if target not in reached:
+                    reached[target] = reached[unit] * factor
+                    queue.append(target)
+        for target, factor in reached.items():
+            if target != source:
+                pairs[(source, target)] = factor
+    return pairs
+
+
+class UnitConversionTable:
+    def __init__(self, conversions: Iterable[UnitConversion] = ()):
+        conversions = list(conversions)
+        global_edges = [c for c in conversions if c.product_id is None]
+        overrides: dict[UUID, list[UnitConversion]] = defaultdict(list)
+        for c in conversions:
+            if c.product_id is not None:
+                overrides[c.product_id].append(c)
+        self._global = _closure(global_edges)
+        # Override edges first: on the same hop count the product's own edge wins
+        self._by_product = {
+            product_id: _closure(edges + global_edges) for product_id, edges in overrides.items()
+        }
+
+    def factor(self, from_unit_id: UUID, to_unit_id: UUID, product_id: Optional[UUID] = None) -> Optional[Decimal]:
+        """1 from_unit = factor to_unit over global (+ product override) edges, or None."""
+        if from_unit_id == to_unit_id:
+            return Decimal(1)
+        return self._by_product.get(product_id, self._global).get((from_unit_id, to_unit_id))
+
+    def to_inventory_factor(self, product: Product, unit_id: UUID) -> Optional[Decimal]:
+        """Inventory units in one unit_id of product; None when no path exists."""
+        packaging_factor = exact_factor(product.conversion_factor)
+        if unit_id == product.packaging_unit:
+            return packaging_factor
+        if unit_id == product.inventory_unit:
+            return Decimal(1)
+        pairs = self._by_product.get(product.id, self._global)
+        direct = pairs.get((unit_id, product.inventory_unit))
+        if direct is not None:
+            return direct
+        to_packaging = pairs.get((unit_id, product.packaging_unit))
+        if to_packaging is not None:
+            return to_packaging * packaging_factor
+        return None
+
+
+class UnitConversionTableCache:
+    """Current table for this process: built on first use, rebuilt after invalidate or ttl."""
+
+    def __init__(self, ttl_seconds: float = 300.0, clock: Callable[[], float] = time.monotonic):
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._table: Optional[UnitConversionTable] = None
+        self._built_at = 0.0
+        self._lock = Lock()
+
+    def get(self, load: ConversionLoader) -> UnitConversionTable:
+        with self._lock:
+            now = self._clock()
+            if self._table is None or now - self._built_at >= self._ttl:
+                self._table = UnitConversionTable(load())
+                self._built_at = now
+            return self._table
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._table = None
@@ -8,6 +8,11 @@ with UniqueConstraint(session_id, product_id). No separate session_products tabl
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+from app.application.services.session_event_publisher import (
+    PRODUCTS_ADDED,
+    SessionEvent,
+    SessionEventPublisher,
+)
 from app.domain.entities.inventory_count import InventoryCount
 from app.domain.exceptions.business_exceptions import BusinessRuleViolation, NotFoundException
 from app.domain.repositories.inventory_count_repository import InventoryCountRepository
@@ -23,10 +28,12 @@ class AddProductsToSessionUseCase:
         session_repository: InventorySessionRepository,
         count_repository: InventoryCountRepository,
         product_repository: ProductRepository,
+        event_publisher: SessionEventPublisher | None = None,
     ):
         self.session_repository = session_repository
         self.count_repository = count_repository
         self.product_repository = product_repository
+        self.event_publisher = event_publisher
 
     def execute(self, session_id: UUID, product_ids: list[UUID]) -> list[InventoryCount]:
         session = self.session_repository.get_by_id(session_id)
@@ -60,4 +67,14 @@ class AddProductsToSessionUseCase:
                 updated_at=now,
             )
             added.append(self.count_repository.save(count))
+        if added and self.event_publisher is not None:
+            self.event_publisher.publish(
+                SessionEvent(
+                    type=PRODUCTS_ADDED,
+                    session_id=session_id,
+                    # A count, not the ids: a large batch would exceed the 8000-byte NOTIFY
+                    # payload limit; clients fetch the new rows through /counts?since=
+                    data={"count": len(added)},
+                )
+            )
         return added
@@ -3,19 +3,37 @@ Close an inventory session by setting closed_at.
 
 Only open sessions can be closed. Role (ADMIN or PROCESS_LEADER) is enforced
 at the route layer; this use case validates business rules only.
+Closed sessions never change, so their totals are frozen into a snapshot
+(inventory_session_summaries) in the same transaction, aggregated after the
+session row is locked; readers of closed sessions use it instead of
+aggregating inventory_counts again.
 """
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from uuid import UUID
 
+from app.application.services.session_event_publisher import (
+    SESSION_CLOSED,
+    SessionEvent,
+    SessionEventPublisher,
+)
 from app.domain.entities.inventory_session import InventorySession
 from app.domain.exceptions.business_exceptions import BusinessRuleViolation, NotFoundException
+from app.domain.repositories.inventory_count_repository import InventoryCountRepository
 from app.domain.repositories.inventory_session_repository import InventorySessionRepository
 
 
 class CloseInventorySessionUseCase:
-    def __init__(self, session_repository: InventorySessionRepository):
+    def __init__(
+        self,
+        session_repository: InventorySessionRepository,
+        count_repository: InventoryCountRepository,
+        event_publisher: SessionEventPublisher | None = None,
+    ):
         self.session_repository = session_repository
+        self.count_repository = count_repository
+        self.event_publisher = event_publisher
 
     def execute(self, session_id: UUID) -> InventorySession:
         session = self.session_repository.get_by_id(session_id)
@@ -37,4 +55,20 @@ class CloseInventorySessionUseCase:
             created_at=session.created_at,
             closed_at=now,
         )
-        return self.session_repository.update(closed_session)
+        closed, snapshot = self.session_repository.close(
+            closed_session,
+            lambda: replace(self.count_repository.summarize_by_session(session_id), created_at=now),
+        )
+        if self.event_publisher is not None:
+            self.event_publisher.publish(
+                SessionEvent(
+                    type=SESSION_CLOSED,
+                    session_id=session_id,
+                    data={
+                        "closed_at": now.isoformat(),
+                        "total_products": snapshot.total_products,
+                        "counted_products": snapshot.counted_products,
+                    },
+                )
+            )
+        return closed
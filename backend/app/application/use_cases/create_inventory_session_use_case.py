@@ -3,14 +3,15 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from app.application.services.feature_flag_service import FeatureFlagService
-from app.domain.entities.inventory_session import InventorySession
-from app.domain.exceptions.business_exceptions import BusinessRuleViolation
+from app.domain.entities.inventory_session import MAX_SESSIONS_PER_MONTH, InventorySession
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation, ConcurrencyConflict
 from app.domain.repositories.inventory_session_repository import InventorySessionRepository
 
 # Business rules: sessions only on days 1-3 when feature flag enabled; count_number auto 1..3; max 3 per month per warehouse
 ALLOWED_SESSION_CREATION_DAYS = (1, 2, 3)
-MAX_SESSIONS_PER_MONTH = 3
 FEATURE_FLAG_INVENTORY_DATE_RESTRICTION = "ENABLE_INVENTORY_DATE_RESTRICTION"
+# Concurrent creates for the same warehouse+month may collide on uq_inventory_session; retry with a fresh count_number
+MAX_ALLOCATION_ATTEMPTS = 3
 
 
 def _normalize_month_to_first_utc(month: datetime) -> datetime:
@@ -55,27 +56,27 @@ class CreateInventorySessionUseCase:
 
         month = _normalize_month_to_first_utc(month)
 
-        existing_sessions = self.repository.list_by_warehouse(warehouse_id)
-        monthly_sessions = [
-            s for s in existing_sessions
-            if s.month.year == month.year and s.month.month == month.month
-        ]
+        for _ in range(MAX_ALLOCATION_ATTEMPTS):
+            sessions_in_month, max_count_number = self.repository.get_month_allocation(
+                warehouse_id, month
+            )
+            if sessions_in_month >= MAX_SESSIONS_PER_MONTH:
+                raise BusinessRuleViolation("Maximum 3 sessions per month per warehouse. No more counts can be created for this month.")
 
-        if len(monthly_sessions) >= MAX_SESSIONS_PER_MONTH:
-            raise BusinessRuleViolation("Maximum 3 sessions per month per warehouse. No more counts can be created for this month.")
+            new_session = InventorySession(
+                id=uuid4(),
+                warehouse_id=warehouse_id,
+                month=month,
+                count_number=max_count_number + 1,
+                created_by=created_by,
+                created_at=now_utc,
+                closed_at=None,
+            )
+            try:
+                return self.repository.save(new_session)
+            except ConcurrencyConflict:
+                continue
 
-        count_number = 1
-        if monthly_sessions:
-            count_number = max(s.count_number for s in monthly_sessions) + 1
-
-        new_session = InventorySession(
-            id=uuid4(),
-            warehouse_id=warehouse_id,
-            month=month,
-            count_number=count_number,
-            created_by=created_by,
-            created_at=now_utc,
-            closed_at=None,
+        raise BusinessRuleViolation(
+            "Another session was created for this warehouse and month at the same time. Please retry."
         )
-        return self.repository.save(new_session)
-
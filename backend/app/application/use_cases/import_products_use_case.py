@@ -0,0 +1,115 @@
+"""
+Bulk product import from CSV rows (POST /products/import).
+
+Rows are validated and upserted on code in chunks: one repository call per chunk
+instead of one commit per product. Unit abbreviations are resolved once per distinct
+value. Invalid rows are skipped and reported; they never abort the import.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, Optional
+from uuid import UUID, uuid4
+
+from app.domain.entities.product import Product
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation
+from app.domain.repositories.measurement_unit_repository import MeasurementUnitRepository
+from app.domain.repositories.product_repository import ProductRepository
+
+REQUIRED_COLUMNS = ("code", "description", "inventory_unit", "packaging_unit", "conversion_factor")
+IMPORT_CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 100
+_FALSE_VALUES = {"0", "false", "no", "n", "f"}
+
+
+@dataclass
+class ProductImportResult:
+    received: int = 0
+    inserted: int = 0
+    updated: int = 0
+    rejected: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class ImportProductsUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        unit_repository: MeasurementUnitRepository,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ):
+        self.product_repository = product_repository
+        self.unit_repository = unit_repository
+        self.chunk_size = chunk_size
+        self._unit_ids: dict[str, Optional[UUID]] = {}
+
+    def execute(self, columns: Iterable[str], rows: Iterable[dict[str, str]]) -> ProductImportResult:
+        """columns: CSV header. rows: one dict per data row (csv.DictReader)."""
+        missing = [c for c in REQUIRED_COLUMNS if c not in set(columns)]
+        if missing:
+            raise BusinessRuleViolation(f"CSV is missing columns: {', '.join(missing)}")
+
+        result = ProductImportResult()
+        for chunk in self._chunks(rows, result):
+            inserted, updated = self.product_repository.upsert_many(chunk)
+            result.inserted += inserted
+            result.updated += updated
+        return result
+
+    def _chunks(self, rows: Iterable[dict[str, str]], result: ProductImportResult) -> Iterator[list[Product]]:
+        # Keyed by code: a code repeated in one chunk keeps its last row
+        chunk: dict[str, Product] = {}
+        now = datetime.now(timezone.utc)
+        for line, row in enumerate(rows, start=2):
+            result.received += 1
+            try:
+                product = self._to_product(row, now)
+            except ValueError as e:
+                result.rejected += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(f"line {line}: {e}")
+                continue
+            chunk[product.code] = product
+            if len(chunk) >= self.chunk_size:
+                yield list(chunk.values())
+                chunk = {}
+        if chunk:
+            yield list(chunk.values())
+
+    def _to_product(self, row: dict[str, str], now: datetime) -> Product:
+        code = (row.get("code") or "").strip()
+        description = (row.get("description") or "").strip()
+        if not code or not description:
+            raise ValueError("code and description are required")
+        try:
+            factor = float((row.get("conversion_factor") or "").strip())
+        except ValueError:
+            raise ValueError("conversion_factor must be a number")
+        if not math.isfinite(factor):
+            # float() accepts "nan" and "inf"; they would only fail later, converting counts
+            raise ValueError("conversion_factor must be a finite number")
+        if factor <= 0:
+            raise ValueError("conversion_factor must be positive")
+        is_active = (row.get("is_active") or "true").strip().lower() not in _FALSE_VALUES
+        return Product(
+            id=uuid4(),
+            code=code,
+            description=description,
+            inventory_unit=self._unit_id(row.get("inventory_unit")),
+            packaging_unit=self._unit_id(row.get("packaging_unit")),
+            conversion_factor=factor,
+            is_active=is_active,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def _unit_id(self, abbreviation: Optional[str]) -> UUID:
+        abbreviation = (abbreviation or "").strip()
+        if abbreviation not in self._unit_ids:
+            unit = self.unit_repository.get_by_abbreviation(abbreviation) if abbreviation else None
+            self._unit_ids[abbreviation] = unit.id if unit else None
+        unit_id = self._unit_ids[abbreviation]
+        if unit_id is None:
+            raise ValueError(f"unknown measurement unit '{abbreviation}'")
+        return unit_id
@@ -1,8 +1,25 @@
+from app.application.use_cases.inventory.get_round_variance_use_case import (
+    GetRoundVarianceUseCase,
+)
+from app.application.use_cases.inventory.get_session_summary_use_case import (
+    GetSessionSummaryUseCase,
+)
 from app.application.use_cases.inventory.list_inventory_counts_use_case import (
     ListInventoryCountsUseCase,
 )
+from app.application.use_cases.inventory.register_inventory_count_by_code_use_case import (
+    RegisterInventoryCountByCodeUseCase,
+)
 from app.application.use_cases.inventory.register_inventory_count_use_case import (
     RegisterInventoryCountUseCase,
+    RegisteredCount,
 )
 
-__all__ = ["RegisterInventoryCountUseCase", "ListInventoryCountsUseCase"]
+__all__ = [
+    "RegisterInventoryCountUseCase",
+    "RegisteredCount",
+    "RegisterInventoryCountByCodeUseCase",
+    "ListInventoryCountsUseCase",
+    "GetSessionSummaryUseCase",
+    "GetRoundVarianceUseCase",
+]
@@ -0,0 +1,136 @@
+"""
+Cross-round variance for a warehouse-month.
+
+Each warehouse runs up to MAX_SESSIONS_PER_MONTH counts per month (count_number 1..3).
+Ops compares two rounds per product to decide recounts. The pivot of total units by
+round comes from a single SQL query (RoundVarianceQuery); differences, thresholds and
+ordering are computed with NumPy over the whole result at once.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+import numpy as np
+
+from app.application.use_cases.inventory.round_variance_query import RoundVarianceQuery
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation, NotFoundException
+from app.domain.repositories.inventory_session_repository import InventorySessionRepository
+from app.domain.repositories.warehouse_repository import WarehouseRepository
+
+VarianceSort = Literal["abs", "pct"]
+
+
+@dataclass
+class RoundVarianceItem:
+    product_id: UUID
+    code: str
+    description: str
+    units_by_round: dict[int, int | None]
+    base_units: int
+    compare_units: int
+    difference: int  # compare_units - base_units (missing in a round counts as 0)
+    difference_pct: Optional[float]  # None when base_units is 0
+
+
+@dataclass
+class RoundVarianceReport:
+    warehouse_id: UUID
+    month: datetime
+    base_round: int
+    compare_round: int
+    items: list[RoundVarianceItem]
+
+
+class GetRoundVarianceUseCase:
+    def __init__(
+        self,
+        session_repository: InventorySessionRepository,
+        warehouse_repository: WarehouseRepository,
+        variance_query: RoundVarianceQuery,
+    ):
+        self.session_repository = session_repository
+        self.warehouse_repository = warehouse_repository
+        self.variance_query = variance_query
+
+    def execute(
+        self,
+        warehouse_id: UUID,
+        month: datetime,
+        base_round: Optional[int] = None,
+        compare_round: Optional[int] = None,
+        min_abs_difference: int = 0,
+        min_pct_difference: float = 0.0,
+        sort_by: VarianceSort = "abs",
+    ) -> RoundVarianceReport:
+        if not self.warehouse_repository.get_by_id(warehouse_id):
+            raise NotFoundException("Warehouse not found")
+
+        sessions = self.session_repository.list_filtered(warehouse_id=warehouse_id, month=month)
+        rounds = sorted(s.count_number for s in sessions)
+        base_round, compare_round = self._resolve_rounds(rounds, base_round, compare_round)
+
+        rows = self.variance_query.units_by_round(warehouse_id, month)
+        base = np.fromiter(
+            (r.units_by_round.get(base_round) or 0 for r in rows), dtype=np.int64, count=len(rows)
+        )
+        compare = np.fromiter(
+            (r.units_by_round.get(compare_round) or 0 for r in rows), dtype=np.int64, count=len(rows)
+        )
+        difference = compare - base
+        abs_difference = np.abs(difference)
+        has_base = base != 0
+        safe_base = np.where(has_base, base, 1)
+        pct = np.where(has_base, difference / safe_base * 100.0, np.nan)
+        # A product appearing from zero is the largest possible relative change
+        abs_pct = np.where(has_base, np.abs(pct), np.where(difference != 0, np.inf, 0.0))
+
+        mask = (abs_difference >= min_abs_difference) & (abs_pct >= min_pct_difference)
+        selected = np.flatnonzero(mask)
+        sort_key = abs_pct if sort_by == "pct" else abs_difference
+        selected = selected[np.argsort(-sort_key[selected], kind="stable")]
+
+        items = [
+            RoundVarianceItem(
+                product_id=rows[i].product_id,
+                code=rows[i].code,
+                description=rows[i].description,
+                units_by_round=rows[i].units_by_round,
+                base_units=int(base[i]),
+                compare_units=int(compare[i]),
+                difference=int(difference[i]),
+                difference_pct=round(float(pct[i]), 2) if has_base[i] else None,
+            )
+            for i in selected
+        ]
+        return RoundVarianceReport(
+            warehouse_id=warehouse_id,
+            month=month,
+            base_round=base_round,
+            compare_round=compare_round,
+            items=items,
+        )
+
+    @staticmethod
+    def _resolve_rounds(
+        rounds: list[int], base_round: Optional[int], compare_round: Optional[int]
+    ) -> tuple[int, int]:
+        """Default: compare the latest round against the one before it."""
+        if compare_round is None:
+            if not rounds:
+                raise BusinessRuleViolation("No inventory sessions for this warehouse and month.")
+            compare_round = rounds[-1]
+        if base_round is None:
+            previous = [n for n in rounds if n < compare_round]
+            if not previous:
+                raise BusinessRuleViolation(
+                    "At least two count rounds are needed to compute variance."
+                )
+            base_round = previous[-1]
+        for n in (base_round, compare_round):
+            if n not in rounds:
+                raise BusinessRuleViolation(f"Count round {n} does not exist for this month.")
+        if base_round == compare_round:
+            raise BusinessRuleViolation("Base and compare rounds must be different.")
+        return base_round, compare_round
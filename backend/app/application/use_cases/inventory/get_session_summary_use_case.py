@@ -0,0 +1,34 @@
+"""Totals of an inventory session: frozen snapshot when closed, live aggregate while open."""
+
+from uuid import UUID
+
+from app.domain.entities.inventory_session_snapshot import InventorySessionSnapshot
+from app.domain.exceptions.business_exceptions import NotFoundException
+from app.domain.repositories.inventory_count_repository import InventoryCountRepository
+from app.domain.repositories.inventory_session_repository import InventorySessionRepository
+from app.domain.repositories.inventory_session_snapshot_repository import (
+    InventorySessionSnapshotRepository,
+)
+
+
+class GetSessionSummaryUseCase:
+    def __init__(
+        self,
+        session_repository: InventorySessionRepository,
+        count_repository: InventoryCountRepository,
+        snapshot_repository: InventorySessionSnapshotRepository,
+    ):
+        self.session_repository = session_repository
+        self.count_repository = count_repository
+        self.snapshot_repository = snapshot_repository
+
+    def execute(self, session_id: UUID) -> InventorySessionSnapshot:
+        session = self.session_repository.get_by_id(session_id)
+        if not session:
+            raise NotFoundException("Inventory session not found")
+        if session.closed_at is not None:
+            snapshot = self.snapshot_repository.get_by_session_id(session_id)
+            # Sessions closed before snapshots existed fall back to the live aggregate
+            if snapshot is not None:
+                return snapshot
+        return self.count_repository.summarize_by_session(session_id)
@@ -1,5 +1,6 @@
 """List inventory counts for a session. No warehouse restriction (ADMIN / PROCESS_LEADER)."""
 
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from app.domain.entities.inventory_count import InventoryCount
@@ -7,6 +8,22 @@ from app.domain.exceptions.business_exceptions import NotFoundException
 from app.domain.repositories.inventory_count_repository import InventoryCountRepository
 from app.domain.repositories.inventory_session_repository import InventorySessionRepository
 
+# updated_at is stamped before commit, so a slow transaction can land behind a watermark
+# already handed out. Re-reading this window costs a few rows; clients upsert by product.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def next_watermark(counts: list[InventoryCount], since: datetime | None) -> datetime | None:
+    """Latest updated_at the client has now seen; never moves backwards."""
+    stamps = [_as_utc(c.updated_at) for c in counts]
+    if since is not None:
+        stamps.append(_as_utc(since))
+    return max(stamps) if stamps else None
+
 
 class ListInventoryCountsUseCase:
     def __init__(
@@ -17,8 +34,13 @@ class ListInventoryCountsUseCase:
         self.session_repository = session_repository
         self.count_repository = count_repository
 
-    def execute(self, session_id: UUID) -> list[InventoryCount]:
+    def execute(self, session_id: UUID, since: datetime | None = None) -> list[InventoryCount]:
+        """All counts, or (with since) only those created or updated after the watermark."""
         session = self.session_repository.get_by_id(session_id)
         if not session:
             raise NotFoundException("Inventory session not found")
-        return self.count_repository.list_by_session(session_id)
+        if since is None:
+            return self.count_repository.list_by_session(session_id)
+        return self.count_repository.list_by_session_updated_since(
+            session_id, _as_utc(since) - SYNC_OVERLAP
+        )
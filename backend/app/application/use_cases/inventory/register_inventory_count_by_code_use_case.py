@@ -0,0 +1,51 @@
+"""
+Register an inventory count from a scanned product code.
+Resolves the code through ProductCodeIndex, then applies RegisterInventoryCountUseCase.
+"""
+
+from uuid import UUID
+
+from app.application.services.product_code_index import ProductCodeIndex
+from app.application.use_cases.inventory.register_inventory_count_use_case import (
+    RegisterInventoryCountUseCase,
+    RegisteredCount,
+)
+from app.domain.exceptions.business_exceptions import NotFoundException
+from app.domain.repositories.product_repository import ProductRepository
+
+
+class RegisterInventoryCountByCodeUseCase:
+    def __init__(
+        self,
+        register_use_case: RegisterInventoryCountUseCase,
+        product_repository: ProductRepository,
+        code_index: ProductCodeIndex,
+    ):
+        self.register_use_case = register_use_case
+        self.product_repository = product_repository
+        self.code_index = code_index
+
+    def execute(
+        self,
+        session_id: UUID,
+        product_code: str,
+        packaging_quantity: int,
+        user_warehouse_ids: list[UUID],
+        is_admin: bool = False,
+        measure_unit_id: UUID | None = None,
+        recount: bool = False,
+    ) -> RegisteredCount:
+        product_id = self.code_index.lookup(
+            product_code.strip(), self.product_repository.list_active_codes
+        )
+        if product_id is None:
+            raise NotFoundException("Product not found")
+        return self.register_use_case.execute(
+            session_id=session_id,
+            product_id=product_id,
+            packaging_quantity=packaging_quantity,
+            user_warehouse_ids=user_warehouse_ids,
+            is_admin=is_admin,
+            measure_unit_id=measure_unit_id,
+            recount=recount,
+        )
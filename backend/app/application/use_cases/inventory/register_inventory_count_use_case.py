@@ -1,11 +1,24 @@
 """
 Register an inventory count for a session.
 Only allowed when user is assigned to the session's warehouse.
+Fills the uncounted row AddProductsToSession created for the product, if any; counted
+products (counted_at set, including counts of 0 packages) can only be counted again with recount=True and ENABLE_INVENTORY_RECOUNT on.
+packaging_quantity is in measure_unit_id (default: the product's packaging unit). It is
+normalized to inventory units through the unit conversion table (quantity_units, exact)
+and stored as packaging units (quantity_packages, rounded for counts in other units).
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
+from app.application.services.feature_flag_service import FeatureFlagService
+from app.application.services.session_event_publisher import (
+    COUNT_REGISTERED,
+    SessionEvent,
+    SessionEventPublisher,
+)
+from app.application.services.unit_conversion_table import UnitConversionTable
 from app.domain.entities.inventory_count import InventoryCount
 from app.domain.exceptions.business_exceptions import BusinessRuleViolation, NotFoundException
 from app.domain.repositories.inventory_count_repository import InventoryCountRepository
@@ -13,6 +26,15 @@ from app.domain.repositories.inventory_session_repository import InventorySessio
 from app.domain.repositories.product_repository import ProductRepository
 from app.domain.services.unit_conversion_service import UnitConversionService
 
+FEATURE_FLAG_INVENTORY_RECOUNT = "ENABLE_INVENTORY_RECOUNT"
+
+
+@dataclass(frozen=True)
+class RegisteredCount:
+    count: InventoryCount
+    # A new row: the session gained a product (not a pre-created row filled in, not a recount)
+    created: bool
+
 
 class RegisterInventoryCountUseCase:
     def __init__(
@@ -20,10 +42,17 @@ class RegisterInventoryCountUseCase:
         session_repository: InventorySessionRepository,
         product_repository: ProductRepository,
         count_repository: InventoryCountRepository,
+        event_publisher: SessionEventPublisher | None = None,
+        feature_flag_service: FeatureFlagService | None = None,
+        conversion_table: UnitConversionTable | None = None,
     ):
         self.session_repository = session_repository
         self.product_repository = product_repository
         self.count_repository = count_repository
+        self.event_publisher = event_publisher
+        self.feature_flag_service = feature_flag_service
+        # Without a table only the product's own packaging -> inventory factor is known
+        self.conversion_table = conversion_table or UnitConversionTable()
 
     def execute(
         self,
@@ -33,7 +62,8 @@ class RegisterInventoryCountUseCase:
         user_warehouse_ids: list[UUID],
         is_admin: bool = False,
         measure_unit_id: UUID | None = None,
-    ) -> InventoryCount:
+        recount: bool = False,
+    ) -> RegisteredCount:
         session = self.session_repository.get_by_id(session_id)
         if not session:
             raise NotFoundException("Inventory session not found")
@@ -52,16 +82,30 @@ class RegisterInventoryCountUseCase:
         product = self.product_repository.get_by_id(product_id)
         if not product:
             raise NotFoundException("Product not found")
+        # The scanner code index can still resolve a code deactivated by another worker
+        if not product.is_active:
+            raise BusinessRuleViolation("Cannot register counts for an inactive product.")
 
-        if self.count_repository.exists_by_session_and_product(session_id, product_id):
-            raise BusinessRuleViolation(
-                "This product has already been counted in this session."
-            )
+        if recount and not (
+            self.feature_flag_service is not None
+            and self.feature_flag_service.is_enabled(FEATURE_FLAG_INVENTORY_RECOUNT)
+        ):
+            raise BusinessRuleViolation("Recounting products is not enabled.")
 
         unit_id = measure_unit_id if measure_unit_id is not None else product.packaging_unit
 
-        factor = int(product.conversion_factor)
+        factor = self.conversion_table.to_inventory_factor(product, unit_id)
+        if factor is None:
+            raise BusinessRuleViolation(
+                "The measure unit cannot be converted to this product's inventory unit."
+            )
         total_units = UnitConversionService.calculate_total_units(packaging_quantity, factor)
+        if unit_id == product.packaging_unit:
+            packages = packaging_quantity
+        else:
+            packages = UnitConversionService.calculate_packages(
+                packaging_quantity, factor, product.conversion_factor
+            )
 
         now = datetime.now(timezone.utc)
         count = InventoryCount(
@@ -69,9 +113,29 @@ class RegisterInventoryCountUseCase:
             session_id=session_id,
             product_id=product_id,
             measure_unit_id=unit_id,
-            quantity_packages=packaging_quantity,
+            quantity_packages=packages,
             quantity_units=total_units,
             created_at=now,
             updated_at=now,
+            counted_at=now,
         )
-        return self.count_repository.save(count)
+        saved = self.count_repository.register(count, allow_recount=recount)
+        if saved is None:
+            raise BusinessRuleViolation(
+                "This product has already been counted in this session."
+            )
+        if self.event_publisher is not None:
+            self.event_publisher.publish(
+                SessionEvent(
+                    type=COUNT_REGISTERED,
+                    session_id=session_id,
+                    data={
+                        "product_id": str(product_id),
+                        "packaging_quantity": saved.quantity_packages,
+                        "total_units": saved.quantity_units,
+                        "recount": recount,
+                    },
+                )
+            )
+        # The upsert keeps the existing row's id: our new id back means a row was inserted
+        return RegisteredCount(count=saved, created=saved.id == count.id)
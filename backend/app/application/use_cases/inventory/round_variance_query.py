@@ -0,0 +1,24 @@
+"""Port for the cross-round pivot of a warehouse-month (read model). Application layer."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class ProductRoundUnits:
+    """Total units of one product in each count round (None: not in that round)."""
+
+    product_id: UUID
+    code: str
+    description: str
+    units_by_round: dict[int, int | None]
+
+
+class RoundVarianceQuery(ABC):
+    """Returns one row per product counted in any round of the warehouse-month (single query)."""
+
+    @abstractmethod
+    def units_by_round(self, warehouse_id: UUID, month: datetime) -> list[ProductRoundUnits]:
+        pass
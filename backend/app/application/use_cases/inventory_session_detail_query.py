@@ -0,0 +1,14 @@
+"""Port for one session with its list attributes in a single read (read model). Application layer."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from app.application.use_cases.list_inventory_sessions_use_case import InventorySessionSummary
+
+
+class InventorySessionDetailQuery(ABC):
+    @abstractmethod
+    def get_summary(self, session_id: UUID) -> Optional[InventorySessionSummary]:
+        """Session joined with warehouse description, creator name and products count, or None."""
+        pass
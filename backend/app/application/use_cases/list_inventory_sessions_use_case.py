@@ -26,11 +26,13 @@ class ListInventorySessionsUseCase:
         warehouse_repository,
         count_repository,
         user_repository,
+        snapshot_repository,
     ):
         self.session_repository = session_repository
         self.warehouse_repository = warehouse_repository
         self.count_repository = count_repository
         self.user_repository = user_repository
+        self.snapshot_repository = snapshot_repository
 
     def execute(
         self,
@@ -47,12 +49,22 @@ class ListInventorySessionsUseCase:
         )
         creator_ids = list({s.created_by for s in sessions})
         creators = {u.id: u for u in self.user_repository.get_by_ids(creator_ids)}
+        closed_ids = [s.id for s in sessions if s.closed_at is not None]
+        snapshots = {
+            snap.session_id: snap
+            for snap in self.snapshot_repository.get_by_session_ids(closed_ids)
+        }
 
         result = []
         for s in sessions:
             warehouse = self.warehouse_repository.get_by_id(s.warehouse_id)
             desc = warehouse.description if warehouse else ""
-            products_count = self.count_repository.count_by_session(s.id)
+            snapshot = snapshots.get(s.id)
+            products_count = (
+                snapshot.total_products
+                if snapshot is not None
+                else self.count_repository.count_by_session(s.id)
+            )
             creator = creators.get(s.created_by)
             result.append(
                 InventorySessionSummary(
@@ -0,0 +1,6 @@
+from app.application.use_cases.reports.monthly_inventory_report_use_case import (
+    MonthlyInventoryReport,
+    MonthlyInventoryReportUseCase,
+)
+
+__all__ = ["MonthlyInventoryReport", "MonthlyInventoryReportUseCase"]
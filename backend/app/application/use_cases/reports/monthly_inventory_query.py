@@ -0,0 +1,31 @@
+"""Port for per-product totals over a set of sessions (read model). Application layer."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass
+class ProductMonthlyTotal:
+    """Totals of one product across the given sessions, in its inventory unit."""
+
+    product_id: UUID
+    code: str
+    description: str
+    inventory_unit_id: UUID
+    total_packages: int  # Every count, in packaging units (rounded for other measure units)
+    total_units: int  # Sum of quantity_units, normalized at registration
+    warehouses_count: int
+
+
+class MonthlyInventoryQuery(ABC):
+    @abstractmethod
+    def product_totals(self, session_ids: list[UUID]) -> list[ProductMonthlyTotal]:
+        """One row per product with counts in any of session_ids (GROUP BY in SQL), ordered by code."""
+        pass
+
+    @abstractmethod
+    def iter_product_totals(self, session_ids: list[UUID]) -> Iterator[ProductMonthlyTotal]:
+        """product_totals as a stream: rows are yielded while the result is fetched in batches."""
+        pass
@@ -0,0 +1,108 @@
+"""
+Monthly inventory report across all warehouses.
+
+For each warehouse the latest closed round (highest count_number with closed_at set)
+of the month is taken; product totals over those sessions are aggregated in SQL
+(MonthlyInventoryQuery). Closed sessions never change, so a report is fully
+determined by the set of sessions it covers: that set is the cache key, and
+reports are cached once the month has no open sessions left.
+
+Totals are aggregated per product from inventory_counts. The close snapshots
+(inventory_session_summaries) only keep per-session totals per inventory unit, so
+they cannot serve a per-product report and are not read here.
+"""
+
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.application.services.immutable_result_cache import ImmutableResultCache
+from app.application.use_cases.reports.monthly_inventory_query import (
+    MonthlyInventoryQuery,
+    ProductMonthlyTotal,
+)
+from app.domain.repositories.inventory_session_repository import InventorySessionRepository
+
+
+@dataclass(frozen=True)
+class ReportSessionRef:
+    warehouse_id: UUID
+    session_id: UUID
+    count_number: int
+
+
+@dataclass
+class MonthlyInventoryReport:
+    month: datetime
+    sessions: list[ReportSessionRef]
+    is_final: bool  # True when no session of the month is still open
+    items: list[ProductMonthlyTotal]
+
+
+class MonthlyInventoryReportUseCase:
+    def __init__(
+        self,
+        session_repository: InventorySessionRepository,
+        report_query: MonthlyInventoryQuery,
+        cache: Optional[ImmutableResultCache] = None,
+    ):
+        self.session_repository = session_repository
+        self.report_query = report_query
+        self.cache = cache
+
+    def execute(self, month: datetime) -> MonthlyInventoryReport:
+        sessions, is_final, cache_key = self._covered_sessions(month)
+        cached = self._cached(cache_key, is_final)
+        if cached is not None:
+            return cached
+
+        items = self.report_query.product_totals([r.session_id for r in sessions])
+        report = MonthlyInventoryReport(
+            month=month, sessions=sessions, is_final=is_final, items=items
+        )
+        if self.cache is not None and is_final:
+            self.cache.set(cache_key, report)
+        return report
+
+    def iter_items(self, month: datetime) -> Iterator[ProductMonthlyTotal]:
+        """
+        execute(month).items as a stream for exports: a cached report is replayed,
+        otherwise rows come straight from the query and are not cached.
+        """
+        sessions, is_final, cache_key = self._covered_sessions(month)
+        cached = self._cached(cache_key, is_final)
+        if cached is not None:
+            return iter(cached.items)
+        return self.report_query.iter_product_totals([r.session_id for r in sessions])
+
+    def _covered_sessions(
+        self, month: datetime
+    ) -> tuple[list[ReportSessionRef], bool, Hashable]:
+        month_sessions = self.session_repository.list_filtered(month=month)
+        latest_closed: dict[UUID, ReportSessionRef] = {}
+        for s in month_sessions:
+            if s.closed_at is None:
+                continue
+            current = latest_closed.get(s.warehouse_id)
+            if current is None or s.count_number > current.count_number:
+                latest_closed[s.warehouse_id] = ReportSessionRef(
+                    warehouse_id=s.warehouse_id,
+                    session_id=s.id,
+                    count_number=s.count_number,
+                )
+        sessions = sorted(latest_closed.values(), key=lambda r: str(r.warehouse_id))
+        is_final = all(s.closed_at is not None for s in month_sessions)
+        cache_key = (
+            "monthly_inventory",
+            month.year,
+            month.month,
+            tuple(r.session_id for r in sessions),
+        )
+        return sessions, is_final, cache_key
+
+    def _cached(self, cache_key: Hashable, is_final: bool) -> Optional[MonthlyInventoryReport]:
+        if self.cache is None or not is_final:
+            return None
+        return self.cache.get(cache_key)
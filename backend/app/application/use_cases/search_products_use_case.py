@@ -0,0 +1,19 @@
+from typing import List
+
+from app.domain.entities.product import Product
+from app.domain.repositories.product_repository import ProductRepository
+
+MAX_SEARCH_RESULTS = 50
+
+
+class SearchProductsUseCase:
+    """Typeahead over the active catalog: code prefix or description substring."""
+
+    def __init__(self, repository: ProductRepository):
+        self.repository = repository
+
+    def execute(self, query: str, limit: int = 20) -> List[Product]:
+        query = query.strip()
+        if not query:
+            return []
+        return self.repository.search_active(query, min(limit, MAX_SEARCH_RESULTS))
@@ -0,0 +1,15 @@
+from app.application.use_cases.unit_conversions.list_unit_conversions_use_case import (
+    ListUnitConversionsUseCase,
+)
+from app.application.use_cases.unit_conversions.create_unit_conversion_use_case import (
+    CreateUnitConversionUseCase,
+)
+from app.application.use_cases.unit_conversions.delete_unit_conversion_use_case import (
+    DeleteUnitConversionUseCase,
+)
+
+__all__ = [
+    "ListUnitConversionsUseCase",
+    "CreateUnitConversionUseCase",
+    "DeleteUnitConversionUseCase",
+]
@@ -0,0 +1,76 @@
+"""
+Add an edge to the unit conversion graph: 1 from_unit = factor to_unit.
+
+Global edges are rejected when the two units are already connected, so the graph has
+a single path (and factor) between any two units. A product override may differ from
+the global path but not duplicate another override, and the product's packaging ->
+inventory factor stays on the product itself (conversion_factor).
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+from app.application.services.unit_conversion_table import UnitConversionTable
+from app.domain.entities.unit_conversion import UnitConversion
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation, NotFoundException
+from app.domain.repositories.measurement_unit_repository import MeasurementUnitRepository
+from app.domain.repositories.product_repository import ProductRepository
+from app.domain.repositories.unit_conversion_repository import UnitConversionRepository
+
+
+class CreateUnitConversionUseCase:
+    def __init__(
+        self,
+        repository: UnitConversionRepository,
+        unit_repository: MeasurementUnitRepository,
+        product_repository: ProductRepository,
+    ):
+        self.repository = repository
+        self.unit_repository = unit_repository
+        self.product_repository = product_repository
+
+    def execute(
+        self,
+        from_unit_id: UUID,
+        to_unit_id: UUID,
+        factor: float,
+        product_id: Optional[UUID] = None,
+    ) -> UnitConversion:
+        if from_unit_id == to_unit_id:
+            raise BusinessRuleViolation("A conversion needs two different units.")
+        if factor <= 0:
+            raise BusinessRuleViolation("Factor must be positive.")
+        if len(self.unit_repository.get_by_ids([from_unit_id, to_unit_id])) != 2:
+            raise NotFoundException("Measurement unit not found")
+
+        existing = self.repository.list_all()
+        if product_id is None:
+            if UnitConversionTable(existing).factor(from_unit_id, to_unit_id) is not None:
+                raise BusinessRuleViolation("These units are already convertible.")
+        else:
+            product = self.product_repository.get_by_id(product_id)
+            if not product:
+                raise NotFoundException("Product not found")
+            if {from_unit_id, to_unit_id} == {product.packaging_unit, product.inventory_unit}:
+                raise BusinessRuleViolation(
+                    "Use the product's conversion factor for its packaging unit."
+                )
+            if any(
+                c.product_id == product_id and {c.from_unit_id, c.to_unit_id} == {from_unit_id, to_unit_id}
+                for c in existing
+            ):
+                raise BusinessRuleViolation("This product already has a conversion between these units.")
+
+        now = datetime.now(timezone.utc)
+        return self.repository.save(
+            UnitConversion(
+                id=uuid4(),
+                from_unit_id=from_unit_id,
+                to_unit_id=to_unit_id,
+                factor=factor,
+                product_id=product_id,
+                created_at=now,
+                updated_at=now,
+            )
+        )
@@ -0,0 +1,13 @@
+"""Delete a unit conversion edge."""
+
+from uuid import UUID
+
+from app.domain.repositories.unit_conversion_repository import UnitConversionRepository
+
+
+class DeleteUnitConversionUseCase:
+    def __init__(self, repository: UnitConversionRepository):
+        self.repository = repository
+
+    def execute(self, id: UUID) -> None:
+        self.repository.delete(id)
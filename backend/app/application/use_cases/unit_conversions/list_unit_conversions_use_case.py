@@ -0,0 +1,14 @@
+"""List unit conversion edges (global and per-product overrides)."""
+
+from typing import List
+
+from app.domain.entities.unit_conversion import UnitConversion
+from app.domain.repositories.unit_conversion_repository import UnitConversionRepository
+
+
+class ListUnitConversionsUseCase:
+    def __init__(self, repository: UnitConversionRepository):
+        self.repository = repository
+
+    def execute(self) -> List[UnitConversion]:
+        return self.repository.list_all()
@@ -3,7 +3,7 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeatureFlag:
     id: UUID
     key: str
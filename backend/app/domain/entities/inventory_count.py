@@ -3,13 +3,14 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InventoryCount:
     id: UUID
     session_id: UUID
     product_id: UUID
     measure_unit_id: UUID  # Unit in which this count was entered (packaging or inventory)
-    quantity_packages: int
-    quantity_units: int
+    quantity_packages: int  # Packaging units; rounded when entered in another unit
+    quantity_units: int  # Inventory units, fixed at registration
     created_at: datetime
     updated_at: datetime
+    counted_at: datetime | None = None  # None until counted (pre-created rows); 0 packages is a real count
@@ -2,7 +2,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID
 
-@dataclass
+# Counting rounds per warehouse and month (count_number 1..MAX_SESSIONS_PER_MONTH)
+MAX_SESSIONS_PER_MONTH = 3
+
+
+@dataclass(slots=True, frozen=True)
 class InventorySession:
     id: UUID
     warehouse_id: UUID
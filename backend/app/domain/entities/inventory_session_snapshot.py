@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class SnapshotUnitTotal:
+    inventory_unit_id: UUID
+    total_units: int
+
+
+@dataclass(slots=True, frozen=True)
+class InventorySessionSnapshot:
+    """Frozen totals of a session, written once when the session is closed."""
+    session_id: UUID
+    total_products: int
+    counted_products: int  # rows with counted_at set (uncounted rows come from AddProductsToSession)
+    uncounted_products: int
+    total_packages: int  # Every count, in packaging units (rounded for other measure units)
+    created_at: datetime
+    unit_totals: list[SnapshotUnitTotal] = field(default_factory=list)
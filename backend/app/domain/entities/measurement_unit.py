@@ -3,7 +3,7 @@ from uuid import UUID
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MeasurementUnit:
     id: UUID
     name: str
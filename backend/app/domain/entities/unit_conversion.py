@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(slots=True, frozen=True)
+class UnitConversion:
+    """1 from_unit = factor to_unit; product_id set = override for that product only."""
+
+    id: UUID
+    from_unit_id: UUID
+    to_unit_id: UUID
+    factor: float
+    product_id: Optional[UUID]
+    created_at: datetime
+    updated_at: datetime
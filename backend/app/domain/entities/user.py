@@ -4,7 +4,7 @@ from datetime import datetime
 from uuid import UUID
 from .user_role import UserRole
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     id: UUID
     identification: str
@@ -3,7 +3,7 @@ from uuid import UUID
 from datetime import datetime
 from .warehouse_status import WarehouseStatus
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Warehouse:
     id: UUID
     code: str
@@ -11,3 +11,8 @@ class BusinessRuleViolation(DomainException):
 class NotFoundException(DomainException):
     """Raised when an entity is not found"""
     pass
+
+
+class ConcurrencyConflict(DomainException):
+    """Raised when a write loses a race against a concurrent write (e.g. unique key already taken)"""
+    pass
@@ -1,18 +1,39 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from app.domain.entities.inventory_count import InventoryCount
+from app.domain.entities.inventory_session_snapshot import InventorySessionSnapshot
 
 
 class InventoryCountRepository(ABC):
     @abstractmethod
     def save(self, count: InventoryCount) -> InventoryCount:
+        """Insert the count. Raises BusinessRuleViolation when its session is closed."""
+        pass
+
+    @abstractmethod
+    def register(self, count: InventoryCount, allow_recount: bool = False) -> InventoryCount | None:
+        """
+        Insert the count, or fill the row AddProductsToSession pre-created for the product
+        while it is still uncounted (counted_at None; any row when allow_recount). A filled
+        row keeps its id, so the result has count.id only when it was inserted. Returns None
+        when the product was already counted; raises BusinessRuleViolation when the session
+        is closed (checked in the same transaction as the write).
+        """
         pass
 
     @abstractmethod
     def list_by_session(self, session_id: UUID) -> list[InventoryCount]:
         pass
 
+    @abstractmethod
+    def list_by_session_updated_since(
+        self, session_id: UUID, since: datetime
+    ) -> list[InventoryCount]:
+        """Counts of the session with updated_at after `since`, oldest change first."""
+        pass
+
     @abstractmethod
     def exists_by_session_and_product(self, session_id: UUID, product_id: UUID) -> bool:
         """Returns True if a count for this product already exists in the session."""
@@ -22,3 +43,8 @@ class InventoryCountRepository(ABC):
     def count_by_session(self, session_id: UUID) -> int:
         """Return number of count records for the session."""
         pass
+
+    @abstractmethod
+    def summarize_by_session(self, session_id: UUID) -> InventorySessionSnapshot:
+        """Aggregate the session's counts (totals, counted vs uncounted, units per inventory unit)."""
+        pass
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 from datetime import datetime
 
 from app.domain.entities.inventory_session import InventorySession
+from app.domain.entities.inventory_session_snapshot import InventorySessionSnapshot
 
 
 class InventorySessionRepository(ABC):
@@ -17,6 +18,20 @@ class InventorySessionRepository(ABC):
         """Update an existing session (e.g. set closed_at)."""
         pass
 
+    @abstractmethod
+    def close(
+        self,
+        session: InventorySession,
+        summarize: Callable[[], InventorySessionSnapshot],
+    ) -> Tuple[InventorySession, InventorySessionSnapshot]:
+        """
+        Set closed_at and persist the session snapshot in a single transaction. summarize
+        runs after the session row is locked, so the snapshot holds every count committed
+        before the close and none can be written after it. Raises BusinessRuleViolation
+        when a concurrent request closed the session first.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, session_id: UUID) -> Optional[InventorySession]:
         pass
@@ -25,6 +40,12 @@ class InventorySessionRepository(ABC):
     def list_by_warehouse(self, warehouse_id: UUID) -> List[InventorySession]:
         pass
 
+    @abstractmethod
+    def get_month_allocation(self, warehouse_id: UUID, month: datetime) -> Tuple[int, int]:
+        """Return (sessions_in_month, max_count_number) for warehouse and month (0, 0 if none).
+        Implementations lock the warehouse until the next commit so concurrent creates serialize."""
+        pass
+
     @abstractmethod
     def list_filtered(
         self,
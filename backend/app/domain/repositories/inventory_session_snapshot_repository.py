@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.entities.inventory_session_snapshot import InventorySessionSnapshot
+
+
+class InventorySessionSnapshotRepository(ABC):
+    """Read side of the close snapshots; they are written by InventorySessionRepository.close."""
+
+    @abstractmethod
+    def get_by_session_id(self, session_id: UUID) -> Optional[InventorySessionSnapshot]:
+        pass
+
+    @abstractmethod
+    def get_by_session_ids(self, session_ids: List[UUID]) -> List[InventorySessionSnapshot]:
+        """Return snapshots for the given sessions (sessions without one are omitted)."""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from app.domain.entities.product import Product
@@ -15,6 +15,17 @@ class ProductRepository(ABC):
         """Return all active products (for selection/autocomplete)."""
         pass
 
+    @abstractmethod
+    def search_active(self, query: str, limit: int) -> List[Product]:
+        """Active products whose code starts with query or whose description contains it;
+        code prefix matches first."""
+        pass
+
+    @abstractmethod
+    def list_active_codes(self) -> Dict[str, UUID]:
+        """Return code -> id for all active products (scanner code index)."""
+        pass
+
     @abstractmethod
     def count(self) -> int:
         """Return total number of products (e.g. to check if table is empty)."""
@@ -23,3 +34,9 @@ class ProductRepository(ABC):
     @abstractmethod
     def save(self, product: Product) -> Product:
         pass
+
+    @abstractmethod
+    def upsert_many(self, products: List[Product]) -> Tuple[int, int]:
+        """Insert or update (matched on code) in one transaction; returns (inserted, updated).
+        Existing rows keep their id and created_at. Codes must be unique within the batch."""
+        pass
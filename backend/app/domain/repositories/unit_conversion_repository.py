@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.entities.unit_conversion import UnitConversion
+
+
+class UnitConversionRepository(ABC):
+    @abstractmethod
+    def list_all(self) -> List[UnitConversion]:
+        """Return every conversion edge, global and per product."""
+        pass
+
+    @abstractmethod
+    def get_by_id(self, id: UUID) -> Optional[UnitConversion]:
+        """Return conversion by id or None."""
+        pass
+
+    @abstractmethod
+    def save(self, conversion: UnitConversion) -> UnitConversion:
+        """Create a new conversion edge."""
+        pass
+
+    @abstractmethod
+    def delete(self, id: UUID) -> None:
+        """Delete a conversion edge."""
+        pass
@@ -1,10 +1,60 @@
-"""Domain service for unit conversion (packaging to total units)."""
+"""
+Domain service for unit conversion (packaging to total units).
+
+Conversion factors are stored as floats but entered as decimals (2.5, 0.333, 1.15);
+multiplying the float directly gives 10 * 1.15 = 11.499999999999998. Factors are
+therefore read as their shortest decimal representation and fixed to FACTOR_DECIMALS
+places, so quantity * factor is computed exactly in integers. Counted units are whole:
+the exact product is rounded half up.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Sequence, Union
+
+import numpy as np
+
+FACTOR_DECIMALS = 6
+FACTOR_SCALE = 10**FACTOR_DECIMALS
+
+ArrayLike = Union[Sequence[int], Sequence[float], np.ndarray]
+
+
+def exact_factor(factor: Union[float, Decimal]) -> Decimal:
+    # str() gives the shortest repr that round-trips, i.e. the decimal that was entered
+    return Decimal(str(factor)).quantize(Decimal(1).scaleb(-FACTOR_DECIMALS), ROUND_HALF_UP)
 
 
 class UnitConversionService:
     """Calculates total units from packaging quantity and factor."""
 
     @staticmethod
-    def calculate_total_units(packaging_quantity: int, factor: int) -> int:
-        """Total units = packaging_quantity * factor."""
-        return packaging_quantity * factor
+    def calculate_total_units(packaging_quantity: int, factor: Union[float, Decimal]) -> int:
+        """Total units = packaging_quantity * factor, rounded half up to a whole unit."""
+        return int((packaging_quantity * exact_factor(factor)).to_integral_value(ROUND_HALF_UP))
+
+    @staticmethod
+    def calculate_packages(quantity: int, unit_factor: Decimal, packaging_factor: Union[float, Decimal]) -> int:
+        """Packaging units in quantity of a unit worth unit_factor inventory units, rounded half up."""
+        per_package = exact_factor(packaging_factor)
+        if not per_package:
+            return 0
+        return int((quantity * unit_factor / per_package).to_integral_value(ROUND_HALF_UP))
+
+    @staticmethod
+    def scaled_factors(factors: ArrayLike) -> np.ndarray:
+        """Factors as int64 multiples of 1 / FACTOR_SCALE; Decimal only once per distinct value."""
+        values = np.asarray(factors, dtype=np.float64)
+        distinct, inverse = np.unique(values, return_inverse=True)
+        scaled = np.fromiter(
+            (int(exact_factor(f) * FACTOR_SCALE) for f in distinct.tolist()),
+            dtype=np.int64,
+            count=distinct.size,
+        )
+        return scaled[inverse].reshape(values.shape)
+
+    @staticmethod
+    def calculate_total_units_batch(packaging_quantities: ArrayLike, factors: ArrayLike) -> np.ndarray:
+        """calculate_total_units for whole arrays in one vectorized call (int64)."""
+        exact = np.asarray(packaging_quantities, dtype=np.int64) * UnitConversionService.scaled_factors(factors)
+        # Half up, also for negative quantities (like Decimal ROUND_HALF_UP: away from zero)
+        return np.sign(exact) * ((np.abs(exact) + FACTOR_SCALE // 2) // FACTOR_SCALE)
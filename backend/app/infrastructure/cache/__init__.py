@@ -0,0 +1,62 @@
+"""
+Shared cache for the API: get_cache(namespace) returns a cache-aside Cache.
+
+CACHE_BACKEND=memory (default) keeps an LRU per process (CACHE_MAX_ENTRIES entries);
+use redis (CACHE_REDIS_URL, needs the redis package) when several workers or replicas
+must see the same entries and invalidations.
+"""
+
+import os
+import threading
+
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.cache.cache import Cache, CacheMetrics
+from app.infrastructure.cache.memory_backend import DEFAULT_MAX_ENTRIES, InMemoryCacheBackend
+from app.infrastructure.cache.redis_backend import RedisCacheBackend
+
+_backend: CacheBackend | None = None
+_caches: dict[str, Cache] = {}
+_lock = threading.Lock()
+
+
+def _create_backend() -> CacheBackend:
+    backend = (os.getenv("CACHE_BACKEND") or "memory").strip().lower()
+    if backend == "redis":
+        import redis
+
+        url = os.getenv("CACHE_REDIS_URL") or "redis://localhost:6379/0"
+        return RedisCacheBackend(redis.Redis.from_url(url, socket_timeout=0.5))
+    max_entries = int(os.getenv("CACHE_MAX_ENTRIES") or DEFAULT_MAX_ENTRIES)
+    return InMemoryCacheBackend(max_entries=max_entries)
+
+
+def get_cache(namespace: str, default_ttl_seconds: float | None = None) -> Cache:
+    """Process-wide Cache for namespace; all namespaces share one backend."""
+    global _backend
+    cache = _caches.get(namespace)
+    if cache is None:
+        with _lock:
+            if _backend is None:
+                _backend = _create_backend()
+            cache = _caches.get(namespace)
+            if cache is None:
+                cache = _caches[namespace] = Cache(_backend, namespace, default_ttl_seconds)
+    return cache
+
+
+def cache_metrics() -> dict[str, CacheMetrics]:
+    """Hit/miss counters of every namespace created in this process."""
+    with _lock:
+        caches = list(_caches.values())
+    return {c.namespace: c.metrics() for c in caches}
+
+
+__all__ = [
+    "Cache",
+    "CacheBackend",
+    "CacheMetrics",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "cache_metrics",
+    "get_cache",
+]
@@ -0,0 +1,31 @@
+"""
+Storage interface behind Cache: plain key/value with TTL and tags.
+
+A tag names a group of entries (e.g. one warehouse's session list) so they can be
+dropped together when the underlying data changes. Backends do no locking beyond
+their own consistency; single-flight loading and metrics live in Cache.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Optional
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Stored value, or None when missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float], tags: Iterable[str] = ()) -> None:
+        """Store value (never None) for ttl_seconds (None: until evicted), under tags."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete every entry stored under any of tags; returns how many were dropped."""
+        pass
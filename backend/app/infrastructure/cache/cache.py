@@ -0,0 +1,143 @@
+"""
+Cache-aside front end over a CacheBackend, one instance per namespace.
+
+get_or_load() returns the cached value or runs the loader and stores its result.
+Concurrent misses on the same key in this process share one load (single flight):
+the first caller loads, the others wait for its result instead of each hitting the
+database. Backend failures (e.g. Redis unreachable) count as misses and are logged;
+a cache problem never fails the request. None is never cached.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.logging.logger import logger
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    coalesced: int = 0  # misses served by another caller's in-flight load
+    load_errors: int = 0
+    backend_errors: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class Cache:
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str,
+        default_ttl_seconds: Optional[float] = None,
+    ):
+        self._backend = backend
+        self._namespace = namespace
+        self._default_ttl = default_ttl_seconds
+        self._metrics = CacheMetrics()
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._backend_call("get", self._backend.get, self._key(key))
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def set(
+        self, key: str, value: Any, ttl_seconds: Optional[float] = None, tags: Iterable[str] = ()
+    ) -> None:
+        if value is None:
+            return
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        self._backend_call(
+            "set", self._backend.set, self._key(key), value, ttl, [self._key(t) for t in tags]
+        )
+
+    def delete(self, key: str) -> None:
+        self._backend_call("delete", self._backend.delete, self._key(key))
+
+    def invalidate_tags(self, *tags: str) -> int:
+        dropped = self._backend_call(
+            "invalidate_tags", self._backend.invalidate_tags, [self._key(t) for t in tags]
+        )
+        return dropped or 0
+
+    def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], T],
+        ttl_seconds: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> T:
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        assert flight is not None
+        if not leader:
+            self._count("coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+        try:
+            self._count("loads")
+            flight.value = load()
+            self.set(key, flight.value, ttl_seconds, tags)
+            return flight.value
+        except BaseException as e:
+            self._count("load_errors")
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def metrics(self) -> CacheMetrics:
+        """Snapshot of this namespace's counters since startup."""
+        with self._lock:
+            return CacheMetrics(**vars(self._metrics))
+
+    def _key(self, key: str) -> str:
+        return f"{self._namespace}:{key}"
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self._metrics, field, getattr(self._metrics, field) + 1)
+
+    def _backend_call(self, operation: str, fn: Callable[..., Any], *args: Any) -> Any:
+        try:
+            return fn(*args)
+        except Exception:
+            self._count("backend_errors")
+            logger.warning(
+                "Cache backend error",
+                exc_info=True,
+                extra={"event": "cache_backend_error", "namespace": self._namespace, "operation": operation},
+            )
+            return None
@@ -0,0 +1,77 @@
+"""
+In-process LRU backend: the default, and the only one needed with a single worker.
+
+Entries expire lazily (checked on read) and the least recently used entry is evicted
+once max_entries is reached. A tag -> keys index makes invalidate_tags proportional to
+the entries it drops.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Iterable, Optional
+
+from app.infrastructure.cache.backend import CacheBackend
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_entries = max_entries
+        self._clock = clock
+        # key -> (expires_at, value, tags)
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self._clock():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float], tags: Iterable[str] = ()) -> None:
+        expires_at = self._clock() + ttl_seconds if ttl_seconds is not None else float("inf")
+        tags = tuple(tags)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set().union(*(self._keys_by_tag.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
@@ -0,0 +1,63 @@
+"""
+Redis backend: one cache shared by every worker and replica (CACHE_BACKEND=redis).
+
+Takes any client with the redis-py interface (redis.Redis, or a fake in tests).
+Values are pickled: the cache only holds data this application wrote itself. Each
+tag is a Redis set of the keys stored under it; invalidating a tag deletes those keys
+and the set in one round trip. Tag sets outlive their entries by at most their own
+TTL, so members that expired on their own are harmless and eventually dropped.
+"""
+
+import pickle
+from typing import Any, Iterable, Optional
+
+from app.infrastructure.cache.backend import CacheBackend
+
+DEFAULT_KEY_PREFIX = "soberana:cache:"
+TAG_SET_MIN_TTL_SECONDS = 24 * 60 * 60
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, client: Any, key_prefix: str = DEFAULT_KEY_PREFIX):
+        self._client = client
+        self._prefix = key_prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self._key(key))
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float], tags: Iterable[str] = ()) -> None:
+        full_key = self._key(key)
+        pipe = self._client.pipeline()
+        px = max(int(ttl_seconds * 1000), 1) if ttl_seconds is not None else None
+        pipe.set(full_key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), px=px)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, full_key)
+            if ttl_seconds is not None:
+                pipe.expire(tag_key, max(int(ttl_seconds) + 1, TAG_SET_MIN_TTL_SECONDS))
+        pipe.execute()
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._key(key))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return 0
+        pipe = self._client.pipeline()
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        keys = set().union(*pipe.execute())
+        pipe = self._client.pipeline()
+        if keys:
+            pipe.delete(*keys)
+        pipe.delete(*tag_keys)
+        results = pipe.execute()
+        return int(results[0]) if keys else 0
+
+    def _key(self, key: str) -> str:
+        return self._prefix + key
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self._prefix}tag:{tag}"
@@ -0,0 +1,73 @@
+"""
+Process-wide catalog caches: product code index and unit conversion table.
+
+Every ORM insert, update or delete of a product (or unit conversion) in this process
+invalidates the matching cache once its transaction commits; bulk Core writes to
+products must call get_product_code_index().invalidate() themselves.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction, object_session
+
+from app.application.services.product_code_index import ProductCodeIndex
+from app.application.services.unit_conversion_table import (
+    UnitConversionTable,
+    UnitConversionTableCache,
+)
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.models.unit_conversion_model import UnitConversionModel
+from app.infrastructure.repositories.unit_conversion_repository_impl import (
+    UnitConversionRepositoryImpl,
+)
+
+_product_code_index = ProductCodeIndex()
+_unit_conversion_tables = UnitConversionTableCache()
+
+
+def get_product_code_index() -> ProductCodeIndex:
+    return _product_code_index
+
+
+def get_unit_conversion_table(db: Session) -> UnitConversionTable:
+    """Current conversion table; db is only queried when the table has to be rebuilt."""
+    return _unit_conversion_tables.get(UnitConversionRepositoryImpl(db).list_all)
+
+
+# Session.info key: caches whose rows this session flushed and has not committed yet
+_DIRTY_CACHES = "catalog_caches_dirty"
+
+
+def _marks(cache):
+    def mark_dirty(mapper, connection, target) -> None:
+        # Flushed is not committed: invalidating now lets a concurrent reload cache the
+        # old rows for a whole TTL, so only remember the cache until after_commit
+        object_session(target).info.setdefault(_DIRTY_CACHES, set()).add(cache)
+
+    return mark_dirty
+
+
+def _invalidate_committed(session: Session) -> None:
+    if session.in_nested_transaction():
+        return  # A released savepoint: the outer transaction can still roll back
+    for cache in session.info.pop(_DIRTY_CACHES, ()):
+        cache.invalidate()
+
+
+def _forget_uncommitted(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:  # Rolled back (a commit already popped the marks)
+        session.info.pop(_DIRTY_CACHES, None)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(ProductModel, _event_name, _marks(_product_code_index))
+    event.listen(UnitConversionModel, _event_name, _marks(_unit_conversion_tables))
+event.listen(Session, "after_commit", _invalidate_committed)
+event.listen(Session, "after_transaction_end", _forget_uncommitted)
+
+
+__all__ = [
+    "ProductCodeIndex",
+    "UnitConversionTable",
+    "get_product_code_index",
+    "get_unit_conversion_table",
+]
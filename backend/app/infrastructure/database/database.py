@@ -1,7 +1,7 @@
 import os
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 
 
 def utc_now() -> datetime:
@@ -33,7 +33,24 @@ class GUID(TypeDecorator):
             return None
         return uuid.UUID(value)
 
-engine = create_engine(DATABASE_URL, echo=True)
+# Pool capacity (size + overflow) is also the default in-flight limit of AdmissionMiddleware
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE") or 5)
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW") or 10)
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS") or 30)
+DB_POOL_CAPACITY = DB_POOL_SIZE + DB_MAX_OVERFLOW
+
+_url = make_url(DATABASE_URL)
+# In-memory SQLite uses SingletonThreadPool, which takes no overflow/timeout
+_pool_args = (
+    {}
+    if _url.get_backend_name() == "sqlite" and _url.database in (None, "", ":memory:")
+    else {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+    }
+)
+engine = create_engine(DATABASE_URL, echo=True, **_pool_args)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -0,0 +1,68 @@
+"""
+SQLite side of GET /products/search.
+
+Postgres gets pg_trgm and expression indexes from a migration; SQLite databases here are
+built with create_all, so the FTS5 table (trigram tokenizer: substring MATCH on
+description) and the triggers that keep it in sync are created with the products table
+and ensured again at startup for databases created before them.
+
+The FTS table indexes products.rowid, which VACUUM may renumber (products has a UUID
+primary key), so startup also rebuilds it: a few tens of ms for ~10k products.
+"""
+
+from sqlalchemy import Connection, Engine, text
+
+from app.infrastructure.logging.logger import logger
+
+SQLITE_FTS_TABLE = "products_fts"
+
+_SQLITE_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        description, content='products', content_rowid='rowid', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, description) VALUES (new.rowid, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, description)
+        VALUES ('delete', old.rowid, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF description ON products BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, description)
+        VALUES ('delete', old.rowid, old.description);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, description) VALUES (new.rowid, new.description);
+    END
+    """,
+)
+
+
+def create_product_search_index(connection: Connection) -> None:
+    """Create (if missing) and rebuild the SQLite FTS index; no-op on other databases."""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in _SQLITE_DDL:
+        connection.execute(text(statement))
+    connection.execute(
+        text(f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')")
+    )
+
+
+def ensure_product_search_index(engine: Engine) -> None:
+    """Startup hook for existing SQLite databases; failures are logged, not raised."""
+    if engine.dialect.name != "sqlite":
+        return
+    try:
+        with engine.begin() as connection:
+            create_product_search_index(connection)
+    except Exception:
+        logger.exception(
+            "Product search index could not be created",
+            extra={"event": "product_search_index_failed"},
+        )
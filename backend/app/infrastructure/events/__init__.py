@@ -0,0 +1,43 @@
+"""
+Session event broker selection.
+
+SESSION_EVENTS_BACKEND=memory (default) fans out within one process; use postgres
+(LISTEN/NOTIFY on DATABASE_URL) when the API runs with several workers or replicas.
+"""
+
+import os
+import threading
+
+from app.infrastructure.events.in_process_broker import (
+    InProcessSessionEventBroker,
+    SessionEventSubscription,
+)
+
+_broker: InProcessSessionEventBroker | None = None
+_broker_lock = threading.Lock()
+
+
+def get_session_event_broker() -> InProcessSessionEventBroker:
+    """Process-wide broker, created on first use."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                backend = (os.getenv("SESSION_EVENTS_BACKEND") or "memory").strip().lower()
+                if backend == "postgres":
+                    from app.infrastructure.database.database import DATABASE_URL
+                    from app.infrastructure.events.postgres_notify_broker import (
+                        PostgresNotifySessionEventBroker,
+                    )
+
+                    _broker = PostgresNotifySessionEventBroker(DATABASE_URL)
+                else:
+                    _broker = InProcessSessionEventBroker()
+    return _broker
+
+
+__all__ = [
+    "InProcessSessionEventBroker",
+    "SessionEventSubscription",
+    "get_session_event_broker",
+]
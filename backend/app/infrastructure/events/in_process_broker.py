@@ -0,0 +1,76 @@
+"""
+In-process fan-out of session events to SSE subscribers.
+
+Use cases run in the threadpool (sync routes) while subscribers live on the event loop,
+so delivery goes through loop.call_soon_threadsafe. Each subscriber has a bounded queue;
+a slow client loses its oldest events rather than growing memory without limit.
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+from uuid import UUID
+
+from app.application.services.session_event_publisher import (
+    SessionEvent,
+    SessionEventPublisher,
+)
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class SessionEventSubscription:
+    """One SSE client listening to one session. Create it from the event loop."""
+
+    def __init__(self, session_id: UUID, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.session_id = session_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[SessionEvent] = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, event: SessionEvent) -> None:
+        """Runs on the subscriber's loop."""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self) -> SessionEvent:
+        return await self.queue.get()
+
+
+class InProcessSessionEventBroker(SessionEventPublisher):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: dict[UUID, set[SessionEventSubscription]] = defaultdict(set)
+
+    def subscribe(self, session_id: UUID) -> SessionEventSubscription:
+        subscription = SessionEventSubscription(session_id)
+        with self._lock:
+            self._subscriptions[session_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: SessionEventSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.session_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[subscription.session_id]
+
+    def subscriber_count(self, session_id: UUID) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(session_id, ()))
+
+    def publish(self, event: SessionEvent) -> None:
+        self.dispatch(event)
+
+    def dispatch(self, event: SessionEvent) -> None:
+        """Deliver to local subscribers; safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscriptions.get(event.session_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # Loop already closed (shutdown); the subscription goes away with it
+                self.unsubscribe(subscription)
@@ -0,0 +1,84 @@
+"""
+Session events across workers via Postgres LISTEN/NOTIFY.
+
+publish() sends NOTIFY on the shared channel; a daemon thread in every worker LISTENs
+and hands each notification to the in-process fan-out. Events a worker publishes come
+back through its own listener, so local subscribers are never served twice.
+"""
+
+import json
+import select
+import threading
+import time
+
+import psycopg2
+from sqlalchemy import create_engine, make_url, text
+
+from app.application.services.session_event_publisher import SessionEvent
+from app.infrastructure.events.in_process_broker import InProcessSessionEventBroker
+from app.infrastructure.logging.logger import logger
+
+NOTIFY_CHANNEL = "inventory_session_events"
+LISTEN_POLL_SECONDS = 5.0
+RECONNECT_DELAY_SECONDS = 2.0
+
+
+class PostgresNotifySessionEventBroker(InProcessSessionEventBroker):
+    def __init__(self, database_url: str):
+        super().__init__()
+        url = make_url(database_url)
+        self._dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        self._engine = create_engine(url, pool_size=2, max_overflow=2)
+        self._listener = threading.Thread(
+            target=self._listen_forever, name="session-events-listener", daemon=True
+        )
+        self._listener.start()
+
+    def publish(self, event: SessionEvent) -> None:
+        try:
+            with self._engine.connect() as conn:
+                conn.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": NOTIFY_CHANNEL, "payload": json.dumps(event.to_dict())},
+                )
+                conn.commit()
+        except Exception:
+            logger.exception(
+                "Session event NOTIFY failed",
+                extra={"event": "session_event_notify_failed", "session_id": str(event.session_id)},
+            )
+
+    def _listen_forever(self) -> None:
+        while True:
+            try:
+                self._listen()
+            except Exception:
+                logger.exception(
+                    "Session event listener disconnected",
+                    extra={"event": "session_event_listener_disconnected"},
+                )
+                time.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _listen(self) -> None:
+        conn = psycopg2.connect(self._dsn)
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            logger.info(
+                "Session event listener connected",
+                extra={"event": "session_event_listener_connected"},
+            )
+            while True:
+                if select.select([conn], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notification = conn.notifies.pop(0)
+                    try:
+                        event = SessionEvent.from_dict(json.loads(notification.payload))
+                    except (ValueError, KeyError):
+                        continue
+                    self.dispatch(event)
+        finally:
+            conn.close()
@@ -0,0 +1,3 @@
+from app.infrastructure.export.parquet_export import export_closed_sessions
+
+__all__ = ["export_closed_sessions"]
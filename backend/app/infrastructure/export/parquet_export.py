@@ -0,0 +1,245 @@
+"""
+Incremental Parquet export of closed inventory sessions (analyst history).
+
+Each closed session becomes one file under a Hive-style partition:
+    <output>/period=YYYY-MM/warehouse=<code>/session-<session_id>.parquet
+Counts are joined with session, warehouse, product and unit attributes and read
+through a streaming cursor (yield_per), so only one record batch is in memory at a
+time. Closed sessions never change: a manifest in the output directory records what
+was exported and the latest closed_at seen, and later runs only query sessions closed
+after that watermark. Each exported session is appended to a log that the end of the
+run folds into the manifest, so an interrupted run resumes where it stopped.
+
+Usage (from backend/):
+    python -m app.infrastructure.export.parquet_export [--output DIR] [--batch-rows N]
+"""
+
+import argparse
+import json
+import os
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+
+from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.logging.logger import logger
+from app.infrastructure.models.inventory_count_model import InventoryCountModel
+from app.infrastructure.models.inventory_session_model import InventorySessionModel
+from app.infrastructure.models.measurement_unit_model import MeasurementUnitModel
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.models.warehouse_model import WarehouseModel
+
+DEFAULT_OUTPUT_DIR = os.getenv("PARQUET_EXPORT_DIR") or "./exports/parquet"
+DEFAULT_BATCH_ROWS = 10_000
+MANIFEST_FILE = "_manifest.json"
+MANIFEST_LOG_FILE = "_manifest.log"
+# closed_at is stamped before the close commits, so a session can land just behind the
+# watermark of a run in between. Re-reading this window costs a few sessions, skipped by id
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+EXPORT_SCHEMA = pa.schema(
+    [
+        ("session_id", pa.string()),
+        ("month", pa.date32()),
+        ("count_number", pa.int16()),
+        ("closed_at", pa.timestamp("us")),
+        ("warehouse_id", pa.string()),
+        ("warehouse_code", pa.string()),
+        ("warehouse_description", pa.string()),
+        ("product_id", pa.string()),
+        ("product_code", pa.string()),
+        ("product_description", pa.string()),
+        ("inventory_unit", pa.string()),
+        ("packaging_unit", pa.string()),
+        ("measure_unit", pa.string()),
+        ("conversion_factor", pa.float64()),
+        ("quantity_packages", pa.int64()),
+        ("quantity_units", pa.int64()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+    ]
+)
+
+
+def _latest(stamps: Iterable[str | None]) -> str | None:
+    parsed = [datetime.fromisoformat(s) for s in stamps if s is not None]
+    return max(parsed).isoformat() if parsed else None
+
+
+def _record(manifest: dict[str, Any], session_id: str, entry: dict[str, Any]) -> None:
+    manifest["sessions"][session_id] = entry
+    manifest["closed_at_watermark"] = _latest([manifest["closed_at_watermark"], entry["closed_at"]])
+
+
+def _load_manifest(output_dir: Path) -> dict[str, Any]:
+    path = output_dir / MANIFEST_FILE
+    manifest = json.loads(path.read_text()) if path.exists() else {"sessions": {}}
+    if "closed_at_watermark" not in manifest:  # Manifests written before the watermark
+        manifest["closed_at_watermark"] = _latest(
+            e["closed_at"] for e in manifest["sessions"].values()
+        )
+    log = output_dir / MANIFEST_LOG_FILE
+    if log.exists():
+        for line in log.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn last line of an interrupted run: that session is exported again
+            _record(manifest, entry.pop("session_id"), entry)
+    return manifest
+
+
+def _save_manifest(output_dir: Path, manifest: dict[str, Any]) -> None:
+    tmp = output_dir / f"{MANIFEST_FILE}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(tmp, output_dir / MANIFEST_FILE)
+
+
+def _session_rows_statement(session_id):
+    inventory_unit = aliased(MeasurementUnitModel)
+    packaging_unit = aliased(MeasurementUnitModel)
+    measure_unit = aliased(MeasurementUnitModel)
+    return (
+        select(
+            InventorySessionModel.id,
+            InventorySessionModel.month,
+            InventorySessionModel.count_number,
+            InventorySessionModel.closed_at,
+            WarehouseModel.id,
+            WarehouseModel.code,
+            WarehouseModel.description,
+            ProductModel.id,
+            ProductModel.code,
+            ProductModel.description,
+            inventory_unit.abbreviation,
+            packaging_unit.abbreviation,
+            measure_unit.abbreviation,
+            ProductModel.conversion_factor,
+            InventoryCountModel.quantity_packages,
+            InventoryCountModel.quantity_units,
+            InventoryCountModel.created_at,
+            InventoryCountModel.updated_at,
+        )
+        .join(InventorySessionModel, InventorySessionModel.id == InventoryCountModel.session_id)
+        .join(WarehouseModel, WarehouseModel.id == InventorySessionModel.warehouse_id)
+        .join(ProductModel, ProductModel.id == InventoryCountModel.product_id)
+        .join(inventory_unit, inventory_unit.id == ProductModel.inventory_unit_id)
+        .join(packaging_unit, packaging_unit.id == ProductModel.packaging_unit_id)
+        .join(measure_unit, measure_unit.id == InventoryCountModel.measure_unit_id)
+        .where(InventoryCountModel.session_id == session_id)
+        .order_by(ProductModel.code)
+    )
+
+
+def _to_record_batch(rows) -> pa.RecordBatch:
+    columns = list(zip(*rows))
+    values: list[Any] = []
+    for name, column in zip(EXPORT_SCHEMA.names, columns):
+        if name.endswith("_id"):
+            column = [str(v) for v in column]
+        elif name == "month":
+            column = [v.date() for v in column]
+        values.append(column)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(v, type=EXPORT_SCHEMA.field(i).type) for i, v in enumerate(values)],
+        schema=EXPORT_SCHEMA,
+    )
+
+
+def _export_session(db: Session, session: InventorySessionModel, warehouse_code: str,
+                    output_dir: Path, batch_rows: int) -> tuple[str, int]:
+    partition = output_dir / f"period={session.month:%Y-%m}" / f"warehouse={warehouse_code}"
+    partition.mkdir(parents=True, exist_ok=True)
+    target = partition / f"session-{session.id}.parquet"
+    tmp = target.with_suffix(".parquet.tmp")
+    rows_written = 0
+    # yield_per streams the result (server-side cursor on Postgres) in batch_rows chunks
+    result = db.execute(
+        _session_rows_statement(session.id).execution_options(yield_per=batch_rows)
+    )
+    with pq.ParquetWriter(tmp, EXPORT_SCHEMA, compression="zstd") as writer:
+        for chunk in result.partitions():
+            writer.write_batch(_to_record_batch(chunk))
+            rows_written += len(chunk)
+    os.replace(tmp, target)
+    return str(target.relative_to(output_dir)), rows_written
+
+
+def export_closed_sessions(
+    output_dir: str = DEFAULT_OUTPUT_DIR,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    db: Session | None = None,
+) -> dict[str, int]:
+    """Export closed sessions not yet in the manifest. Returns sessions/rows exported."""
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    manifest = _load_manifest(out)
+    exported = manifest["sessions"]
+    log_path = out / MANIFEST_LOG_FILE
+
+    own_session = db is None
+    db = db or SessionLocal()
+    sessions_exported = 0
+    rows_exported = 0
+    try:
+        stmt = (
+            select(InventorySessionModel, WarehouseModel.code)
+            .join(WarehouseModel, WarehouseModel.id == InventorySessionModel.warehouse_id)
+            .where(InventorySessionModel.closed_at.isnot(None))
+            .order_by(InventorySessionModel.closed_at)
+        )
+        watermark = manifest["closed_at_watermark"]
+        if watermark is not None:
+            stmt = stmt.where(
+                InventorySessionModel.closed_at
+                >= datetime.fromisoformat(watermark) - WATERMARK_OVERLAP
+            )
+        pending = db.execute(stmt).all()
+        with log_path.open("a") as log:
+            for session, warehouse_code in pending:
+                if str(session.id) in exported:
+                    continue
+                path, rows = _export_session(db, session, warehouse_code, out, batch_rows)
+                entry = {"path": path, "rows": rows, "closed_at": session.closed_at.isoformat()}
+                # One appended line per session; the manifest is rewritten once per run
+                log.write(json.dumps({"session_id": str(session.id), **entry}) + "\n")
+                log.flush()
+                _record(manifest, str(session.id), entry)
+                sessions_exported += 1
+                rows_exported += rows
+        _save_manifest(out, manifest)
+        log_path.unlink()
+    finally:
+        if own_session:
+            db.close()
+
+    logger.info(
+        "Parquet export completed",
+        extra={
+            "event": "parquet_export_completed",
+            "output_dir": str(out),
+            "sessions_exported": sessions_exported,
+            "rows_exported": rows_exported,
+        },
+    )
+    return {"sessions_exported": sessions_exported, "rows_exported": rows_exported}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export closed inventory sessions to Parquet.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_DIR, help="Output directory")
+    parser.add_argument("--batch-rows", type=int, default=DEFAULT_BATCH_ROWS,
+                        help="Rows per record batch / cursor fetch")
+    args = parser.parse_args()
+    result = export_closed_sessions(args.output, args.batch_rows)
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Idempotency key store for count submissions.
+
+Keys live in process memory for IDEMPOTENCY_TTL_SECONDS (default 24 h): with several
+workers, a replay routed to another worker runs normally and is rejected by the usual
+business rules instead of being answered from the store.
+"""
+
+import os
+import threading
+
+from app.infrastructure.idempotency.in_memory_store import (
+    DEFAULT_TTL_SECONDS,
+    InMemoryIdempotencyStore,
+)
+
+_store: InMemoryIdempotencyStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_idempotency_store() -> InMemoryIdempotencyStore:
+    """Process-wide store, created on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                ttl = float(os.getenv("IDEMPOTENCY_TTL_SECONDS") or DEFAULT_TTL_SECONDS)
+                _store = InMemoryIdempotencyStore(ttl_seconds=ttl)
+    return _store
+
+
+__all__ = ["InMemoryIdempotencyStore", "get_idempotency_store"]
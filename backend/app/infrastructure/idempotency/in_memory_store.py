@@ -0,0 +1,70 @@
+"""
+Per-process idempotency key store with TTL eviction.
+
+Every entry gets the same TTL, so insertion order is also expiry order: expired entries
+are popped from the front of an OrderedDict on each call, and max_entries bounds memory
+if a burst of distinct keys arrives within one TTL. Entries keep only a 16-byte payload
+digest and the serialized response body.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+
+from app.application.services.idempotency_store import (
+    IdempotencyRecord,
+    IdempotencyStore,
+    StoredResponse,
+)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 50_000
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, IdempotencyRecord]] = OrderedDict()
+        self._lock = Lock()
+
+    def claim(self, key: str, fingerprint: bytes) -> IdempotencyRecord | None:
+        with self._lock:
+            now = self._clock()
+            self._evict(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry[1]
+            self._entries[key] = (now + self._ttl, IdempotencyRecord(fingerprint, None))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            return None
+
+    def complete(self, key: str, response: StoredResponse) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # Keep the claim's expiry: moving it would break the front-to-back order
+                self._entries[key] = (entry[0], IdempotencyRecord(entry[1].fingerprint, response))
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self, now: float) -> None:
+        while self._entries:
+            expires_at, _ = next(iter(self._entries.values()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
@@ -6,6 +6,11 @@ from app.infrastructure.models.product_model import ProductModel
 from app.infrastructure.models.inventory_session_model import InventorySessionModel
 from app.infrastructure.models.inventory_count_model import InventoryCountModel
 from app.infrastructure.models.feature_flag_model import FeatureFlagModel
+from app.infrastructure.models.inventory_session_summary_model import (
+    InventorySessionSummaryModel,
+    InventorySessionSummaryUnitModel,
+)
+from app.infrastructure.models.unit_conversion_model import UnitConversionModel
 
 __all__ = [
     "user_warehouses",
@@ -16,4 +21,7 @@ __all__ = [
     "InventorySessionModel",
     "InventoryCountModel",
     "FeatureFlagModel",
+    "InventorySessionSummaryModel",
+    "InventorySessionSummaryUnitModel",
+    "UnitConversionModel",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.infrastructure.database.database import Base, GUID, utc_now
 
@@ -14,10 +14,13 @@ class InventoryCountModel(Base):
     quantity_units = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=utc_now, nullable=False)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+    # Set when a count is registered; NULL on rows AddProductsToSession pre-created
+    counted_at = Column(DateTime, nullable=True)
 
     session = relationship("InventorySessionModel", back_populates="counts")
     measurement_unit = relationship("MeasurementUnitModel", foreign_keys=[measure_unit_id])
 
     __table_args__ = (
         UniqueConstraint("session_id", "product_id", name="uq_inventory_count_session_product"),
+        Index("ix_inventory_counts_session_updated", "session_id", "updated_at"),
     )
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from app.infrastructure.database.database import Base, GUID, utc_now
+
+
+class InventorySessionSummaryModel(Base):
+    """Immutable totals of a closed session (written in the same transaction as closed_at)."""
+    __tablename__ = "inventory_session_summaries"
+
+    session_id = Column(GUID(), ForeignKey("inventory_sessions.id"), primary_key=True)
+    total_products = Column(Integer, nullable=False)
+    counted_products = Column(Integer, nullable=False)
+    uncounted_products = Column(Integer, nullable=False)
+    total_packages = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
+
+    unit_totals = relationship(
+        "InventorySessionSummaryUnitModel",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+
+class InventorySessionSummaryUnitModel(Base):
+    """Total units per inventory unit for a closed session."""
+    __tablename__ = "inventory_session_summary_units"
+
+    session_id = Column(
+        GUID(), ForeignKey("inventory_session_summaries.session_id"), primary_key=True
+    )
+    inventory_unit_id = Column(GUID(), ForeignKey("measurement_units.id"), primary_key=True)
+    total_units = Column(Integer, nullable=False)
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Float, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, Float, ForeignKey, event
 from sqlalchemy.orm import relationship
 from app.infrastructure.database.database import Base, GUID, utc_now
+from app.infrastructure.database.product_search_index import create_product_search_index
 
 
 class ProductModel(Base):
@@ -18,3 +19,11 @@ class ProductModel(Base):
 
     inventory_unit = relationship("MeasurementUnitModel", foreign_keys=[inventory_unit_id])
     packaging_unit = relationship("MeasurementUnitModel", foreign_keys=[packaging_unit_id])
+
+
+# Search indexes: Postgres via migration k10t6r7g8m9n0 (pg_trgm), SQLite FTS5 with the table
+event.listen(
+    ProductModel.__table__,
+    "after_create",
+    lambda target, connection, **kw: create_product_search_index(connection),
+)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index
+
+from app.infrastructure.database.database import Base, GUID, utc_now
+
+
+class UnitConversionModel(Base):
+    """Edge of the unit conversion graph; product_id NULL = applies to every product."""
+
+    __tablename__ = "unit_conversions"
+
+    id = Column(GUID(), primary_key=True, index=True)
+    from_unit_id = Column(GUID(), ForeignKey("measurement_units.id"), nullable=False)
+    to_unit_id = Column(GUID(), ForeignKey("measurement_units.id"), nullable=False)
+    factor = Column(Float, nullable=False)
+    product_id = Column(GUID(), ForeignKey("products.id"), nullable=True)
+    created_at = Column(DateTime, default=utc_now, nullable=False)
+    updated_at = Column(DateTime, default=utc_now, onupdate=utc_now, nullable=False)
+
+    __table_args__ = (
+        Index("ix_unit_conversions_product", "product_id"),
+    )
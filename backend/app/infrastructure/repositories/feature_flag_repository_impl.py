@@ -2,12 +2,16 @@ from datetime import datetime, timezone
 from typing import List, Optional, cast
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.domain.entities.feature_flag import FeatureFlag
 from app.domain.exceptions.business_exceptions import NotFoundException
 from app.domain.repositories.feature_flag_repository import FeatureFlagRepository
 from app.infrastructure.models.feature_flag_model import FeatureFlagModel
+from app.infrastructure.repositories.row_mapping import entity_columns
+
+_FLAG_COLUMNS = entity_columns(FeatureFlag, FeatureFlagModel)
 
 
 class FeatureFlagRepositoryImpl(FeatureFlagRepository):
@@ -15,32 +19,18 @@ class FeatureFlagRepositoryImpl(FeatureFlagRepository):
         self.db = db
 
     def get_all(self) -> List[FeatureFlag]:
-        models = (
-            self.db.query(FeatureFlagModel)
-            .order_by(FeatureFlagModel.key)
-            .all()
-        )
-        return [self._to_domain(m) for m in models]
+        rows = self.db.execute(select(*_FLAG_COLUMNS).order_by(FeatureFlagModel.key))
+        return [FeatureFlag(*row) for row in rows]
 
     def get_by_key(self, key: str) -> Optional[FeatureFlag]:
-        model = (
-            self.db.query(FeatureFlagModel)
-            .filter(FeatureFlagModel.key == key)
-            .first()
-        )
-        if not model:
-            return None
-        return self._to_domain(model)
+        row = self.db.execute(
+            select(*_FLAG_COLUMNS).where(FeatureFlagModel.key == key).limit(1)
+        ).first()
+        return FeatureFlag(*row) if row is not None else None
 
     def get_by_id(self, id: UUID) -> Optional[FeatureFlag]:
-        model = (
-            self.db.query(FeatureFlagModel)
-            .filter(FeatureFlagModel.id == id)
-            .first()
-        )
-        if not model:
-            return None
-        return self._to_domain(model)
+        row = self.db.execute(select(*_FLAG_COLUMNS).where(FeatureFlagModel.id == id)).first()
+        return FeatureFlag(*row) if row is not None else None
 
     def save(self, flag: FeatureFlag) -> FeatureFlag:
         """Insert new flag (create). Caller must ensure key is unique."""
@@ -0,0 +1,105 @@
+"""
+Request-scoped identity map for repository lookups.
+
+get_db() attaches one RequestIdentityMap to each request's Session (Session.info), so
+every repository built on that Session shares it: a get_by_id for a key already resolved
+in this request (found or not) returns the same frozen entity without a query, and
+repository writes refresh the entry they change. Sessions opened outside a request
+(seeders, scripts, benchmarks) carry no map and always query.
+"""
+
+from typing import Callable, Hashable, Iterable, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+_INFO_KEY = "request_identity_map"
+
+
+class RequestIdentityMap:
+    """Entities by (entity type, id); None records a key known to be missing."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[type, Hashable], object] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, entity: type[T], key: Hashable, load: Callable[[], Optional[T]]) -> Optional[T]:
+        try:
+            value = self._entries[(entity, key)]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[(entity, key)] = load()
+            return value  # type: ignore[return-value]
+        self.hits += 1
+        return value  # type: ignore[return-value]
+
+    def get_many(
+        self,
+        entity: type[T],
+        keys: Iterable[Hashable],
+        load: Callable[[list], list[T]],
+        key_of: Callable[[T], Hashable],
+    ) -> list[T]:
+        """Found entities for keys (unordered, like an IN query); only unknown keys are loaded."""
+        keys = list(dict.fromkeys(keys))
+        missing = [k for k in keys if (entity, k) not in self._entries]
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            for k in missing:
+                self._entries[(entity, k)] = None
+            for value in load(missing):
+                self._entries[(entity, key_of(value))] = value
+        found = (self._entries[(entity, k)] for k in keys)
+        return [value for value in found if value is not None]  # type: ignore[misc]
+
+    def put(self, entity: type[T], key: Hashable, value: Optional[T]) -> None:
+        self._entries[(entity, key)] = value
+
+    def clear(self, entity: type | None = None) -> None:
+        if entity is None:
+            self._entries.clear()
+        else:
+            self._entries = {k: v for k, v in self._entries.items() if k[0] is not entity}
+
+
+def enable_identity_map(db: Session) -> RequestIdentityMap:
+    identity_map = db.info[_INFO_KEY] = RequestIdentityMap()
+    return identity_map
+
+
+def identity_map(db: Session) -> RequestIdentityMap | None:
+    return db.info.get(_INFO_KEY)
+
+
+def cached_get(db: Session, entity: type[T], key: Hashable, load: Callable[[], Optional[T]]) -> Optional[T]:
+    """load() once per key and request; without a map (outside requests) always load()."""
+    entries = identity_map(db)
+    return load() if entries is None else entries.get(entity, key, load)
+
+
+def cached_get_many(
+    db: Session,
+    entity: type[T],
+    keys: list,
+    load: Callable[[list], list[T]],
+    key_of: Callable[[T], Hashable],
+) -> list[T]:
+    entries = identity_map(db)
+    return load(keys) if entries is None else entries.get_many(entity, keys, load, key_of)
+
+
+def remember(db: Session, entity: type[T], key: Hashable, value: Optional[T]) -> None:
+    """Record the state a repository write just committed."""
+    entries = identity_map(db)
+    if entries is not None:
+        entries.put(entity, key, value)
+
+
+def forget(db: Session, entity: type) -> None:
+    """Drop every cached entity of a type (bulk writes that bypass per-key updates)."""
+    entries = identity_map(db)
+    if entries is not None:
+        entries.clear(entity)
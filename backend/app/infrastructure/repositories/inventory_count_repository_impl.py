@@ -1,20 +1,46 @@
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from typing import cast
 from uuid import UUID, uuid4
 
+from sqlalchemy import case, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, joinedload
 
+from app.application.use_cases.inventory.round_variance_query import (
+    ProductRoundUnits,
+    RoundVarianceQuery,
+)
+from app.application.use_cases.reports.monthly_inventory_query import (
+    MonthlyInventoryQuery,
+    ProductMonthlyTotal,
+)
 from app.domain.entities.inventory_count import InventoryCount
+from app.domain.entities.inventory_session import MAX_SESSIONS_PER_MONTH
+from app.domain.entities.inventory_session_snapshot import (
+    InventorySessionSnapshot,
+    SnapshotUnitTotal,
+)
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation
 from app.domain.repositories.inventory_count_repository import InventoryCountRepository
 from app.infrastructure.models.inventory_count_model import InventoryCountModel
+from app.infrastructure.models.inventory_session_model import InventorySessionModel
 from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.repositories.inventory_session_repository_impl import month_range
+from app.infrastructure.repositories.row_mapping import entity_columns
 
+_COUNT_COLUMNS = entity_columns(InventoryCount, InventoryCountModel)
 
-class InventoryCountRepositoryImpl(InventoryCountRepository):
+
+class InventoryCountRepositoryImpl(
+    InventoryCountRepository, RoundVarianceQuery, MonthlyInventoryQuery
+):
     def __init__(self, db: Session):
         self.db = db
 
     def save(self, count: InventoryCount) -> InventoryCount:
+        self._lock_open_session(count.session_id)
         model = InventoryCountModel(
             id=count.id,
             session_id=count.session_id,
@@ -24,34 +50,97 @@ class InventoryCountRepositoryImpl(InventoryCountRepository):
             quantity_units=count.quantity_units,
             created_at=count.created_at,
             updated_at=count.updated_at,
+            counted_at=count.counted_at,
         )
         self.db.add(model)
         self.db.commit()
         self.db.refresh(model)
         return self._to_domain(model)
 
+    def register(self, count: InventoryCount, allow_recount: bool = False) -> InventoryCount | None:
+        # One statement: INSERT ... ON CONFLICT (session_id, product_id) DO UPDATE ... WHERE
+        # the existing row is uncounted (counted_at IS NULL). A counted row, even one counted
+        # as 0 packages, makes the guard false: nothing returned
+        self._lock_open_session(count.session_id)
+        dialect = self.db.get_bind().dialect.name
+        insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert(InventoryCountModel).values(
+            id=count.id,
+            session_id=count.session_id,
+            product_id=count.product_id,
+            measure_unit_id=count.measure_unit_id,
+            quantity_packages=count.quantity_packages,
+            quantity_units=count.quantity_units,
+            created_at=count.created_at,
+            updated_at=count.updated_at,
+            counted_at=count.counted_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[InventoryCountModel.session_id, InventoryCountModel.product_id],
+            set_={
+                "measure_unit_id": stmt.excluded.measure_unit_id,
+                "quantity_packages": stmt.excluded.quantity_packages,
+                "quantity_units": stmt.excluded.quantity_units,
+                "updated_at": stmt.excluded.updated_at,
+                "counted_at": stmt.excluded.counted_at,
+            },
+            where=None if allow_recount else InventoryCountModel.counted_at.is_(None),
+        ).returning(InventoryCountModel)
+        model = self.db.scalars(stmt, execution_options={"populate_existing": True}).first()
+        registered = self._to_domain(model) if model is not None else None
+        self.db.commit()
+        return registered
+
+    def _lock_open_session(self, session_id: UUID) -> None:
+        # FOR SHARE in the write's transaction: a concurrent close (FOR UPDATE) waits for this
+        # write and summarizes it, or this waits for the close and sees closed_at (no-op on
+        # SQLite, where the database lock serializes writers)
+        closed_at = self.db.execute(
+            select(InventorySessionModel.closed_at)
+            .where(InventorySessionModel.id == session_id)
+            .with_for_update(read=True)
+        ).scalar()
+        if closed_at is not None:
+            self.db.rollback()
+            raise BusinessRuleViolation("Inventory session is closed.")
+
     def list_by_session(self, session_id: UUID) -> list[InventoryCount]:
-        models = (
-            self.db.query(InventoryCountModel)
-            .filter(InventoryCountModel.session_id == session_id)
+        rows = self.db.execute(
+            select(*_COUNT_COLUMNS)
+            .where(InventoryCountModel.session_id == session_id)
             .order_by(InventoryCountModel.created_at.asc())
-            .all()
         )
-        return [self._to_domain(m) for m in models]
+        return [InventoryCount(*row) for row in rows]
 
-    def exists_by_session_and_product(self, session_id: UUID, product_id: UUID) -> bool:
-        return (
-            self.db.query(InventoryCountModel)
-            .filter(
+    def list_by_session_updated_since(
+        self, session_id: UUID, since: datetime
+    ) -> list[InventoryCount]:
+        # Columns are naive UTC; compare like with like (served by ix_inventory_counts_session_updated)
+        since_utc = since.astimezone(timezone.utc).replace(tzinfo=None) if since.tzinfo else since
+        rows = self.db.execute(
+            select(*_COUNT_COLUMNS)
+            .where(
                 InventoryCountModel.session_id == session_id,
-                InventoryCountModel.product_id == product_id,
+                InventoryCountModel.updated_at > since_utc,
             )
-            .first()
+            .order_by(InventoryCountModel.updated_at.asc())
+        )
+        return [InventoryCount(*row) for row in rows]
+
+    def exists_by_session_and_product(self, session_id: UUID, product_id: UUID) -> bool:
+        return (
+            self.db.execute(
+                select(InventoryCountModel.id)
+                .where(
+                    InventoryCountModel.session_id == session_id,
+                    InventoryCountModel.product_id == product_id,
+                )
+                .limit(1)
+            ).first()
             is not None
         )
 
     def count_by_session(self, session_id: UUID) -> int:
-        from sqlalchemy import func
         return (
             self.db.query(func.count(InventoryCountModel.id))
             .filter(InventoryCountModel.session_id == session_id)
@@ -59,6 +148,125 @@ class InventoryCountRepositoryImpl(InventoryCountRepository):
             or 0
         )
 
+    def summarize_by_session(self, session_id: UUID) -> InventorySessionSnapshot:
+        rows = (
+            self.db.query(
+                ProductModel.inventory_unit_id,
+                func.count(InventoryCountModel.id),
+                func.count(InventoryCountModel.counted_at),
+                func.sum(InventoryCountModel.quantity_packages),
+                func.sum(InventoryCountModel.quantity_units),
+            )
+            .join(ProductModel, ProductModel.id == InventoryCountModel.product_id)
+            .filter(InventoryCountModel.session_id == session_id)
+            .group_by(ProductModel.inventory_unit_id)
+            .all()
+        )
+        total_products = sum(int(r[1] or 0) for r in rows)
+        counted_products = sum(int(r[2] or 0) for r in rows)
+        return InventorySessionSnapshot(
+            session_id=session_id,
+            total_products=total_products,
+            counted_products=counted_products,
+            uncounted_products=total_products - counted_products,
+            total_packages=sum(int(r[3] or 0) for r in rows),
+            created_at=datetime.now(timezone.utc),
+            unit_totals=[
+                SnapshotUnitTotal(inventory_unit_id=cast(UUID, r[0]), total_units=int(r[4] or 0))
+                for r in rows
+            ],
+        )
+
+    def units_by_round(self, warehouse_id: UUID, month: datetime) -> list[ProductRoundUnits]:
+        rounds = range(1, MAX_SESSIONS_PER_MONTH + 1)
+        start, end = month_range(month)
+        # Pivot: one column per count_number, one row per product
+        pivot_columns = [
+            func.sum(
+                case(
+                    (InventorySessionModel.count_number == n, InventoryCountModel.quantity_units),
+                    else_=None,
+                )
+            )
+            for n in rounds
+        ]
+        stmt = (
+            select(
+                ProductModel.id,
+                ProductModel.code,
+                ProductModel.description,
+                *pivot_columns,
+            )
+            .join(InventoryCountModel, InventoryCountModel.product_id == ProductModel.id)
+            .join(InventorySessionModel, InventorySessionModel.id == InventoryCountModel.session_id)
+            .filter(
+                InventorySessionModel.warehouse_id == warehouse_id,
+                InventorySessionModel.month >= start,
+                InventorySessionModel.month < end,
+            )
+            .group_by(ProductModel.id, ProductModel.code, ProductModel.description)
+            .order_by(ProductModel.code)
+        )
+        # Core select: plain tuples, no ORM row bookkeeping for a few thousand products
+        rows = self.db.execute(stmt).all()
+        return [
+            ProductRoundUnits(
+                product_id=cast(UUID, r[0]),
+                code=cast(str, r[1]),
+                description=cast(str, r[2]),
+                units_by_round={
+                    n: (int(v) if v is not None else None) for n, v in zip(rounds, r[3:])
+                },
+            )
+            for r in rows
+        ]
+
+    def product_totals(self, session_ids: list[UUID]) -> list[ProductMonthlyTotal]:
+        return list(self.iter_product_totals(session_ids))
+
+    def iter_product_totals(
+        self, session_ids: list[UUID], batch_size: int = 500
+    ) -> Iterator[ProductMonthlyTotal]:
+        if not session_ids:
+            return
+        # Units were normalized once at registration, so edits to unit conversions
+        # never change a closed month
+        stmt = (
+            select(
+                ProductModel.id,
+                ProductModel.code,
+                ProductModel.description,
+                ProductModel.inventory_unit_id,
+                func.sum(InventoryCountModel.quantity_packages),
+                func.sum(InventoryCountModel.quantity_units),
+                func.count(func.distinct(InventoryCountModel.session_id)),
+            )
+            .join(InventoryCountModel, InventoryCountModel.product_id == ProductModel.id)
+            .filter(InventoryCountModel.session_id.in_(session_ids))
+            .group_by(
+                ProductModel.id,
+                ProductModel.code,
+                ProductModel.description,
+                ProductModel.inventory_unit_id,
+            )
+            .order_by(ProductModel.code)
+        )
+        # yield_per: batches from a server-side cursor on PostgreSQL, never the whole result
+        result = self.db.execute(stmt, execution_options={"yield_per": batch_size})
+        try:
+            for r in result:
+                yield ProductMonthlyTotal(
+                    product_id=cast(UUID, r[0]),
+                    code=cast(str, r[1]),
+                    description=cast(str, r[2]),
+                    inventory_unit_id=cast(UUID, r[3]),
+                    total_packages=int(r[4] or 0),
+                    total_units=int(r[5] or 0),
+                    warehouses_count=int(r[6]),
+                )
+        finally:
+            result.close()  # Also when the consumer stops early (client disconnected)
+
     def _to_domain(self, model: InventoryCountModel) -> InventoryCount:
         return InventoryCount(
             id=cast(UUID, model.id),
@@ -69,4 +277,5 @@ class InventoryCountRepositoryImpl(InventoryCountRepository):
             quantity_units=cast(int, model.quantity_units),
             created_at=cast(datetime, model.created_at),
             updated_at=cast(datetime, model.updated_at),
+            counted_at=cast(datetime | None, model.counted_at),
         )
@@ -1,14 +1,54 @@
+from calendar import monthrange
 from uuid import UUID
-from datetime import datetime, timezone
-from typing import Optional, List, cast
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, List, Tuple, cast
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.application.use_cases.inventory_session_detail_query import InventorySessionDetailQuery
+from app.application.use_cases.list_inventory_sessions_use_case import InventorySessionSummary
 from app.domain.entities.inventory_session import InventorySession
-from app.domain.exceptions.business_exceptions import NotFoundException
+from app.domain.entities.inventory_session_snapshot import InventorySessionSnapshot
+from app.domain.exceptions.business_exceptions import (
+    BusinessRuleViolation,
+    ConcurrencyConflict,
+    NotFoundException,
+)
 from app.domain.repositories.inventory_session_repository import InventorySessionRepository
+from app.infrastructure.models.inventory_count_model import InventoryCountModel
 from app.infrastructure.models.inventory_session_model import InventorySessionModel
+from app.infrastructure.models.inventory_session_summary_model import InventorySessionSummaryModel
+from app.infrastructure.models.user_model import UserModel
+from app.infrastructure.models.warehouse_model import WarehouseModel
+from app.infrastructure.repositories.inventory_session_snapshot_repository_impl import (
+    InventorySessionSnapshotRepositoryImpl,
+)
+from app.infrastructure.repositories.identity_map import cached_get, remember
+from app.infrastructure.repositories.row_mapping import entity_columns
 
-class InventorySessionRepositoryImpl(InventorySessionRepository):
+_SESSION_COLUMNS = entity_columns(InventorySession, InventorySessionModel)
+
+
+def _violates_count_number_unique(error: IntegrityError) -> bool:
+    """True only for uq_inventory_session; FK, NOT NULL or primary key violations are not retried."""
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None and getattr(diag, "constraint_name", None):
+        return diag.constraint_name == "uq_inventory_session"
+    # SQLite reports the constraint's columns instead of its name
+    message = str(error.orig)
+    return message.startswith("UNIQUE constraint failed") and "inventory_sessions.count_number" in message
+
+
+def month_range(month: datetime) -> Tuple[datetime, datetime]:
+    """Return [start, end) covering the calendar month of `month` in UTC."""
+    month_utc = month if month.tzinfo else month.replace(tzinfo=timezone.utc)
+    start = month_utc.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    ndays = monthrange(start.year, start.month)[1]
+    return start, start + timedelta(days=ndays)
+
+
+class InventorySessionRepositoryImpl(InventorySessionRepository, InventorySessionDetailQuery):
 
     def __init__(self, db: Session):
         self.db = db
@@ -24,10 +64,18 @@ class InventorySessionRepositoryImpl(InventorySessionRepository):
             closed_at=session.closed_at
         )
         self.db.add(db_session)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if not _violates_count_number_unique(e):
+                raise
+            # Another request took this count_number first: the use case retries
+            raise ConcurrencyConflict(
+                "Inventory session count_number already taken for this warehouse and month."
+            ) from e
         self.db.refresh(db_session)
-
-        return self._to_domain(db_session)
+        return self._remember(db_session)
 
     def update(self, session: InventorySession) -> InventorySession:
         db_session = (
@@ -40,27 +88,78 @@ class InventorySessionRepositoryImpl(InventorySessionRepository):
         db_session.closed_at = session.closed_at
         self.db.commit()
         self.db.refresh(db_session)
-        return self._to_domain(db_session)
+        return self._remember(db_session)
 
-    def get_by_id(self, session_id: UUID) -> Optional[InventorySession]:
+    def close(
+        self,
+        session: InventorySession,
+        summarize: Callable[[], InventorySessionSnapshot],
+    ) -> Tuple[InventorySession, InventorySessionSnapshot]:
+        # Row lock: a concurrent close waits here and then sees closed_at (no-op on SQLite,
+        # where the snapshot primary key catches the race instead)
         db_session = (
             self.db.query(InventorySessionModel)
-            .filter(InventorySessionModel.id == session_id)
+            .filter(InventorySessionModel.id == session.id)
+            .with_for_update()
+            .populate_existing()
             .first()
         )
-
         if not db_session:
-            return None
-        
-        return self._to_domain(db_session)
+            raise NotFoundException("Inventory session not found")
+        if db_session.closed_at is not None:
+            self.db.rollback()
+            raise BusinessRuleViolation("Inventory session is already closed.")
+        # Summarized under the lock: count writes hold FOR SHARE on this row until they commit
+        snapshot = summarize()
+        db_session.closed_at = session.closed_at
+        self.db.add(InventorySessionSnapshotRepositoryImpl.to_model(snapshot))
+        try:
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            closed_at = self.db.execute(
+                select(InventorySessionModel.closed_at).where(InventorySessionModel.id == session.id)
+            ).scalar()
+            if closed_at is None:
+                raise
+            raise BusinessRuleViolation("Inventory session is already closed.")
+        self.db.refresh(db_session)
+        return self._remember(db_session), snapshot
+
+    def get_by_id(self, session_id: UUID) -> Optional[InventorySession]:
+        return cached_get(self.db, InventorySession, session_id, lambda: self._load(session_id))
+
+    def _load(self, session_id: UUID) -> Optional[InventorySession]:
+        row = self.db.execute(
+            select(*_SESSION_COLUMNS).where(InventorySessionModel.id == session_id)
+        ).first()
+        return InventorySession(*row) if row is not None else None
 
     def list_by_warehouse(self, warehouse_id: UUID) -> List[InventorySession]:
-        db_sessions = (
-            self.db.query(InventorySessionModel)
-            .filter(InventorySessionModel.warehouse_id == warehouse_id)
-            .all()
+        rows = self.db.execute(
+            select(*_SESSION_COLUMNS).where(InventorySessionModel.warehouse_id == warehouse_id)
+        )
+        return [InventorySession(*row) for row in rows]
+
+    def get_month_allocation(self, warehouse_id: UUID, month: datetime) -> Tuple[int, int]:
+        # Row lock on the warehouse (no-op on SQLite) serializes concurrent creates until commit
+        self.db.query(WarehouseModel.id).filter(
+            WarehouseModel.id == warehouse_id
+        ).with_for_update().first()
+        start, end = month_range(month)
+        total, max_number = (
+            self.db.query(
+                func.count(InventorySessionModel.id),
+                func.max(InventorySessionModel.count_number),
+            )
+            .filter(
+                InventorySessionModel.warehouse_id == warehouse_id,
+                InventorySessionModel.month >= start,
+                InventorySessionModel.month < end,
+            )
+            .one()
         )
-        return [self._to_domain(db_session) for db_session in db_sessions]
+        return int(total or 0), int(max_number or 0)
 
     def list_filtered(
         self,
@@ -69,28 +168,68 @@ class InventorySessionRepositoryImpl(InventorySessionRepository):
         month: Optional[datetime] = None,
         status: Optional[str] = None,
     ) -> List[InventorySession]:
-        q = self.db.query(InventorySessionModel)
+        q = select(*_SESSION_COLUMNS)
         if warehouse_id is not None:
-            q = q.filter(InventorySessionModel.warehouse_id == warehouse_id)
+            q = q.where(InventorySessionModel.warehouse_id == warehouse_id)
         if warehouse_ids is not None and len(warehouse_ids) > 0:
-            q = q.filter(InventorySessionModel.warehouse_id.in_(warehouse_ids))
+            q = q.where(InventorySessionModel.warehouse_id.in_(warehouse_ids))
         if month is not None:
-            from calendar import monthrange
-            from datetime import timedelta
-            month_utc = month if month.tzinfo else month.replace(tzinfo=timezone.utc)
-            start = month_utc.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            ndays = monthrange(start.year, start.month)[1]
-            end = start + timedelta(days=ndays)
-            q = q.filter(
+            start, end = month_range(month)
+            q = q.where(
                 InventorySessionModel.month >= start,
                 InventorySessionModel.month < end,
             )
         if status == "open":
-            q = q.filter(InventorySessionModel.closed_at.is_(None))
+            q = q.where(InventorySessionModel.closed_at.is_(None))
         elif status == "closed":
-            q = q.filter(InventorySessionModel.closed_at.isnot(None))
+            q = q.where(InventorySessionModel.closed_at.isnot(None))
         q = q.order_by(InventorySessionModel.created_at.desc())
-        return [self._to_domain(m) for m in q.all()]
+        return [InventorySession(*row) for row in self.db.execute(q)]
+
+    def get_summary(self, session_id: UUID) -> Optional[InventorySessionSummary]:
+        # Closed sessions read products_count from their snapshot; COALESCE only runs the
+        # correlated count for open ones
+        counts = (
+            select(func.count(InventoryCountModel.id))
+            .where(InventoryCountModel.session_id == InventorySessionModel.id)
+            .scalar_subquery()
+        )
+        row = self.db.execute(
+            select(
+                *_SESSION_COLUMNS,
+                WarehouseModel.description,
+                UserModel.name,
+                func.coalesce(InventorySessionSummaryModel.total_products, counts),
+            )
+            .outerjoin(WarehouseModel, WarehouseModel.id == InventorySessionModel.warehouse_id)
+            .outerjoin(UserModel, UserModel.id == InventorySessionModel.created_by)
+            .outerjoin(
+                InventorySessionSummaryModel,
+                InventorySessionSummaryModel.session_id == InventorySessionModel.id,
+            )
+            .where(InventorySessionModel.id == session_id)
+        ).first()
+        if row is None:
+            return None
+        session = InventorySession(*row[: len(_SESSION_COLUMNS)])
+        warehouse_description, creator_name, products_count = row[len(_SESSION_COLUMNS) :]
+        return InventorySessionSummary(
+            id=session.id,
+            warehouse_id=session.warehouse_id,
+            warehouse_description=warehouse_description or "",
+            month=session.month,
+            count_number=session.count_number,
+            created_by_id=session.created_by,
+            created_by_name=creator_name or "",
+            created_at=session.created_at,
+            closed_at=session.closed_at,
+            products_count=int(products_count or 0),
+        )
+
+    def _remember(self, model: InventorySessionModel) -> InventorySession:
+        session = self._to_domain(model)
+        remember(self.db, InventorySession, session.id, session)
+        return session
 
     def _to_domain(self, model: InventorySessionModel) -> InventorySession:
         return InventorySession(
@@ -0,0 +1,96 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Optional, cast
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.inventory_session_snapshot import (
+    InventorySessionSnapshot,
+    SnapshotUnitTotal,
+)
+from app.domain.repositories.inventory_session_snapshot_repository import (
+    InventorySessionSnapshotRepository,
+)
+from app.infrastructure.models.inventory_session_summary_model import (
+    InventorySessionSummaryModel,
+    InventorySessionSummaryUnitModel,
+)
+
+# Scalar fields only: unit_totals comes from its own query
+_SUMMARY_COLUMNS = (
+    InventorySessionSummaryModel.session_id,
+    InventorySessionSummaryModel.total_products,
+    InventorySessionSummaryModel.counted_products,
+    InventorySessionSummaryModel.uncounted_products,
+    InventorySessionSummaryModel.total_packages,
+    InventorySessionSummaryModel.created_at,
+)
+
+
+class InventorySessionSnapshotRepositoryImpl(InventorySessionSnapshotRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_session_id(self, session_id: UUID) -> Optional[InventorySessionSnapshot]:
+        snapshots = self.get_by_session_ids([session_id])
+        return snapshots[0] if snapshots else None
+
+    def get_by_session_ids(self, session_ids: List[UUID]) -> List[InventorySessionSnapshot]:
+        if not session_ids:
+            return []
+        # Same two round trips as the selectin relationship, without ORM instances
+        rows = self.db.execute(
+            select(*_SUMMARY_COLUMNS).where(InventorySessionSummaryModel.session_id.in_(session_ids))
+        ).all()
+        if not rows:
+            return []
+        unit_totals: dict[UUID, list[SnapshotUnitTotal]] = defaultdict(list)
+        for session_id, inventory_unit_id, total_units in self.db.execute(
+            select(
+                InventorySessionSummaryUnitModel.session_id,
+                InventorySessionSummaryUnitModel.inventory_unit_id,
+                InventorySessionSummaryUnitModel.total_units,
+            ).where(InventorySessionSummaryUnitModel.session_id.in_([r[0] for r in rows]))
+        ):
+            unit_totals[session_id].append(SnapshotUnitTotal(inventory_unit_id, total_units))
+        return [InventorySessionSnapshot(*row, unit_totals[row[0]]) for row in rows]
+
+    @staticmethod
+    def to_model(snapshot: InventorySessionSnapshot) -> InventorySessionSummaryModel:
+        model = InventorySessionSummaryModel(
+            session_id=snapshot.session_id,
+            total_products=snapshot.total_products,
+            counted_products=snapshot.counted_products,
+            uncounted_products=snapshot.uncounted_products,
+            total_packages=snapshot.total_packages,
+            created_at=snapshot.created_at,
+        )
+        model.unit_totals = [
+            InventorySessionSummaryUnitModel(
+                session_id=snapshot.session_id,
+                inventory_unit_id=u.inventory_unit_id,
+                total_units=u.total_units,
+            )
+            for u in snapshot.unit_totals
+        ]
+        return model
+
+    @staticmethod
+    def to_domain(model: InventorySessionSummaryModel) -> InventorySessionSnapshot:
+        return InventorySessionSnapshot(
+            session_id=cast(UUID, model.session_id),
+            total_products=cast(int, model.total_products),
+            counted_products=cast(int, model.counted_products),
+            uncounted_products=cast(int, model.uncounted_products),
+            total_packages=cast(int, model.total_packages),
+            created_at=cast(datetime, model.created_at),
+            unit_totals=[
+                SnapshotUnitTotal(
+                    inventory_unit_id=cast(UUID, u.inventory_unit_id),
+                    total_units=cast(int, u.total_units),
+                )
+                for u in model.unit_totals
+            ],
+        )
@@ -2,12 +2,17 @@ from datetime import datetime
 from typing import List, Optional, cast
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.domain.entities.measurement_unit import MeasurementUnit
 from app.domain.exceptions.business_exceptions import NotFoundException
 from app.domain.repositories.measurement_unit_repository import MeasurementUnitRepository
 from app.infrastructure.models.measurement_unit_model import MeasurementUnitModel
+from app.infrastructure.repositories.identity_map import cached_get, cached_get_many, remember
+from app.infrastructure.repositories.row_mapping import entity_columns
+
+_UNIT_COLUMNS = entity_columns(MeasurementUnit, MeasurementUnitModel)
 
 
 class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
@@ -18,55 +23,40 @@ class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
         return self.db.query(MeasurementUnitModel).count()
 
     def list_active(self) -> List[MeasurementUnit]:
-        models = (
-            self.db.query(MeasurementUnitModel)
-            .filter(MeasurementUnitModel.is_active == True)
+        rows = self.db.execute(
+            select(*_UNIT_COLUMNS)
+            .where(MeasurementUnitModel.is_active == True)
             .order_by(MeasurementUnitModel.name)
-            .all()
         )
-        return [self._to_domain(m) for m in models]
+        return [MeasurementUnit(*row) for row in rows]
 
     def list_all(self) -> List[MeasurementUnit]:
-        models = (
-            self.db.query(MeasurementUnitModel)
-            .order_by(MeasurementUnitModel.name)
-            .all()
-        )
-        return [self._to_domain(m) for m in models]
+        rows = self.db.execute(select(*_UNIT_COLUMNS).order_by(MeasurementUnitModel.name))
+        return [MeasurementUnit(*row) for row in rows]
 
     def get_by_id(self, id: UUID) -> Optional[MeasurementUnit]:
-        model = self.db.query(MeasurementUnitModel).filter(MeasurementUnitModel.id == id).first()
-        if not model:
-            return None
-        return self._to_domain(model)
+        return cached_get(
+            self.db, MeasurementUnit, id, lambda: self._first(MeasurementUnitModel.id == id)
+        )
 
     def get_by_ids(self, ids: List[UUID]) -> List[MeasurementUnit]:
         if not ids:
             return []
-        models = (
-            self.db.query(MeasurementUnitModel)
-            .filter(MeasurementUnitModel.id.in_(ids))
-            .all()
-        )
-        return [self._to_domain(m) for m in models]
+        return cached_get_many(self.db, MeasurementUnit, ids, self._load_many, lambda u: u.id)
+
+    def _load_many(self, ids: List[UUID]) -> List[MeasurementUnit]:
+        rows = self.db.execute(select(*_UNIT_COLUMNS).where(MeasurementUnitModel.id.in_(ids)))
+        return [MeasurementUnit(*row) for row in rows]
 
     def get_by_name(self, name: str) -> Optional[MeasurementUnit]:
-        model = (
-            self.db.query(MeasurementUnitModel).filter(MeasurementUnitModel.name == name).first()
-        )
-        if not model:
-            return None
-        return self._to_domain(model)
+        return self._first(MeasurementUnitModel.name == name)
 
     def get_by_abbreviation(self, abbreviation: str) -> Optional[MeasurementUnit]:
-        model = (
-            self.db.query(MeasurementUnitModel)
-            .filter(MeasurementUnitModel.abbreviation == abbreviation)
-            .first()
-        )
-        if not model:
-            return None
-        return self._to_domain(model)
+        return self._first(MeasurementUnitModel.abbreviation == abbreviation)
+
+    def _first(self, condition) -> Optional[MeasurementUnit]:
+        row = self.db.execute(select(*_UNIT_COLUMNS).where(condition).limit(1)).first()
+        return MeasurementUnit(*row) if row is not None else None
 
     def save(self, unit: MeasurementUnit) -> MeasurementUnit:
         model = MeasurementUnitModel(
@@ -80,7 +70,7 @@ class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
         self.db.add(model)
         self.db.commit()
         self.db.refresh(model)
-        return self._to_domain(model)
+        return self._remember(model)
 
     def update(self, unit: MeasurementUnit) -> MeasurementUnit:
         model = (
@@ -94,7 +84,12 @@ class MeasurementUnitRepositoryImpl(MeasurementUnitRepository):
         model.updated_at = unit.updated_at
         self.db.commit()
         self.db.refresh(model)
-        return self._to_domain(model)
+        return self._remember(model)
+
+    def _remember(self, model: MeasurementUnitModel) -> MeasurementUnit:
+        unit = self._to_domain(model)
+        remember(self.db, MeasurementUnit, unit.id, unit)
+        return unit
 
     def _to_domain(self, model: MeasurementUnitModel) -> MeasurementUnit:
         return MeasurementUnit(
@@ -1,12 +1,46 @@
+import csv
+import io
 from datetime import datetime
-from typing import List, Optional, cast
+from typing import Dict, List, Optional, Tuple, cast
 from uuid import UUID
 
+from sqlalchemy import case, func, literal_column, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.domain.entities.product import Product
 from app.domain.repositories.product_repository import ProductRepository
+from app.infrastructure.database.product_search_index import SQLITE_FTS_TABLE
 from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.repositories.identity_map import cached_get, forget, remember
+from app.infrastructure.repositories.row_mapping import entity_columns
+
+# FTS5 trigram MATCH needs at least 3 characters; shorter SQLite queries use LIKE
+FTS_MIN_QUERY_LENGTH = 3
+
+_IMPORT_COLUMNS = (
+    "id",
+    "code",
+    "description",
+    "inventory_unit_id",
+    "packaging_unit_id",
+    "conversion_factor",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+# On conflict (code) everything but id and created_at is replaced
+_IMPORT_UPDATED_COLUMNS = _IMPORT_COLUMNS[2:7] + ("updated_at",)
+_STAGING_TABLE = "product_import_staging"
+# Stay below SQLite's bound-parameter limit when checking existing codes
+_SQLITE_IN_BATCH = 900
+_PRODUCT_COLUMNS = entity_columns(
+    Product, ProductModel, inventory_unit="inventory_unit_id", packaging_unit="packaging_unit_id"
+)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class ProductRepositoryImpl(ProductRepository):
@@ -14,19 +48,55 @@ class ProductRepositoryImpl(ProductRepository):
         self.db = db
 
     def get_by_id(self, product_id: UUID) -> Optional[Product]:
-        model = self.db.query(ProductModel).filter(ProductModel.id == product_id).first()
-        if not model:
-            return None
-        return self._to_domain(model)
+        return cached_get(self.db, Product, product_id, lambda: self._load(product_id))
+
+    def _load(self, product_id: UUID) -> Optional[Product]:
+        row = self.db.execute(select(*_PRODUCT_COLUMNS).where(ProductModel.id == product_id)).first()
+        return Product(*row) if row is not None else None
 
     def list_active(self) -> List[Product]:
-        models = (
-            self.db.query(ProductModel)
-            .filter(ProductModel.is_active == True)
+        rows = self.db.execute(
+            select(*_PRODUCT_COLUMNS)
+            .where(ProductModel.is_active == True)
             .order_by(ProductModel.code)
-            .all()
         )
-        return [self._to_domain(m) for m in models]
+        return [Product(*row) for row in rows]
+
+    def list_active_codes(self) -> Dict[str, UUID]:
+        rows = self.db.execute(
+            select(ProductModel.code, ProductModel.id).where(ProductModel.is_active == True)
+        ).all()
+        return {code: product_id for code, product_id in rows}
+
+    def search_active(self, query: str, limit: int) -> List[Product]:
+        escaped = _escape_like(query)
+        if self.db.get_bind().dialect.name == "postgresql":
+            # ix_products_code_upper_prefix (text_pattern_ops) and ix_products_description_trgm
+            code_match = func.upper(ProductModel.code).like(escaped.upper() + "%", escape="\\")
+            description_match = ProductModel.description.ilike(f"%{escaped}%", escape="\\")
+        else:
+            # SQLite LIKE is already case-insensitive for ASCII
+            code_match = ProductModel.code.like(escaped + "%", escape="\\")
+            if len(query) >= FTS_MIN_QUERY_LENGTH:
+                phrase = '"' + query.replace('"', '""') + '"'
+                description_match = literal_column("products.rowid").in_(
+                    select(literal_column("rowid"))
+                    .select_from(text(SQLITE_FTS_TABLE))
+                    .where(text(f"{SQLITE_FTS_TABLE} MATCH :phrase").bindparams(phrase=phrase))
+                )
+            else:
+                description_match = ProductModel.description.like(f"%{escaped}%", escape="\\")
+        rows = self.db.execute(
+            select(*_PRODUCT_COLUMNS)
+            .where(ProductModel.is_active == True, code_match | description_match)
+            .order_by(
+                case((code_match, 0), else_=1),
+                func.length(ProductModel.description),
+                ProductModel.code,
+            )
+            .limit(limit)
+        )
+        return [Product(*row) for row in rows]
 
     def count(self) -> int:
         return self.db.query(ProductModel).count()
@@ -46,7 +116,98 @@ class ProductRepositoryImpl(ProductRepository):
         self.db.add(model)
         self.db.commit()
         self.db.refresh(model)
-        return self._to_domain(model)
+        saved = self._to_domain(model)
+        remember(self.db, Product, saved.id, saved)
+        return saved
+
+    def upsert_many(self, products: List[Product]) -> Tuple[int, int]:
+        if not products:
+            return 0, 0
+        if self.db.get_bind().dialect.name == "postgresql":
+            inserted = self._upsert_many_copy(products)
+        else:
+            inserted = self._upsert_many_executemany(products)
+        self.db.commit()
+        forget(self.db, Product)
+        return inserted, len(products) - inserted
+
+    def _upsert_many_copy(self, products: List[Product]) -> int:
+        # COPY into a per-connection temp table, then one set-based upsert from it
+        self.db.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+                "(LIKE products INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+            )
+        )
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for p in products:
+            writer.writerow(
+                [
+                    p.id,
+                    p.code,
+                    p.description,
+                    p.inventory_unit,
+                    p.packaging_unit,
+                    repr(p.conversion_factor),
+                    "t" if p.is_active else "f",
+                    p.created_at.isoformat(),
+                    p.updated_at.isoformat(),
+                ]
+            )
+        buffer.seek(0)
+        columns = ", ".join(_IMPORT_COLUMNS)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        finally:
+            cursor.close()
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in _IMPORT_UPDATED_COLUMNS)
+        return self.db.execute(
+            text(
+                f"WITH upserted AS ("
+                f" INSERT INTO products ({columns}) SELECT {columns} FROM {_STAGING_TABLE}"
+                f" ON CONFLICT (code) DO UPDATE SET {updates}"
+                # xmax = 0 only on rows this statement inserted
+                f" RETURNING (xmax = 0) AS inserted"
+                f") SELECT count(*) FILTER (WHERE inserted) FROM upserted"
+            )
+        ).scalar_one()
+
+    def _upsert_many_executemany(self, products: List[Product]) -> int:
+        codes = [p.code for p in products]
+        existing = 0
+        for start in range(0, len(codes), _SQLITE_IN_BATCH):
+            existing += self.db.execute(
+                select(func.count())
+                .select_from(ProductModel)
+                .where(ProductModel.code.in_(codes[start : start + _SQLITE_IN_BATCH]))
+            ).scalar_one()
+        stmt = sqlite_insert(ProductModel.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProductModel.code],
+            set_={c: stmt.excluded[c] for c in _IMPORT_UPDATED_COLUMNS},
+        )
+        self.db.execute(
+            stmt,
+            [
+                {
+                    "id": p.id,
+                    "code": p.code,
+                    "description": p.description,
+                    "inventory_unit_id": p.inventory_unit,
+                    "packaging_unit_id": p.packaging_unit,
+                    "conversion_factor": p.conversion_factor,
+                    "is_active": p.is_active,
+                    "created_at": p.created_at,
+                    "updated_at": p.updated_at,
+                }
+                for p in products
+            ],
+        )
+        return len(products) - existing
 
     def _to_domain(self, model: ProductModel) -> Product:
         return Product(
@@ -0,0 +1,16 @@
+"""
+Core row to domain entity mapping for read paths.
+
+Read-only repository methods select plain columns instead of ORM instances: nothing is
+added to the session's identity map and each row becomes exactly one object, the
+entity. entity_columns() lists the model columns in the entity's field order, so a row
+maps positionally with Entity(*row). Write paths keep using ORM instances.
+"""
+
+from dataclasses import fields
+from typing import Any
+
+
+def entity_columns(entity: type, model: type, **column_for_field: str) -> tuple[Any, ...]:
+    """Model columns in the entity's field order; column_for_field maps renamed fields."""
+    return tuple(getattr(model, column_for_field.get(f.name, f.name)) for f in fields(entity))
@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import List, Optional, cast
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.entities.unit_conversion import UnitConversion
+from app.domain.exceptions.business_exceptions import NotFoundException
+from app.domain.repositories.unit_conversion_repository import UnitConversionRepository
+from app.infrastructure.models.unit_conversion_model import UnitConversionModel
+from app.infrastructure.repositories.row_mapping import entity_columns
+
+_CONVERSION_COLUMNS = entity_columns(UnitConversion, UnitConversionModel)
+
+
+class UnitConversionRepositoryImpl(UnitConversionRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def list_all(self) -> List[UnitConversion]:
+        rows = self.db.execute(
+            select(*_CONVERSION_COLUMNS).order_by(UnitConversionModel.created_at)
+        )
+        return [UnitConversion(*row) for row in rows]
+
+    def get_by_id(self, id: UUID) -> Optional[UnitConversion]:
+        row = self.db.execute(
+            select(*_CONVERSION_COLUMNS).where(UnitConversionModel.id == id)
+        ).first()
+        return UnitConversion(*row) if row is not None else None
+
+    def save(self, conversion: UnitConversion) -> UnitConversion:
+        model = UnitConversionModel(
+            id=conversion.id,
+            from_unit_id=conversion.from_unit_id,
+            to_unit_id=conversion.to_unit_id,
+            factor=conversion.factor,
+            product_id=conversion.product_id,
+            created_at=conversion.created_at,
+            updated_at=conversion.updated_at,
+        )
+        self.db.add(model)
+        self.db.commit()
+        self.db.refresh(model)
+        return self._to_domain(model)
+
+    def delete(self, id: UUID) -> None:
+        model = self.db.query(UnitConversionModel).filter(UnitConversionModel.id == id).first()
+        if not model:
+            raise NotFoundException("Unit conversion not found")
+        self.db.delete(model)
+        self.db.commit()
+
+    def _to_domain(self, model: UnitConversionModel) -> UnitConversion:
+        return UnitConversion(
+            id=cast(UUID, model.id),
+            from_unit_id=cast(UUID, model.from_unit_id),
+            to_unit_id=cast(UUID, model.to_unit_id),
+            factor=cast(float, model.factor),
+            product_id=cast(Optional[UUID], model.product_id),
+            created_at=cast(datetime, model.created_at),
+            updated_at=cast(datetime, model.updated_at),
+        )
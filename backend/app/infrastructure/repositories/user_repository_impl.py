@@ -1,16 +1,33 @@
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional, cast
 from uuid import UUID
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from app.application.use_cases.user_managment.dto import UserListDto, WarehouseRef
 from app.application.use_cases.user_managment.user_list_query import UserListQuery
 from app.domain.entities.user import User
 from app.domain.entities.user_role import UserRole
 from app.domain.repositories.user_repository import UserRepository
+from app.infrastructure.models.associations import user_warehouses
 from app.infrastructure.models.user_model import UserModel
 from app.infrastructure.models.warehouse_model import WarehouseModel
+from app.infrastructure.repositories.identity_map import cached_get, cached_get_many, remember
+
+_USER_COLUMNS = (
+    UserModel.id,
+    UserModel.identification,
+    UserModel.name,
+    UserModel.email,
+    UserModel.role,
+    UserModel.hashed_password,
+    UserModel.is_active,
+    UserModel.last_login,
+    UserModel.created_at,
+    UserModel.updated_at,
+)
 
 
 class UserRepositoryImpl(UserRepository, UserListQuery):
@@ -19,45 +36,25 @@ class UserRepositoryImpl(UserRepository, UserListQuery):
         self.db = db
 
     def get_by_email(self, email: str) -> Optional[User]:
-        model = (
-            self.db.query(UserModel)
-            .options(joinedload(UserModel.warehouses))
-            .filter(UserModel.email == email)
-            .first()
-        )
-        if not model:
-            return None
-        return self._to_domain(model)
+        users = self._select(UserModel.email == email)
+        return users[0] if users else None
 
     def get_by_id(self, user_id: UUID) -> Optional[User]:
-        model = (
-            self.db.query(UserModel)
-            .options(joinedload(UserModel.warehouses))
-            .filter(UserModel.id == user_id)
-            .first()
-        )
-        if not model:
-            return None
-        return self._to_domain(model)
+        def load() -> Optional[User]:
+            users = self._select(UserModel.id == user_id)
+            return users[0] if users else None
+
+        return cached_get(self.db, User, user_id, load)
 
     def get_by_ids(self, user_ids: list[UUID]) -> list[User]:
         if not user_ids:
             return []
-        models = (
-            self.db.query(UserModel)
-            .filter(UserModel.id.in_(user_ids))
-            .all()
+        return cached_get_many(
+            self.db, User, user_ids, lambda ids: self._select(UserModel.id.in_(ids)), lambda u: u.id
         )
-        return [self._to_domain(m) for m in models]
 
     def list_all(self) -> list[User]:
-        models = (
-            self.db.query(UserModel)
-            .options(joinedload(UserModel.warehouses))
-            .order_by(UserModel.created_at.desc())
-            .all()
-        )
-        return [self._to_domain(m) for m in models]
+        return self._select(order_by=UserModel.created_at.desc())
 
     def create(self, user: User) -> User:
         warehouse_models = (
@@ -81,7 +78,7 @@ class UserRepositoryImpl(UserRepository, UserListQuery):
         self.db.add(model)
         self.db.commit()
         self.db.refresh(model)
-        return self._to_domain(model)
+        return self._remember(model)
 
     def update(self, user: User) -> Optional[User]:
         model = self.db.query(UserModel).filter(UserModel.id == user.id).first()
@@ -102,45 +99,87 @@ class UserRepositoryImpl(UserRepository, UserListQuery):
         model.last_login = user.last_login  # type: ignore[assignment]
         self.db.commit()
         self.db.refresh(model)
-        return self._to_domain(model)
+        return self._remember(model)
 
     def count(self) -> int:
         return self.db.query(UserModel).count()
 
     def list_all_with_warehouses(self) -> list[UserListDto]:
-        models = (
-            self.db.query(UserModel)
-            .options(joinedload(UserModel.warehouses))
-            .order_by(UserModel.created_at.desc())
-            .all()
-        )
-        return [self._to_list_dto(m) for m in models]
+        return self._select_list_dtos(order_by=UserModel.created_at.desc())
 
     def get_by_id_for_display(self, user_id: UUID) -> UserListDto | None:
-        model = (
-            self.db.query(UserModel)
-            .options(joinedload(UserModel.warehouses))
-            .filter(UserModel.id == user_id)
-            .first()
-        )
-        if not model:
-            return None
-        return self._to_list_dto(model)
+        dtos = self._select_list_dtos(UserModel.id == user_id)
+        return dtos[0] if dtos else None
 
-    def _to_list_dto(self, model: UserModel) -> UserListDto:
-        warehouses = [
-            WarehouseRef(id=cast(UUID, w.id), name=cast(str, w.description))
-            for w in model.warehouses
+    def _select(self, *conditions, order_by=None) -> list[User]:
+        """Users as Core rows plus one query for their warehouse ids (no ORM instances)."""
+        rows = self.db.execute(select(*_USER_COLUMNS).where(*conditions).order_by(order_by)).all()
+        if not rows:
+            return []
+        warehouses: dict[UUID, list[UUID]] = defaultdict(list)
+        for user_id, warehouse_id in self.db.execute(
+            select(user_warehouses.c.user_id, user_warehouses.c.warehouse_id)
+            .join(UserModel, UserModel.id == user_warehouses.c.user_id)
+            .where(*conditions)
+        ):
+            warehouses[user_id].append(warehouse_id)
+        return [
+            User(
+                id=row.id,
+                identification=row.identification,
+                name=row.name,
+                email=row.email,
+                role=UserRole(row.role),
+                hashed_password=row.hashed_password,
+                warehouses=warehouses[row.id],
+                is_active=row.is_active,
+                last_login=row.last_login,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in rows
         ]
-        return UserListDto(
-            id=cast(UUID, model.id),
-            identification=cast(str, model.identification),
-            name=cast(str, model.name),
-            email=cast(str, model.email),
-            role=cast(str, model.role),
-            warehouses=warehouses,
-            is_active=cast(bool, model.is_active),
-        )
+
+    def _select_list_dtos(self, *conditions, order_by=None) -> list[UserListDto]:
+        rows = self.db.execute(
+            select(
+                UserModel.id,
+                UserModel.identification,
+                UserModel.name,
+                UserModel.email,
+                UserModel.role,
+                UserModel.is_active,
+            )
+            .where(*conditions)
+            .order_by(order_by)
+        ).all()
+        if not rows:
+            return []
+        warehouses: dict[UUID, list[WarehouseRef]] = defaultdict(list)
+        for user_id, warehouse_id, description in self.db.execute(
+            select(user_warehouses.c.user_id, WarehouseModel.id, WarehouseModel.description)
+            .join(UserModel, UserModel.id == user_warehouses.c.user_id)
+            .join(WarehouseModel, WarehouseModel.id == user_warehouses.c.warehouse_id)
+            .where(*conditions)
+        ):
+            warehouses[user_id].append(WarehouseRef(id=warehouse_id, name=description))
+        return [
+            UserListDto(
+                id=row.id,
+                identification=row.identification,
+                name=row.name,
+                email=row.email,
+                role=row.role,
+                warehouses=warehouses[row.id],
+                is_active=row.is_active,
+            )
+            for row in rows
+        ]
+
+    def _remember(self, model: UserModel) -> User:
+        user = self._to_domain(model)
+        remember(self.db, User, user.id, user)
+        return user
 
     def _to_domain(self, model: UserModel) -> User:
         return User(
@@ -2,12 +2,17 @@ from datetime import datetime
 from typing import List, Optional, cast
 from uuid import UUID
 
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 from app.domain.entities.warehouse import Warehouse
 from app.domain.entities.warehouse_status import WarehouseStatus
 from app.domain.repositories.warehouse_repository import WarehouseRepository
 from app.infrastructure.models.warehouse_model import WarehouseModel
+from app.infrastructure.repositories.identity_map import cached_get, remember
+from app.infrastructure.repositories.row_mapping import entity_columns
+
+_WAREHOUSE_COLUMNS = entity_columns(Warehouse, WarehouseModel)
 
 
 class WarehouseRepositoryImpl(WarehouseRepository):
@@ -18,37 +23,31 @@ class WarehouseRepositoryImpl(WarehouseRepository):
         return self.db.query(WarehouseModel).count()
 
     def get_by_id(self, warehouse_id: UUID) -> Optional[Warehouse]:
-        model = (
-            self.db.query(WarehouseModel)
-            .filter(WarehouseModel.id == warehouse_id)
-            .first()
-        )
-        if not model:
-            return None
-        return self._to_domain(model)
+        return cached_get(self.db, Warehouse, warehouse_id, lambda: self._load(warehouse_id))
+
+    def _load(self, warehouse_id: UUID) -> Optional[Warehouse]:
+        row = self.db.execute(
+            select(*_WAREHOUSE_COLUMNS).where(WarehouseModel.id == warehouse_id)
+        ).first()
+        return self._to_domain(row) if row is not None else None
 
     def list_active(self) -> List[Warehouse]:
-        models = (
-            self.db.query(WarehouseModel)
-            .filter(WarehouseModel.is_active == True)
-            .all()
-        )
-        return [self._to_domain(m) for m in models]
+        rows = self.db.execute(select(*_WAREHOUSE_COLUMNS).where(WarehouseModel.is_active == True))
+        return [self._to_domain(row) for row in rows]
 
     def list_all(self) -> List[Warehouse]:
-        models = self.db.query(WarehouseModel).order_by(WarehouseModel.code).all()
-        return [self._to_domain(m) for m in models]
+        rows = self.db.execute(select(*_WAREHOUSE_COLUMNS).order_by(WarehouseModel.code))
+        return [self._to_domain(row) for row in rows]
 
     def list_by_ids(self, warehouse_ids: List[UUID]) -> List[Warehouse]:
         if not warehouse_ids:
             return []
-        models = (
-            self.db.query(WarehouseModel)
-            .filter(WarehouseModel.id.in_(warehouse_ids))
+        rows = self.db.execute(
+            select(*_WAREHOUSE_COLUMNS)
+            .where(WarehouseModel.id.in_(warehouse_ids))
             .order_by(WarehouseModel.code)
-            .all()
         )
-        return [self._to_domain(m) for m in models]
+        return [self._to_domain(row) for row in rows]
 
     def save(self, warehouse: Warehouse) -> Warehouse:
         model = WarehouseModel(
@@ -64,9 +63,12 @@ class WarehouseRepositoryImpl(WarehouseRepository):
         self.db.add(model)
         self.db.commit()
         self.db.refresh(model)
-        return self._to_domain(model)
+        saved = self._to_domain(model)
+        remember(self.db, Warehouse, saved.id, saved)
+        return saved
 
-    def _to_domain(self, model: WarehouseModel) -> Warehouse:
+    def _to_domain(self, model: WarehouseModel | Row) -> Warehouse:
+        # ORM instance (writes) or a _WAREHOUSE_COLUMNS row (reads): status needs the enum
         return Warehouse(
             id=cast(UUID, model.id),
             code=cast(str, model.code),
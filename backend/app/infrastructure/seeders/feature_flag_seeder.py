@@ -11,36 +11,48 @@ from app.infrastructure.repositories.feature_flag_repository_impl import (
     FeatureFlagRepositoryImpl,
 )
 
-INITIAL_FLAG_KEY = "ENABLE_INVENTORY_DATE_RESTRICTION"
-INITIAL_FLAG_DESCRIPTION = "Restrict inventory session creation to first 3 days"
+# (key, description, enabled when first seeded)
+INITIAL_FLAGS = (
+    (
+        "ENABLE_INVENTORY_DATE_RESTRICTION",
+        "Restrict inventory session creation to first 3 days",
+        True,
+    ),
+    (
+        "ENABLE_INVENTORY_RECOUNT",
+        "Allow counting an already counted product again (recount=true)",
+        False,
+    ),
+)
 
 
 def _seed_feature_flags_sync() -> None:
-    """Insert ENABLE_INVENTORY_DATE_RESTRICTION if it does not already exist."""
+    """Insert each initial flag that does not already exist."""
     db = SessionLocal()
     try:
         repo = FeatureFlagRepositoryImpl(db)
-        existing = repo.get_by_key(INITIAL_FLAG_KEY)
-        if existing:
+        for key, description, enabled in INITIAL_FLAGS:
+            existing = repo.get_by_key(key)
+            if existing:
+                logger.info(
+                    "Feature flag already exists, skipping seed",
+                    extra={"event": "feature_flag_seed_skipped", "key": key},
+                )
+                continue
+            now = datetime.now(timezone.utc)
+            flag = FeatureFlag(
+                id=uuid4(),
+                key=key,
+                enabled=enabled,
+                description=description,
+                created_at=now,
+                updated_at=now,
+            )
+            repo.save(flag)
             logger.info(
-                "Feature flag already exists, skipping seed",
-                extra={"event": "feature_flag_seed_skipped", "key": INITIAL_FLAG_KEY},
+                "Feature flag seeded",
+                extra={"event": "feature_flag_seeded", "key": key},
             )
-            return
-        now = datetime.now(timezone.utc)
-        flag = FeatureFlag(
-            id=uuid4(),
-            key=INITIAL_FLAG_KEY,
-            enabled=True,
-            description=INITIAL_FLAG_DESCRIPTION,
-            created_at=now,
-            updated_at=now,
-        )
-        repo.save(flag)
-        logger.info(
-            "Feature flag seeded",
-            extra={"event": "feature_flag_seeded", "key": INITIAL_FLAG_KEY},
-        )
     finally:
         db.close()
 
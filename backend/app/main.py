@@ -1,7 +1,9 @@
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import cast
 
+from anyio import to_thread
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,6 +13,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.types import ExceptionHandler
 
 from app.domain.exceptions.business_exceptions import BusinessRuleViolation, NotFoundException
+from app.infrastructure.database.database import DB_POOL_CAPACITY, engine
+from app.infrastructure.database.product_search_index import ensure_product_search_index
 from app.infrastructure.logging.logger import logger
 from app.infrastructure.seeders.feature_flag_seeder import seed_feature_flags_if_missing
 from app.infrastructure.seeders.master_data_seeder import seed_master_data_if_empty
@@ -22,8 +26,24 @@ from app.presentation.exception_handlers import (
     business_rule_exception_handler,
     not_found_exception_handler,
 )
+from app.presentation.middleware.admission_middleware import (
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_QUEUE_TIMEOUT_SECONDS,
+    DEFAULT_RETRY_AFTER_SECONDS,
+    AdmissionMiddleware,
+)
+from app.presentation.middleware.compression_middleware import (
+    DEFAULT_ENCODINGS,
+    DEFAULT_LEVELS,
+    DEFAULT_MINIMUM_SIZE,
+    CompressionMiddleware,
+)
 from app.presentation.middleware.logging_middleware import LoggingMiddleware
+from app.presentation.responses import ORJSONResponse
+from app.presentation.routes.admission_routes import router as admission_router
 from app.presentation.routes.auth_routes import router as auth_router
+from app.presentation.routes.cache_routes import router as cache_router
+from app.presentation.routes.compression_routes import router as compression_router
 from app.presentation.routes.feature_flag_routes import router as feature_flag_router
 from app.presentation.routes.inventory_session_routes import router as inventory_session_router
 from app.presentation.routes.user_managment_routes import router as user_managment_router
@@ -31,6 +51,8 @@ from app.presentation.routes.warehouse_routes import router as warehouse_router
 from app.presentation.routes.measurement_unit_routes import router as measurement_unit_router
 from app.presentation.routes.product_routes import router as product_router
 from app.presentation.routes.mock_routes import router as mock_router
+from app.presentation.routes.report_routes import router as report_router
+from app.presentation.routes.unit_conversion_routes import router as unit_conversion_router
 
 
 @asynccontextmanager
@@ -62,6 +84,19 @@ async def lifespan(app: FastAPI):
         "Startup: feature flags seed completed",
         extra={"event": "feature_flags_seed_completed"},
     )
+    await asyncio.to_thread(ensure_product_search_index, engine)
+    if os.getenv("THREADPOOL_SIZE"):
+        # Sync routes and dependencies share this limiter (AnyIO default: 40 threads)
+        to_thread.current_default_thread_limiter().total_tokens = int(os.environ["THREADPOOL_SIZE"])
+    logger.info(
+        "Startup: admission control configured",
+        extra={
+            "event": "admission_configured",
+            "max_concurrency": _admission_max_concurrency,
+            "threadpool_size": to_thread.current_default_thread_limiter().total_tokens,
+            "db_pool_capacity": DB_POOL_CAPACITY,
+        },
+    )
     yield
 
 
@@ -69,6 +104,22 @@ app = FastAPI(
     title="La Soberana API",
     description="Backend API for La Soberana",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Admission control: at most ADMISSION_MAX_CONCURRENCY requests in flight (default: the DB
+# pool capacity), a bounded priority queue, 503 + Retry-After beyond it. Added before CORS so
+# it runs inside it and shed responses still carry CORS headers.
+_admission_limit = os.getenv("ADMISSION_MAX_CONCURRENCY", "").strip()
+# "0" turns admission control off
+_admission_max_concurrency = int(_admission_limit) if _admission_limit else DB_POOL_CAPACITY
+app.add_middleware(
+    AdmissionMiddleware,  # type: ignore[arg-type]
+    max_concurrency=_admission_max_concurrency,
+    queue_size=int(os.getenv("ADMISSION_QUEUE_SIZE") or DEFAULT_QUEUE_SIZE),
+    queue_timeout=float(os.getenv("ADMISSION_QUEUE_TIMEOUT_SECONDS") or DEFAULT_QUEUE_TIMEOUT_SECONDS),
+    low_priority_limit=int(os.getenv("ADMISSION_LOW_PRIORITY_LIMIT") or 0) or None,
+    retry_after=int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS") or DEFAULT_RETRY_AFTER_SECONDS),
 )
 
 # CORS: allow frontend (and other configured origins) to call the API
@@ -79,6 +130,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Sync-Watermark", "Idempotent-Replayed", "Retry-After"],
 )
 
 
@@ -93,6 +145,18 @@ app.add_exception_handler(
 app.add_exception_handler(
     NotFoundException, cast(ExceptionHandler, not_found_exception_handler)
 )
+# Negotiated zstd/br/gzip for buffered JSON/text bodies; streams (SSE, CSV) are left alone
+_compression_encodings = os.getenv("COMPRESSION_ENCODINGS", ",".join(DEFAULT_ENCODINGS))
+app.add_middleware(
+    CompressionMiddleware,  # type: ignore[arg-type]
+    minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE") or DEFAULT_MINIMUM_SIZE),
+    encodings=[e.strip().lower() for e in _compression_encodings.split(",") if e.strip()],
+    levels={
+        "gzip": int(os.getenv("COMPRESSION_GZIP_LEVEL") or DEFAULT_LEVELS["gzip"]),
+        "br": int(os.getenv("COMPRESSION_BROTLI_LEVEL") or DEFAULT_LEVELS["br"]),
+        "zstd": int(os.getenv("COMPRESSION_ZSTD_LEVEL") or DEFAULT_LEVELS["zstd"]),
+    },
+)
 app.add_middleware(LoggingMiddleware)  # type: ignore[arg-type]
 
 app.include_router(auth_router)
@@ -101,5 +165,10 @@ app.include_router(inventory_session_router)
 app.include_router(user_managment_router)
 app.include_router(warehouse_router)
 app.include_router(measurement_unit_router)
+app.include_router(unit_conversion_router)
 app.include_router(product_router)
+app.include_router(report_router)
+app.include_router(cache_router)
+app.include_router(compression_router)
+app.include_router(admission_router)
 app.include_router(mock_router)
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose.exceptions import JWTError  # type: ignore[import-untyped]
 
@@ -18,7 +18,25 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
-    token = credentials.credentials
+    return _decode(credentials.credentials)
+
+
+def get_current_user_or_query_token(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    access_token: Annotated[str | None, Query()] = None,
+) -> dict:
+    """Like get_current_user, but also accepts ?access_token= (EventSource cannot set headers)."""
+    if credentials is not None:
+        return _decode(credentials.credentials)
+    if access_token:
+        return _decode(access_token)
+    raise HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+    )
+
+
+def _decode(token: str) -> dict:
     try:
         payload = JWTService.decode_token(token)
         return payload
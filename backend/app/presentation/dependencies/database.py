@@ -3,10 +3,13 @@ from collections.abc import Generator
 from sqlalchemy.orm import Session
 
 from app.infrastructure.database.database import SessionLocal
+from app.infrastructure.repositories.identity_map import enable_identity_map
 
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
+    # Repositories built on this Session share one entity cache for the request
+    enable_identity_map(db)
     try:
         yield db
     finally:
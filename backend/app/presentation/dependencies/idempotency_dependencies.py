@@ -0,0 +1,86 @@
+import hashlib
+import json
+from collections.abc import Generator
+from typing import Annotated, Any
+
+from fastapi import Header, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from app.application.services.idempotency_store import IdempotencyStore, StoredResponse
+from app.infrastructure.idempotency import get_idempotency_store
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotentRequest:
+    """One request's claim on its Idempotency-Key; does nothing when the client sent none."""
+
+    def __init__(self, store: IdempotencyStore, key: str | None):
+        self.store = store
+        self.key = key
+        self._claimed: str | None = None
+
+    def replay(self, scope: str, payload: Any) -> Response | None:
+        """
+        Stored response when this is a replay, None when the request should run.
+        scope keeps keys of different users and endpoints apart.
+        """
+        if self.key is None:
+            return None
+        scoped_key = f"{scope}:{self.key}"
+        fingerprint = hashlib.blake2b(
+            json.dumps(jsonable_encoder(payload), sort_keys=True).encode(), digest_size=16
+        ).digest()
+        record = self.store.claim(scoped_key, fingerprint)
+        if record is None:
+            self._claimed = scoped_key
+            return None
+        if record.fingerprint != fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request",
+            )
+        if record.response is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A request with this Idempotency-Key is still being processed",
+                headers={"Retry-After": "1"},
+            )
+        return Response(
+            content=record.response.body,
+            status_code=record.response.status_code,
+            media_type="application/json",
+            headers={REPLAYED_HEADER: "true"},
+        )
+
+    def complete(self, content: Any, status_code: int = status.HTTP_200_OK) -> Any:
+        """Store the response for replays and hand it back unchanged."""
+        if self._claimed is not None:
+            body = JSONResponse(jsonable_encoder(content)).body
+            self.store.complete(self._claimed, StoredResponse(status_code, bytes(body)))
+            self._claimed = None
+        return content
+
+    def release(self) -> None:
+        if self._claimed is not None:
+            self.store.release(self._claimed)
+            self._claimed = None
+
+
+def get_idempotent_request(
+    idempotency_key: Annotated[str | None, Header(alias=IDEMPOTENCY_KEY_HEADER)] = None,
+) -> Generator[IdempotentRequest, None, None]:
+    """Optional Idempotency-Key header; a claim the route did not complete is released."""
+    if idempotency_key is not None and not 0 < len(idempotency_key) <= MAX_KEY_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{IDEMPOTENCY_KEY_HEADER} must be 1-{MAX_KEY_LENGTH} characters",
+        )
+    idempotent = IdempotentRequest(get_idempotency_store(), idempotency_key)
+    try:
+        yield idempotent
+    finally:
+        idempotent.release()
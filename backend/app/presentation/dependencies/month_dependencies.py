@@ -0,0 +1,15 @@
+from datetime import datetime, timezone
+
+from fastapi import HTTPException, status
+
+
+def parse_month(month: str) -> datetime:
+    """Parse YYYY-MM into the first day of the month (UTC); 400 on bad input."""
+    try:
+        y, m = (int(p) for p in month.strip().split("-"))
+        return datetime(y, m, 1, tzinfo=timezone.utc)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="month must be YYYY-MM",
+        )
@@ -5,10 +5,10 @@ from app.infrastructure.logging.logger import logger
 from app.presentation.dependencies.auth_dependencies import get_current_user
 
 
-def require_roles(allowed_roles: list[UserRole]):
+def require_roles(allowed_roles: list[UserRole], user_dependency=get_current_user):
     """RBAC dependency: requires current user's role to be in allowed_roles."""
 
-    def role_checker(current_user: dict = Depends(get_current_user)):
+    def role_checker(current_user: dict = Depends(user_dependency)):
         user_role_str = current_user.get("role")
         allowed_values = [r.value for r in allowed_roles]
 
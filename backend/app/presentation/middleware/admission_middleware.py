@@ -0,0 +1,273 @@
+"""
+Admission control and load shedding in front of the sync routes.
+
+Sync endpoints run in AnyIO's thread pool and each one holds a pooled DB connection
+through get_db, so past the pool capacity extra requests only park a thread waiting for a
+connection until the client gives up. This middleware admits at most max_concurrency
+requests at once (default: the DB pool capacity), parks up to queue_size more in a
+priority queue for at most queue_timeout seconds, and answers the rest right away with
+503 and Retry-After.
+
+Count registration goes first (HIGH), reports, CSV exports and bulk imports last (LOW,
+also capped at low_priority_limit concurrent requests so they never take every slot).
+When the queue is full a new request displaces the newest waiter of a lower priority.
+Health checks, API docs and SSE streams (which give their connection back right away)
+are never queued. Counters are kept in admission_metrics.
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import threading
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Sequence
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.infrastructure.logging.logger import logger
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_QUEUE_TIMEOUT_SECONDS = 5.0
+DEFAULT_RETRY_AFTER_SECONDS = 2
+
+
+class Priority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+# (method or None for any, path pattern, priority); first match wins, default NORMAL
+PRIORITY_RULES: Sequence[tuple[str | None, re.Pattern, Priority | None]] = (
+    (None, re.compile(r"^/(health|docs|redoc|openapi\.json)$"), None),
+    ("GET", re.compile(r"^/inventory-sessions/[^/]+/events$"), None),
+    ("POST", re.compile(r"^/inventory-sessions/[^/]+/counts(/by-code)?$"), Priority.HIGH),
+    (None, re.compile(r"^/reports/"), Priority.LOW),
+    ("POST", re.compile(r"^/products/import$"), Priority.LOW),
+)
+
+
+def classify(method: str, path: str) -> Priority | None:
+    """Priority of a request, or None for requests admitted without a slot."""
+    for rule_method, pattern, priority in PRIORITY_RULES:
+        if (rule_method is None or rule_method == method) and pattern.match(path):
+            return priority
+    return Priority.NORMAL
+
+
+@dataclass
+class PriorityAdmissionStats:
+    admitted: int = 0
+    queued: int = 0  # Admitted after waiting in the queue
+    shed_queue_full: int = 0
+    shed_timeout: int = 0
+    wait_seconds: float = 0.0
+
+
+@dataclass
+class AdmissionSnapshot:
+    in_flight: int
+    waiting: int
+    by_priority: dict[str, PriorityAdmissionStats] = field(default_factory=dict)
+
+
+class AdmissionMetrics:
+    """Per-priority admission counters for this process."""
+
+    def __init__(self) -> None:
+        self._stats = {p: PriorityAdmissionStats() for p in Priority}
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.waiting = 0
+
+    def admitted(self, priority: Priority, waited: float | None) -> None:
+        with self._lock:
+            stats = self._stats[priority]
+            stats.admitted += 1
+            if waited is not None:
+                stats.queued += 1
+                stats.wait_seconds += waited
+
+    def shed(self, priority: Priority, reason: str, waited: float = 0.0) -> None:
+        with self._lock:
+            stats = self._stats[priority]
+            if reason == "timeout":
+                stats.shed_timeout += 1
+            else:
+                stats.shed_queue_full += 1
+            stats.wait_seconds += waited
+
+    def snapshot(self) -> AdmissionSnapshot:
+        with self._lock:
+            return AdmissionSnapshot(
+                in_flight=self.in_flight,
+                waiting=self.waiting,
+                by_priority={p.name: PriorityAdmissionStats(**vars(s)) for p, s in self._stats.items()},
+            )
+
+
+admission_metrics = AdmissionMetrics()
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: Priority
+    seq: int
+    future: asyncio.Future = field(compare=False)
+
+
+class AdmissionController:
+    """
+    Slots and the priority wait queue. Runs on the event loop only: a released slot is
+    handed straight to the best waiter, so arrivals never overtake the queue.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT_SECONDS,
+        low_priority_limit: int | None = None,
+        metrics: AdmissionMetrics | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.low_priority_limit = low_priority_limit or max(1, max_concurrency // 3)
+        self.metrics = metrics or admission_metrics
+        self._in_flight = 0
+        self._low_in_flight = 0
+        self._waiters: list[_Waiter] = []  # Heap; cancelled or displaced waiters are skipped lazily
+        self._waiting = 0
+        self._seq = itertools.count()
+
+    def _can_run(self, priority: Priority) -> bool:
+        if self._in_flight >= self.max_concurrency:
+            return False
+        return priority != Priority.LOW or self._low_in_flight < self.low_priority_limit
+
+    def _take(self, priority: Priority) -> None:
+        self._in_flight += 1
+        if priority == Priority.LOW:
+            self._low_in_flight += 1
+        self.metrics.in_flight = self._in_flight
+
+    async def acquire(self, priority: Priority) -> bool:
+        """True once a slot is held; False if shed (queue full or waited too long)."""
+        if self._can_run(priority):
+            self._take(priority)
+            self.metrics.admitted(priority, None)
+            return True
+        if self._waiting >= self.queue_size and not self._displace(priority):
+            self.metrics.shed(priority, "queue_full")
+            return False
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._seq), loop.create_future())
+        heapq.heappush(self._waiters, waiter)
+        self._set_waiting(self._waiting + 1)
+        start = loop.time()
+        try:
+            admitted = await asyncio.wait_for(waiter.future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            # wait_for cancelled the future, so _grant() will skip this waiter
+            self._set_waiting(self._waiting - 1)
+            self.metrics.shed(priority, "timeout", loop.time() - start)
+            return False
+        except asyncio.CancelledError:
+            if waiter.future.cancelled():
+                self._set_waiting(self._waiting - 1)
+            elif waiter.future.result():
+                self.release(priority)  # Granted just as the request was cancelled
+            raise
+        if admitted:
+            self.metrics.admitted(priority, loop.time() - start)
+        else:
+            self.metrics.shed(priority, "queue_full", loop.time() - start)
+        return admitted
+
+    def release(self, priority: Priority) -> None:
+        self._in_flight -= 1
+        if priority == Priority.LOW:
+            self._low_in_flight -= 1
+        self.metrics.in_flight = self._in_flight
+        self._grant()
+
+    def _grant(self) -> None:
+        # The heap is ordered by priority: once the head cannot run (all slots taken, or
+        # it is LOW at its cap with only LOW behind it), nobody behind it can either
+        while self._waiters:
+            waiter = self._waiters[0]
+            if waiter.future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_run(waiter.priority):
+                return
+            heapq.heappop(self._waiters)
+            self._take(waiter.priority)
+            self._set_waiting(self._waiting - 1)
+            waiter.future.set_result(True)
+
+    def _displace(self, priority: Priority) -> bool:
+        """Shed the newest live waiter of a lower priority to make room; False if none."""
+        live = [w for w in self._waiters if not w.future.done() and w.priority > priority]
+        if not live:
+            return False
+        victim = max(live)
+        victim.future.set_result(False)
+        self._set_waiting(self._waiting - 1)
+        return True
+
+    def _set_waiting(self, waiting: int) -> None:
+        self._waiting = waiting
+        self.metrics.waiting = waiting
+
+
+class AdmissionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrency: int,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT_SECONDS,
+        low_priority_limit: int | None = None,
+        retry_after: int = DEFAULT_RETRY_AFTER_SECONDS,
+        metrics: AdmissionMetrics | None = None,
+    ):
+        self.app = app
+        self.controller = AdmissionController(
+            max_concurrency, queue_size, queue_timeout, low_priority_limit, metrics
+        )
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.controller.max_concurrency <= 0:
+            await self.app(scope, receive, send)
+            return
+        priority = classify(scope["method"], scope["path"])
+        if priority is None:
+            await self.app(scope, receive, send)
+            return
+        if not await self.controller.acquire(priority):
+            logger.warning(
+                "Request shed: server saturated",
+                extra={
+                    "event": "request_shed",
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "priority": priority.name,
+                },
+            )
+            response = JSONResponse(
+                {"detail": "Server is busy, retry shortly."},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(priority)
@@ -0,0 +1,214 @@
+"""
+Negotiated response compression (zstd, br, gzip).
+
+The encoding is the first of `encodings` the client accepts with q > 0 that this process
+can produce: gzip always, br with the brotli package, zstd with zstandard. Only buffered
+(single-chunk) bodies of at least minimum_size bytes with a text-like content type are
+compressed; streaming responses (SSE, CSV exports) and bodies that already carry
+Content-Encoding go out untouched. Large bodies are compressed in a worker thread so the
+event loop keeps serving other requests meanwhile.
+
+Per-endpoint bytes in/out and compression CPU time are kept in compression_metrics.
+"""
+
+import gzip
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: br is simply not offered
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # optional: zstd is simply not offered
+    zstandard = None
+
+DEFAULT_MINIMUM_SIZE = 1024
+DEFAULT_ENCODINGS = ("zstd", "br", "gzip")
+DEFAULT_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+# Bodies at least this large are compressed off the event loop (zlib/brotli/zstd drop the GIL)
+OFFLOAD_BYTES = 256 * 1024
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+EXCLUDED_TYPES = ("text/event-stream",)
+
+
+def _gzip(body: bytes, level: int) -> bytes:
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def _brotli(body: bytes, level: int) -> bytes:
+    return brotli.compress(body, quality=level)
+
+
+def _zstd(body: bytes, level: int) -> bytes:
+    # ZstdCompressor is not thread-safe; one per body is cheap next to the work itself
+    return zstandard.ZstdCompressor(level=level).compress(body)
+
+
+COMPRESSORS: dict[str, Callable[[bytes, int], bytes]] = {"gzip": _gzip}
+if brotli is not None:
+    COMPRESSORS["br"] = _brotli
+if zstandard is not None:
+    COMPRESSORS["zstd"] = _zstd
+
+
+def choose_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """Highest-q encoding the client accepts; ties go to the order of encodings."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+@dataclass
+class EndpointCompressionStats:
+    responses: int = 0  # Eligible responses (buffered, compressible type, >= minimum size)
+    compressed: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_in - self.bytes_out
+
+    @property
+    def saved_ratio(self) -> float:
+        return self.bytes_saved / self.bytes_in if self.bytes_in else 0.0
+
+
+class CompressionMetrics:
+    """Per-endpoint ("METHOD /route/{param}") compression counters for this process."""
+
+    def __init__(self) -> None:
+        self._stats: dict[str, EndpointCompressionStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, bytes_in: int, bytes_out: int, cpu_seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointCompressionStats())
+            stats.responses += 1
+            stats.compressed += bytes_out < bytes_in
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.cpu_seconds += cpu_seconds
+
+    def snapshot(self) -> dict[str, EndpointCompressionStats]:
+        with self._lock:
+            return {k: EndpointCompressionStats(**vars(v)) for k, v in self._stats.items()}
+
+
+compression_metrics = CompressionMetrics()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        encodings: Sequence[str] = DEFAULT_ENCODINGS,
+        levels: dict[str, int] | None = None,
+        metrics: CompressionMetrics | None = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = [e for e in encodings if e in COMPRESSORS]
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self.metrics = metrics or compression_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        start: Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or content_type.startswith(EXCLUDED_TYPES)
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message  # Held until the first body chunk shows the size
+                return
+            passthrough = True
+            assert start is not None
+            body = message.get("body", b"")
+            if (
+                message["type"] != "http.response.body"
+                or message.get("more_body", False)
+                or len(body) < self.minimum_size
+            ):
+                await send(start)
+                await send(message)
+                return
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            compressed, cpu_seconds = body, 0.0
+            if encoding is not None:
+                compressed, cpu_seconds = await self._compress(encoding, body)
+            if len(compressed) < len(body):
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(compressed))
+                message = {**message, "body": compressed}
+            else:
+                compressed = body
+            route = scope.get("route")
+            endpoint = f"{scope['method']} {getattr(route, 'path', '<unmatched>')}"
+            self.metrics.record(endpoint, len(body), len(compressed), cpu_seconds)
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+    async def _compress(self, encoding: str, body: bytes) -> tuple[bytes, float]:
+        compress, level = COMPRESSORS[encoding], self.levels[encoding]
+
+        def run() -> tuple[bytes, float]:
+            cpu_start = time.thread_time()
+            return compress(body, level), time.thread_time() - cpu_start
+
+        if len(body) >= OFFLOAD_BYTES:
+            return await run_in_threadpool(run)
+        return run()
@@ -0,0 +1,33 @@
+"""
+JSON rendering with orjson.
+
+ORJSONResponse is the app's default response class: endpoints that return Pydantic
+models still go through response_model, only the final json.dumps is replaced.
+
+Large lists take the trusted path instead: rows are plain dicts built from data the API
+validated when it was written, and returning trusted_json(rows) skips the second
+validation and serialization pass FastAPI runs for response_model. The decorator keeps
+response_model so OpenAPI is unchanged; row builders must stay in step with the schema.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# UUID, datetime, date and dataclasses are native to orjson; "Z" for UTC like Pydantic
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+def trusted_json(rows: Any, headers: dict[str, str] | None = None) -> ORJSONResponse:
+    """Response for already-valid rows (dicts or dataclasses), bypassing response_model."""
+    return ORJSONResponse(content=rows, headers=headers)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+
+from app.domain.entities.user_role import UserRole
+from app.presentation.dependencies.role_dependencies import require_roles
+from app.presentation.middleware.admission_middleware import admission_metrics
+
+router = APIRouter(prefix="/admission", tags=["Admission"])
+
+
+@router.get("/metrics")
+def get_admission_metrics(
+    _current_user=Depends(require_roles([UserRole.ADMIN])),
+) -> dict:
+    """Requests in flight and queued, and admitted/shed counts per priority for this worker."""
+    snapshot = admission_metrics.snapshot()
+    return {
+        "in_flight": snapshot.in_flight,
+        "waiting": snapshot.waiting,
+        "by_priority": {
+            priority: {
+                "admitted": s.admitted,
+                "queued": s.queued,
+                "shed_queue_full": s.shed_queue_full,
+                "shed_timeout": s.shed_timeout,
+                "wait_ms_total": round(s.wait_seconds * 1000, 2),
+            }
+            for priority, s in snapshot.by_priority.items()
+        },
+    }
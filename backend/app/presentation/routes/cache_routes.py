@@ -0,0 +1,20 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends
+
+from app.domain.entities.user_role import UserRole
+from app.infrastructure.cache import cache_metrics
+from app.presentation.dependencies.role_dependencies import require_roles
+
+router = APIRouter(prefix="/cache", tags=["Cache"])
+
+
+@router.get("/metrics")
+def get_cache_metrics(
+    _current_user=Depends(require_roles([UserRole.ADMIN])),
+) -> dict:
+    """Hit/miss counters per cache namespace for this worker (since startup)."""
+    return {
+        namespace: {**asdict(m), "hit_ratio": round(m.hit_ratio, 4)}
+        for namespace, m in cache_metrics().items()
+    }
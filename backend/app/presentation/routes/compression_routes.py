@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+
+from app.domain.entities.user_role import UserRole
+from app.presentation.dependencies.role_dependencies import require_roles
+from app.presentation.middleware.compression_middleware import compression_metrics
+
+router = APIRouter(prefix="/compression", tags=["Compression"])
+
+
+@router.get("/metrics")
+def get_compression_metrics(
+    _current_user=Depends(require_roles([UserRole.ADMIN])),
+) -> dict:
+    """Bytes saved and compression CPU per endpoint for this worker (since startup)."""
+    return {
+        endpoint: {
+            "responses": s.responses,
+            "compressed": s.compressed,
+            "bytes_in": s.bytes_in,
+            "bytes_out": s.bytes_out,
+            "bytes_saved": s.bytes_saved,
+            "saved_ratio": round(s.saved_ratio, 4),
+            "cpu_ms": round(s.cpu_seconds * 1000, 2),
+            "cpu_us_per_kb": round(s.cpu_seconds * 1e6 / (s.bytes_in / 1024), 2) if s.bytes_in else 0.0,
+        }
+        for endpoint, s in sorted(compression_metrics.snapshot().items())
+    }
@@ -1,17 +1,27 @@
+import asyncio
+import json
+import os
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.application.services.feature_flag_service import FeatureFlagService
+from app.application.services.session_event_publisher import SESSION_CLOSED, SessionEvent
 from app.application.use_cases.create_inventory_session_use_case import (
     CreateInventorySessionUseCase,
 )
 from app.application.use_cases.inventory import (
+    GetSessionSummaryUseCase,
     ListInventoryCountsUseCase,
+    RegisterInventoryCountByCodeUseCase,
     RegisterInventoryCountUseCase,
+    RegisteredCount,
 )
+from app.application.use_cases.inventory.list_inventory_counts_use_case import next_watermark
 from app.application.use_cases.add_products_to_session_use_case import (
     AddProductsToSessionUseCase,
 )
@@ -25,6 +35,9 @@ from app.application.use_cases.list_session_products_from_counts_use_case import
     ListSessionProductsFromCountsUseCase,
 )
 from app.domain.entities.user_role import UserRole
+from app.infrastructure.cache import get_cache
+from app.infrastructure.catalog import get_product_code_index, get_unit_conversion_table
+from app.infrastructure.events import SessionEventSubscription, get_session_event_broker
 from app.infrastructure.logging.logger import logger
 from app.infrastructure.repositories.feature_flag_repository_impl import (
     FeatureFlagRepositoryImpl,
@@ -35,6 +48,9 @@ from app.infrastructure.repositories.inventory_count_repository_impl import (
 from app.infrastructure.repositories.inventory_session_repository_impl import (
     InventorySessionRepositoryImpl,
 )
+from app.infrastructure.repositories.inventory_session_snapshot_repository_impl import (
+    InventorySessionSnapshotRepositoryImpl,
+)
 from app.infrastructure.repositories.product_repository_impl import (
     ProductRepositoryImpl,
 )
@@ -44,10 +60,17 @@ from app.infrastructure.repositories.warehouse_repository_impl import (
 from app.infrastructure.repositories.user_repository_impl import (
     UserRepositoryImpl,
 )
+from app.presentation.dependencies.auth_dependencies import get_current_user_or_query_token
 from app.presentation.dependencies.database import get_db
+from app.presentation.dependencies.idempotency_dependencies import (
+    IdempotentRequest,
+    get_idempotent_request,
+)
 from app.presentation.dependencies.role_dependencies import require_roles
 from app.presentation.dependencies.warehouse_dependencies import assert_warehouse_access
+from app.presentation.responses import dump_json, trusted_json
 from app.presentation.schemas.inventory_count_schema import (
+    CreateInventoryCountByCodeRequest,
     CreateInventoryCountRequest,
     InventoryCountResponse,
     MeasureUnitSummary,
@@ -61,10 +84,23 @@ from app.presentation.schemas.inventory_session_schema import (
     CreateInventorySessionRequest,
     InventorySessionListResponse,
     InventorySessionResponse,
+    InventorySessionSummaryResponse,
+    SessionUnitTotalResponse,
 )
 
 router = APIRouter(prefix="/inventory-sessions", tags=["Inventory Sessions"])
 
+SYNC_WATERMARK_HEADER = "X-Sync-Watermark"
+
+# SSE comment line interval; keeps proxies from closing idle streams
+SSE_HEARTBEAT_SECONDS = 15
+
+# GET / responses are cached per normalized query and dropped by the writes below
+# (create, add products, new count rows, close). The TTL bounds what writes cannot
+# invalidate: renamed warehouses/users, and other workers when CACHE_BACKEND=memory.
+SESSION_LIST_CACHE_TTL_SECONDS = float(os.getenv("SESSION_LIST_CACHE_TTL_SECONDS") or 30)
+_session_list_cache = get_cache("session-list", SESSION_LIST_CACHE_TTL_SECONDS)
+
 
 @router.get("/", response_model=list[InventorySessionListResponse])
 def list_inventory_sessions(
@@ -89,35 +125,67 @@ def list_inventory_sessions(
         UserRole.PROCESS_LEADER.value,
     ):
         warehouse_ids = [UUID(w) for w in current_user.get("warehouses", [])]
-    session_repo = InventorySessionRepositoryImpl(db)
-    warehouse_repo = WarehouseRepositoryImpl(db)
-    count_repo = InventoryCountRepositoryImpl(db)
-    user_repo = UserRepositoryImpl(db)
-    use_case = ListInventorySessionsUseCase(
-        session_repo, warehouse_repo, count_repo, user_repo
+    status = status if status in ("open", "closed") else None
+
+    def load() -> bytes:
+        session_repo = InventorySessionRepositoryImpl(db)
+        warehouse_repo = WarehouseRepositoryImpl(db)
+        count_repo = InventoryCountRepositoryImpl(db)
+        user_repo = UserRepositoryImpl(db)
+        snapshot_repo = InventorySessionSnapshotRepositoryImpl(db)
+        use_case = ListInventorySessionsUseCase(
+            session_repo, warehouse_repo, count_repo, user_repo, snapshot_repo
+        )
+        summaries = use_case.execute(
+            warehouse_id=warehouse_id,
+            warehouse_ids=warehouse_ids,
+            month=month_dt,
+            status=status,
+        )
+        return dump_json(
+            [
+                {
+                    "id": s.id,
+                    "warehouse_id": s.warehouse_id,
+                    "warehouse_description": s.warehouse_description,
+                    "month": s.month,
+                    "count_number": s.count_number,
+                    "created_by_id": s.created_by_id,
+                    "created_by_name": s.created_by_name,
+                    "created_at": s.created_at,
+                    "closed_at": s.closed_at,
+                    "status": "CLOSED" if s.closed_at else "OPEN",
+                    "products_count": s.products_count,
+                }
+                for s in summaries
+            ]
+        )
+
+    # Same answer for every caller with the same filters and warehouse set
+    allowed = ",".join(sorted(str(w) for w in warehouse_ids)) if warehouse_ids is not None else "*"
+    key = "|".join(
+        [
+            str(warehouse_id) if warehouse_id else "*",
+            allowed,
+            month_dt.strftime("%Y-%m") if month_dt else "*",
+            status or "*",
+        ]
     )
-    summaries = use_case.execute(
-        warehouse_id=warehouse_id,
-        warehouse_ids=warehouse_ids,
-        month=month_dt,
-        status=status,
+    if warehouse_id is not None:
+        scope = [str(warehouse_id)]
+    elif warehouse_ids is not None:
+        scope = [str(w) for w in warehouse_ids]
+    else:
+        scope = ["*"]
+    body = _session_list_cache.get_or_load(
+        key, load, tags=[f"warehouse:{w}" for w in scope]
     )
-    return [
-        InventorySessionListResponse(
-            id=s.id,
-            warehouse_id=s.warehouse_id,
-            warehouse_description=s.warehouse_description,
-            month=s.month,
-            count_number=s.count_number,
-            created_by_id=s.created_by_id,
-            created_by_name=s.created_by_name,
-            created_at=s.created_at,
-            closed_at=s.closed_at,
-            status="CLOSED" if s.closed_at else "OPEN",
-            products_count=s.products_count,
-        )
-        for s in summaries
-    ]
+    return Response(content=body, media_type="application/json")
+
+
+def _invalidate_session_list(warehouse_id: UUID) -> None:
+    """Drop cached lists that can include this warehouse's sessions."""
+    _session_list_cache.invalidate_tags(f"warehouse:{warehouse_id}", "warehouse:*")
 
 
 @router.get("/{session_id}", response_model=InventorySessionListResponse)
@@ -129,12 +197,7 @@ def get_inventory_session(
     ),
 ):
     """Get a single inventory session by id (for header/subtitle in Register Count, etc.)."""
-    session_repo = InventorySessionRepositoryImpl(db)
-    warehouse_repo = WarehouseRepositoryImpl(db)
-    count_repo = InventoryCountRepositoryImpl(db)
-    user_repo = UserRepositoryImpl(db)
-
-    session = session_repo.get_by_id(session_id)
+    session = InventorySessionRepositoryImpl(db).get_summary(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Inventory session not found")
     if current_user.get("role") in (
@@ -143,23 +206,18 @@ def get_inventory_session(
     ):
         assert_warehouse_access(current_user, session.warehouse_id)
 
-    warehouse = warehouse_repo.get_by_id(session.warehouse_id)
-    warehouse_description = warehouse.description if warehouse else ""
-    products_count = count_repo.count_by_session(session_id)
-    creator = user_repo.get_by_id(session.created_by)
-
     return InventorySessionListResponse(
         id=session.id,
         warehouse_id=session.warehouse_id,
-        warehouse_description=warehouse_description,
+        warehouse_description=session.warehouse_description,
         month=session.month,
         count_number=session.count_number,
-        created_by_id=session.created_by,
-        created_by_name=creator.name if creator else "",
+        created_by_id=session.created_by_id,
+        created_by_name=session.created_by_name,
         created_at=session.created_at,
         closed_at=session.closed_at,
         status="CLOSED" if session.closed_at else "OPEN",
-        products_count=products_count,
+        products_count=session.products_count,
     )
 
 
@@ -183,6 +241,7 @@ def create_inventory_session(
         user_warehouse_ids=user_warehouse_ids,
         is_admin=is_admin,
     )
+    _invalidate_session_list(result.warehouse_id)
 
     user_repo = UserRepositoryImpl(db)
     creator = user_repo.get_by_id(result.created_by)
@@ -207,9 +266,13 @@ def close_inventory_session(
 ):
     """Close an inventory session. Only open sessions can be closed."""
     session_repo = InventorySessionRepositoryImpl(db)
+    count_repo = InventoryCountRepositoryImpl(db)
     user_repo = UserRepositoryImpl(db)
-    use_case = CloseInventorySessionUseCase(session_repo)
+    use_case = CloseInventorySessionUseCase(
+        session_repo, count_repo, get_session_event_broker()
+    )
     result = use_case.execute(session_id)
+    _invalidate_session_list(result.warehouse_id)
     creator = user_repo.get_by_id(result.created_by)
     return InventorySessionResponse(
         id=result.id,
@@ -224,13 +287,129 @@ def close_inventory_session(
     )
 
 
+@router.get("/{session_id}/summary", response_model=InventorySessionSummaryResponse)
+def get_inventory_session_summary(
+    session_id: UUID,
+    db: Session = Depends(get_db),
+    current_user=Depends(
+        require_roles([UserRole.ADMIN, UserRole.PROCESS_LEADER, UserRole.WAREHOUSE_MANAGER])
+    ),
+):
+    """Session totals. Closed sessions read the snapshot frozen at close time."""
+    session_repo = InventorySessionRepositoryImpl(db)
+    session = session_repo.get_by_id(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Inventory session not found")
+    assert_warehouse_access(current_user, session.warehouse_id)
+    use_case = GetSessionSummaryUseCase(
+        session_repo,
+        InventoryCountRepositoryImpl(db),
+        InventorySessionSnapshotRepositoryImpl(db),
+    )
+    summary = use_case.execute(session_id)
+    unit_ids = [u.inventory_unit_id for u in summary.unit_totals]
+    units = {u.id: u for u in MeasurementUnitRepositoryImpl(db).get_by_ids(unit_ids)}
+    return InventorySessionSummaryResponse(
+        session_id=summary.session_id,
+        status="CLOSED" if session.closed_at else "OPEN",
+        total_products=summary.total_products,
+        counted_products=summary.counted_products,
+        uncounted_products=summary.uncounted_products,
+        total_packages=summary.total_packages,
+        unit_totals=[
+            SessionUnitTotalResponse(
+                inventory_unit_id=u.inventory_unit_id,
+                inventory_unit_abbreviation=(
+                    units[u.inventory_unit_id].abbreviation
+                    if u.inventory_unit_id in units
+                    else ""
+                ),
+                total_units=u.total_units,
+            )
+            for u in summary.unit_totals
+        ],
+        computed_at=summary.created_at,
+    )
+
+
+@router.get("/{session_id}/events")
+async def stream_inventory_session_events(
+    session_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user=Depends(
+        require_roles(
+            [UserRole.ADMIN, UserRole.PROCESS_LEADER, UserRole.WAREHOUSE_MANAGER],
+            user_dependency=get_current_user_or_query_token,
+        )
+    ),
+):
+    """
+    Server-Sent Events for one session: count_registered, products_added, session_closed.
+    Replaces polling /{session_id} and /counts. EventSource clients pass ?access_token=.
+    """
+    session_repo = InventorySessionRepositoryImpl(db)
+    session = await run_in_threadpool(session_repo.get_by_id, session_id)
+    # The stream can stay open for hours: give the pooled connection back now
+    await run_in_threadpool(db.close)
+    if not session:
+        raise HTTPException(status_code=404, detail="Inventory session not found")
+    if current_user.get("role") != UserRole.ADMIN.value:
+        assert_warehouse_access(current_user, session.warehouse_id)
+
+    broker = get_session_event_broker()
+    subscription = broker.subscribe(session_id)
+    if session.closed_at is not None:
+        subscription.offer(
+            SessionEvent(
+                type=SESSION_CLOSED,
+                session_id=session_id,
+                data={"closed_at": session.closed_at.isoformat()},
+            )
+        )
+    logger.info(
+        "Session event stream opened",
+        extra={
+            "event": "session_event_stream_opened",
+            "session_id": str(session_id),
+            "user_id": current_user.get("sub"),
+        },
+    )
+    return StreamingResponse(
+        _session_event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _session_event_stream(request: Request, subscription: SessionEventSubscription):
+    broker = get_session_event_broker()
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.get(), timeout=SSE_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: {event.type}\ndata: {json.dumps(event.to_dict())}\n\n"
+            if event.type == SESSION_CLOSED:
+                break
+    finally:
+        broker.unsubscribe(subscription)
+
+
 @router.post("/{session_id}/products")
 def add_session_products(
     session_id: UUID,
     request: AddSessionProductsRequest,
     db: Session = Depends(get_db),
     current_user=Depends(require_roles([UserRole.ADMIN, UserRole.WAREHOUSE_MANAGER])),
+    idempotency: IdempotentRequest = Depends(get_idempotent_request),
 ):
+    replay = idempotency.replay(f"{current_user.get('sub')}:products:{session_id}", request)
+    if replay is not None:
+        return replay
     session_repo = InventorySessionRepositoryImpl(db)
     session = session_repo.get_by_id(session_id)
     if not session:
@@ -238,9 +417,13 @@ def add_session_products(
     assert_warehouse_access(current_user, session.warehouse_id)
     count_repo = InventoryCountRepositoryImpl(db)
     product_repo = ProductRepositoryImpl(db)
-    use_case = AddProductsToSessionUseCase(session_repo, count_repo, product_repo)
+    use_case = AddProductsToSessionUseCase(
+        session_repo, count_repo, product_repo, get_session_event_broker()
+    )
     added = use_case.execute(session_id, request.product_ids)
-    return {"added": len(added)}
+    if added:
+        _invalidate_session_list(session.warehouse_id)
+    return idempotency.complete({"added": len(added)})
 
 
 @router.get("/{session_id}/products", response_model=list)
@@ -272,38 +455,97 @@ def register_inventory_count(
     request: CreateInventoryCountRequest,
     db: Session = Depends(get_db),
     current_user=Depends(require_roles([UserRole.ADMIN, UserRole.WAREHOUSE_MANAGER])),
+    idempotency: IdempotentRequest = Depends(get_idempotent_request),
 ):
-    session_repo = InventorySessionRepositoryImpl(db)
+    """
+    Register a count. Offline clients send an Idempotency-Key per queued submission: a
+    replay returns the first response (Idempotent-Replayed: true) without re-validating.
+    """
+    replay = idempotency.replay(f"{current_user.get('sub')}:counts:{session_id}", request)
+    if replay is not None:
+        return replay
     product_repo = ProductRepositoryImpl(db)
-    count_repo = InventoryCountRepositoryImpl(db)
-    unit_repo = MeasurementUnitRepositoryImpl(db)
-    use_case = RegisterInventoryCountUseCase(session_repo, product_repo, count_repo)
-
-    user_warehouse_ids = [UUID(w) for w in current_user.get("warehouses", [])]
-    is_admin = current_user.get("role") == UserRole.ADMIN.value
-    count = use_case.execute(
+    use_case = _register_count_use_case(db, product_repo)
+    registered = use_case.execute(
         session_id=session_id,
         product_id=request.product_id,
         packaging_quantity=request.packaging_quantity,
-        user_warehouse_ids=user_warehouse_ids,
-        is_admin=is_admin,
+        user_warehouse_ids=[UUID(w) for w in current_user.get("warehouses", [])],
+        is_admin=current_user.get("role") == UserRole.ADMIN.value,
+        measure_unit_id=request.measure_unit_id,
+        recount=request.recount,
+    )
+    response = _registered_count_response(db, product_repo, registered, current_user)
+    return idempotency.complete(response)
+
+
+@router.post("/{session_id}/counts/by-code", response_model=InventoryCountResponse)
+def register_inventory_count_by_code(
+    session_id: UUID,
+    request: CreateInventoryCountByCodeRequest,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_roles([UserRole.ADMIN, UserRole.WAREHOUSE_MANAGER])),
+    idempotency: IdempotentRequest = Depends(get_idempotent_request),
+):
+    """Register a count from a scanned product code: no catalog download on the client."""
+    replay = idempotency.replay(f"{current_user.get('sub')}:counts-by-code:{session_id}", request)
+    if replay is not None:
+        return replay
+    product_repo = ProductRepositoryImpl(db)
+    use_case = RegisterInventoryCountByCodeUseCase(
+        _register_count_use_case(db, product_repo), product_repo, get_product_code_index()
+    )
+    registered = use_case.execute(
+        session_id=session_id,
+        product_code=request.product_code,
+        packaging_quantity=request.packaging_quantity,
+        user_warehouse_ids=[UUID(w) for w in current_user.get("warehouses", [])],
+        is_admin=current_user.get("role") == UserRole.ADMIN.value,
         measure_unit_id=request.measure_unit_id,
+        recount=request.recount,
+    )
+    response = _registered_count_response(db, product_repo, registered, current_user)
+    return idempotency.complete(response)
+
+
+def _register_count_use_case(
+    db: Session, product_repo: ProductRepositoryImpl
+) -> RegisterInventoryCountUseCase:
+    return RegisterInventoryCountUseCase(
+        InventorySessionRepositoryImpl(db),
+        product_repo,
+        InventoryCountRepositoryImpl(db),
+        get_session_event_broker(),
+        FeatureFlagService(FeatureFlagRepositoryImpl(db)),
+        get_unit_conversion_table(db),
     )
 
+
+def _registered_count_response(
+    db: Session,
+    product_repo: ProductRepositoryImpl,
+    registered: RegisteredCount,
+    current_user: dict,
+) -> InventoryCountResponse:
+    count = registered.count
+    if registered.created:
+        # The session's products_count changed
+        session = InventorySessionRepositoryImpl(db).get_by_id(count.session_id)
+        if session is not None:
+            _invalidate_session_list(session.warehouse_id)
     product = product_repo.get_by_id(count.product_id)
-    measure_unit = unit_repo.get_by_id(count.measure_unit_id)
+    measure_unit = MeasurementUnitRepositoryImpl(db).get_by_id(count.measure_unit_id)
     logger.info(
         "Inventory count created",
         extra={
             "event": "inventory_count_created",
-            "session_id": str(session_id),
+            "session_id": str(count.session_id),
             "product_id": str(count.product_id),
             "packaging_quantity": count.quantity_packages,
             "total_units": count.quantity_units,
             "user_id": current_user.get("sub"),
         },
     )
-
     return InventoryCountResponse(
         product=ProductSummary(
             id=product.id,
@@ -323,17 +565,25 @@ def register_inventory_count(
         packaging_quantity=count.quantity_packages,
         total_units=count.quantity_units,
         created_at=count.created_at,
+        updated_at=count.updated_at,
     )
 
 
 @router.get("/{session_id}/counts", response_model=list[InventoryCountResponse])
 def list_inventory_counts(
     session_id: UUID,
+    since: datetime | None = Query(
+        None, description=f"Only counts created or updated after this {SYNC_WATERMARK_HEADER}"
+    ),
     db: Session = Depends(get_db),
     current_user=Depends(
         require_roles([UserRole.ADMIN, UserRole.PROCESS_LEADER, UserRole.WAREHOUSE_MANAGER])
     ),
 ):
+    """
+    Counts of the session. The X-Sync-Watermark response header is the value to send as
+    ?since= on the next poll; rows may repeat across polls, so merge them by product id.
+    """
     session_repo = InventorySessionRepositoryImpl(db)
     session = session_repo.get_by_id(session_id)
     if not session:
@@ -345,33 +595,32 @@ def list_inventory_counts(
     unit_repo = MeasurementUnitRepositoryImpl(db)
     use_case = ListInventoryCountsUseCase(session_repo, count_repo)
 
-    counts = use_case.execute(session_id)
+    counts = use_case.execute(session_id, since)
+    watermark = next_watermark(counts, since)
+    headers = {SYNC_WATERMARK_HEADER: watermark.isoformat()} if watermark is not None else None
     unit_ids = list({c.measure_unit_id for c in counts})
     units = {u.id: u for u in unit_repo.get_by_ids(unit_ids)}
-    result = []
+    rows = []
     for count in counts:
         product = product_repo.get_by_id(count.product_id)
         mu = units.get(count.measure_unit_id)
-        result.append(
-            InventoryCountResponse(
-                product=ProductSummary(
-                    id=product.id,
-                    code=product.code,
-                    description=product.description,
-                    conversion_factor=product.conversion_factor,
-                )
+        rows.append(
+            {
+                "product": {
+                    "id": product.id,
+                    "code": product.code,
+                    "description": product.description,
+                    "conversion_factor": product.conversion_factor,
+                }
                 if product
-                else ProductSummary(id=count.product_id, code="", description="", conversion_factor=1.0),
-                measure_unit=MeasureUnitSummary(
-                    id=mu.id,
-                    name=mu.name,
-                    abbreviation=mu.abbreviation,
-                )
+                else {"id": count.product_id, "code": "", "description": "", "conversion_factor": 1.0},
+                "measure_unit": {"id": mu.id, "name": mu.name, "abbreviation": mu.abbreviation}
                 if mu
                 else None,
-                packaging_quantity=count.quantity_packages,
-                total_units=count.quantity_units,
-                created_at=count.created_at,
-            )
+                "packaging_quantity": count.quantity_packages,
+                "total_units": count.quantity_units,
+                "created_at": count.created_at,
+                "updated_at": count.updated_at,
+            }
         )
-    return result
+    return trusted_json(rows, headers=headers)
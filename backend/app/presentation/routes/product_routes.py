@@ -1,17 +1,42 @@
-from fastapi import APIRouter, Depends
+import codecs
+import csv
+import io
+import tempfile
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.application.use_cases.import_products_use_case import (
+    ImportProductsUseCase,
+    ProductImportResult,
+)
 from app.application.use_cases.list_products_use_case import ListProductsUseCase
+from app.application.use_cases.search_products_use_case import (
+    MAX_SEARCH_RESULTS,
+    SearchProductsUseCase,
+)
+from app.domain.entities.product import Product
 from app.domain.entities.user_role import UserRole
+from app.infrastructure.catalog import get_product_code_index
+from app.infrastructure.logging.logger import logger
+from app.infrastructure.repositories.measurement_unit_repository_impl import (
+    MeasurementUnitRepositoryImpl,
+)
 from app.infrastructure.repositories.product_repository_impl import (
     ProductRepositoryImpl,
 )
 from app.presentation.dependencies.database import get_db
 from app.presentation.dependencies.role_dependencies import require_roles
-from app.presentation.schemas.product_schema import ProductResponse
+from app.presentation.responses import trusted_json
+from app.presentation.schemas.product_schema import ProductImportResponse, ProductResponse
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
+MAX_IMPORT_BYTES = 50 * 1024 * 1024
+# Uploads larger than this spill from memory to a temporary file
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
 
 @router.get("/", response_model=list[ProductResponse])
 def list_products(
@@ -21,14 +46,98 @@ def list_products(
     repository = ProductRepositoryImpl(db)
     use_case = ListProductsUseCase(repository)
     products = use_case.execute()
-    return [
-        ProductResponse(
-            id=p.id,
-            code=p.code,
-            description=p.description,
-            inventory_unit_id=p.inventory_unit,
-            packaging_unit_id=p.packaging_unit,
-            conversion_factor=p.conversion_factor,
-        )
-        for p in products
-    ]
+    return trusted_json([_product_row(p) for p in products])
+
+
+@router.get("/search", response_model=list[ProductResponse])
+def search_products(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS),
+    db: Session = Depends(get_db),
+    _current_user=Depends(require_roles([UserRole.ADMIN, UserRole.WAREHOUSE_MANAGER])),
+):
+    """Typeahead: active products whose code starts with q or whose description contains it."""
+    repository = ProductRepositoryImpl(db)
+    use_case = SearchProductsUseCase(repository)
+    products = use_case.execute(q, limit)
+    return trusted_json([_product_row(p) for p in products])
+
+
+def _product_row(product: Product) -> dict:
+    """ProductResponse as a plain dict (trusted path)."""
+    return {
+        "id": product.id,
+        "code": product.code,
+        "description": product.description,
+        "inventory_unit_id": product.inventory_unit,
+        "packaging_unit_id": product.packaging_unit,
+        "conversion_factor": product.conversion_factor,
+    }
+
+
+@router.post("/import", response_model=ProductImportResponse)
+async def import_products(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_roles([UserRole.ADMIN])),
+):
+    """
+    Upsert products from a CSV request body (Content-Type: text/csv), matched on code.
+    Columns: code, description, inventory_unit, packaging_unit (unit abbreviations),
+    conversion_factor and optional is_active. Invalid rows are skipped and reported.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as upload:
+        size = 0
+        # Chunks are committed as the import runs: the whole body is checked to be UTF-8
+        # while it is received, so an encoding error never leaves a partial import
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > MAX_IMPORT_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                        detail=f"CSV larger than {MAX_IMPORT_BYTES // (1024 * 1024)} MB",
+                    )
+                decoder.decode(chunk)
+                upload.write(chunk)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="CSV must be UTF-8")
+        upload.seek(0)
+        try:
+            result = await run_in_threadpool(_import_csv, db, upload)
+        finally:
+            # Bulk upserts bypass the ORM events that keep the scanner code index current;
+            # chunks committed before a failure are covered too
+            get_product_code_index().invalidate()
+    logger.info(
+        "Products imported",
+        extra={
+            "event": "products_imported",
+            "received": result.received,
+            "inserted": result.inserted,
+            "updated": result.updated,
+            "rejected": result.rejected,
+            "user_id": current_user.get("sub"),
+        },
+    )
+    return ProductImportResponse(
+        received=result.received,
+        inserted=result.inserted,
+        updated=result.updated,
+        rejected=result.rejected,
+        errors=result.errors,
+    )
+
+
+def _import_csv(db: Session, upload) -> ProductImportResult:
+    text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+    try:
+        header = next(csv.reader(text), [])
+        columns = [c.strip().lower() for c in header]
+        rows = csv.DictReader(text, fieldnames=columns)
+        use_case = ImportProductsUseCase(ProductRepositoryImpl(db), MeasurementUnitRepositoryImpl(db))
+        return use_case.execute(columns, rows)
+    finally:
+        text.detach()
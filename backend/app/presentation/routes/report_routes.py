@@ -0,0 +1,125 @@
+import csv
+import io
+from collections.abc import Iterator
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.application.services.immutable_result_cache import ImmutableResultCache
+from app.application.use_cases.reports import (
+    MonthlyInventoryReport,
+    MonthlyInventoryReportUseCase,
+)
+from app.domain.entities.user_role import UserRole
+from app.infrastructure.repositories.inventory_count_repository_impl import (
+    InventoryCountRepositoryImpl,
+)
+from app.infrastructure.repositories.inventory_session_repository_impl import (
+    InventorySessionRepositoryImpl,
+)
+from app.presentation.dependencies.database import get_db
+from app.presentation.dependencies.month_dependencies import parse_month
+from app.presentation.dependencies.role_dependencies import require_roles
+from app.presentation.schemas.report_schema import (
+    MonthlyInventoryItemResponse,
+    MonthlyInventoryReportResponse,
+    ReportSessionResponse,
+)
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+# Reports of fully closed months are immutable; shared by all requests of this process
+_monthly_report_cache = ImmutableResultCache(max_entries=48)
+
+CSV_CHUNK_ROWS = 500
+
+
+def _monthly_report_use_case(db: Session) -> MonthlyInventoryReportUseCase:
+    return MonthlyInventoryReportUseCase(
+        InventorySessionRepositoryImpl(db),
+        InventoryCountRepositoryImpl(db),
+        cache=_monthly_report_cache,
+    )
+
+
+def _build_monthly_report(month: str, db: Session) -> tuple[str, MonthlyInventoryReport]:
+    month_dt = parse_month(month)
+    report = _monthly_report_use_case(db).execute(month_dt)
+    return f"{month_dt.year:04d}-{month_dt.month:02d}", report
+
+
+@router.get("/monthly-inventory", response_model=MonthlyInventoryReportResponse)
+def get_monthly_inventory_report(
+    month: str = Query(..., description="YYYY-MM"),
+    db: Session = Depends(get_db),
+    _current_user=Depends(require_roles([UserRole.ADMIN, UserRole.PROCESS_LEADER])),
+):
+    """Total units per product across all warehouses (latest closed round per warehouse)."""
+    month_label, report = _build_monthly_report(month, db)
+    return MonthlyInventoryReportResponse(
+        month=month_label,
+        is_final=report.is_final,
+        sessions=[
+            ReportSessionResponse(
+                warehouse_id=s.warehouse_id,
+                session_id=s.session_id,
+                count_number=s.count_number,
+            )
+            for s in report.sessions
+        ],
+        items=[
+            MonthlyInventoryItemResponse(
+                product_id=i.product_id,
+                code=i.code,
+                description=i.description,
+                inventory_unit_id=i.inventory_unit_id,
+                total_packages=i.total_packages,
+                total_units=i.total_units,
+                warehouses_count=i.warehouses_count,
+            )
+            for i in report.items
+        ],
+    )
+
+
+@router.get("/monthly-inventory.csv")
+def get_monthly_inventory_report_csv(
+    month: str = Query(..., description="YYYY-MM"),
+    db: Session = Depends(get_db),
+    _current_user=Depends(require_roles([UserRole.ADMIN, UserRole.PROCESS_LEADER])),
+):
+    """Same report as /monthly-inventory, streamed as CSV while rows are read from the query."""
+    month_dt = parse_month(month)
+    month_label = f"{month_dt.year:04d}-{month_dt.month:02d}"
+    items = _monthly_report_use_case(db).iter_items(month_dt)
+
+    def rows() -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(
+            ["code", "description", "total_packages", "total_units", "warehouses_count"]
+        )
+        for n, item in enumerate(items, start=1):
+            writer.writerow(
+                [
+                    item.code,
+                    item.description,
+                    item.total_packages,
+                    item.total_units,
+                    item.warehouses_count,
+                ]
+            )
+            if n % CSV_CHUNK_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        yield buffer.getvalue()
+
+    return StreamingResponse(
+        rows(),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="inventory-{month_label}.csv"'
+        },
+    )
@@ -0,0 +1,75 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.unit_conversions import (
+    CreateUnitConversionUseCase,
+    DeleteUnitConversionUseCase,
+    ListUnitConversionsUseCase,
+)
+from app.domain.entities.user_role import UserRole
+from app.infrastructure.repositories.measurement_unit_repository_impl import (
+    MeasurementUnitRepositoryImpl,
+)
+from app.infrastructure.repositories.product_repository_impl import ProductRepositoryImpl
+from app.infrastructure.repositories.unit_conversion_repository_impl import (
+    UnitConversionRepositoryImpl,
+)
+from app.presentation.dependencies.database import get_db
+from app.presentation.dependencies.role_dependencies import require_roles
+from app.presentation.schemas.unit_conversion_schema import (
+    CreateUnitConversionRequest,
+    UnitConversionResponse,
+)
+
+router = APIRouter(prefix="/unit-conversions", tags=["Unit Conversions"])
+
+
+def _to_response(c) -> UnitConversionResponse:
+    return UnitConversionResponse(
+        id=c.id,
+        from_unit_id=c.from_unit_id,
+        to_unit_id=c.to_unit_id,
+        factor=c.factor,
+        product_id=c.product_id,
+    )
+
+
+@router.get("/", response_model=list[UnitConversionResponse])
+def list_unit_conversions(
+    db: Session = Depends(get_db),
+    _current_user=Depends(require_roles([UserRole.ADMIN, UserRole.WAREHOUSE_MANAGER])),
+):
+    use_case = ListUnitConversionsUseCase(UnitConversionRepositoryImpl(db))
+    return [_to_response(c) for c in use_case.execute()]
+
+
+@router.post("/", response_model=UnitConversionResponse, status_code=201)
+def create_unit_conversion(
+    body: CreateUnitConversionRequest,
+    db: Session = Depends(get_db),
+    _current_user=Depends(require_roles([UserRole.ADMIN])),
+):
+    use_case = CreateUnitConversionUseCase(
+        UnitConversionRepositoryImpl(db),
+        MeasurementUnitRepositoryImpl(db),
+        ProductRepositoryImpl(db),
+    )
+    conversion = use_case.execute(
+        from_unit_id=body.from_unit_id,
+        to_unit_id=body.to_unit_id,
+        factor=body.factor,
+        product_id=body.product_id,
+    )
+    return _to_response(conversion)
+
+
+@router.delete("/{conversion_id}", status_code=204)
+def delete_unit_conversion(
+    conversion_id: UUID,
+    db: Session = Depends(get_db),
+    _current_user=Depends(require_roles([UserRole.ADMIN])),
+):
+    DeleteUnitConversionUseCase(UnitConversionRepositoryImpl(db)).execute(conversion_id)
+    return Response(status_code=204)
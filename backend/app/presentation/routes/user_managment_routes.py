@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.application.use_cases.sync_users_from_api import SyncUsersFromCorporateAPIUseCase
 from app.application.use_cases.user_managment.create_user_case import CreateUserUseCase
+from app.application.use_cases.user_managment.dto import UserListDto
 from app.application.use_cases.user_managment.list_users_case import ListUsersUseCase
 from app.application.use_cases.user_managment.update_user_case import UpdateUserUseCase
 from app.domain.entities.user_role import UserRole
@@ -17,6 +18,7 @@ from app.infrastructure.mock.corporate_users_faker import fetch_users as mock_fe
 from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
 from app.presentation.dependencies.database import get_db
 from app.presentation.dependencies.role_dependencies import require_roles
+from app.presentation.responses import trusted_json
 
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -93,6 +95,19 @@ class UserResponse(BaseModel):
         )
 
 
+def _user_row(dto: UserListDto) -> dict:
+    """UserResponse.from_user_list_dto as a plain dict (trusted path)."""
+    return {
+        "id": str(dto.id),
+        "identification": dto.identification,
+        "name": dto.name,
+        "email": dto.email,
+        "role": dto.role,
+        "warehouses": [{"id": str(w.id), "name": w.name} for w in dto.warehouses],
+        "is_active": dto.is_active,
+    }
+
+
 def _get_corporate_users_fetcher():
     """Injection: USER_SYNC_MODE=mock uses Faker; external uses RandomUser API."""
     mode = (os.getenv("USER_SYNC_MODE") or "external").strip().lower()
@@ -176,7 +191,7 @@ def list_users(
     repository = UserRepositoryImpl(db)
     use_case = ListUsersUseCase(repository)
     dtos = use_case.execute()
-    return [UserResponse.from_user_list_dto(dto) for dto in dtos]
+    return trusted_json([_user_row(dto) for dto in dtos])
 
 
 @router.post("/", response_model=UserResponse)
@@ -1,16 +1,30 @@
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
+from app.application.use_cases.inventory import GetRoundVarianceUseCase
 from app.application.use_cases.list_warehouses_use_case import ListWarehousesUseCase
 from app.domain.entities.user_role import UserRole
+from app.infrastructure.repositories.inventory_count_repository_impl import (
+    InventoryCountRepositoryImpl,
+)
+from app.infrastructure.repositories.inventory_session_repository_impl import (
+    InventorySessionRepositoryImpl,
+)
 from app.infrastructure.repositories.warehouse_repository_impl import (
     WarehouseRepositoryImpl,
 )
 from app.presentation.dependencies.database import get_db
+from app.presentation.dependencies.month_dependencies import parse_month
 from app.presentation.dependencies.role_dependencies import require_roles
-from app.presentation.schemas.warehouse_schema import WarehouseResponse
+from app.presentation.dependencies.warehouse_dependencies import assert_warehouse_access
+from app.presentation.schemas.warehouse_schema import (
+    RoundVarianceItemResponse,
+    RoundVarianceReportResponse,
+    WarehouseResponse,
+)
 
 router = APIRouter(prefix="/warehouses", tags=["Warehouses"])
 
@@ -40,3 +54,58 @@ def list_warehouses(
         )
         for w in warehouses
     ]
+
+
+@router.get(
+    "/{warehouse_id}/months/{month}/variance",
+    response_model=RoundVarianceReportResponse,
+)
+def get_round_variance(
+    warehouse_id: UUID,
+    month: str,
+    base_round: int | None = Query(None, ge=1, description="Defaults to the round before compare_round"),
+    compare_round: int | None = Query(None, ge=1, description="Defaults to the latest round"),
+    min_abs_difference: int = Query(0, ge=0, description="Only products with |difference| >= this"),
+    min_pct_difference: float = Query(0.0, ge=0, description="Only products with |difference %| >= this"),
+    sort: Literal["abs", "pct"] = Query("abs", description="Order by absolute or percentage difference"),
+    db: Session = Depends(get_db),
+    current_user=Depends(
+        require_roles([UserRole.ADMIN, UserRole.PROCESS_LEADER, UserRole.WAREHOUSE_MANAGER])
+    ),
+):
+    """Per-product difference in total units between two count rounds of a warehouse-month."""
+    assert_warehouse_access(current_user, warehouse_id)
+    month_dt = parse_month(month)
+    use_case = GetRoundVarianceUseCase(
+        InventorySessionRepositoryImpl(db),
+        WarehouseRepositoryImpl(db),
+        InventoryCountRepositoryImpl(db),
+    )
+    report = use_case.execute(
+        warehouse_id=warehouse_id,
+        month=month_dt,
+        base_round=base_round,
+        compare_round=compare_round,
+        min_abs_difference=min_abs_difference,
+        min_pct_difference=min_pct_difference,
+        sort_by=sort,
+    )
+    return RoundVarianceReportResponse(
+        warehouse_id=report.warehouse_id,
+        month=f"{month_dt.year:04d}-{month_dt.month:02d}",
+        base_round=report.base_round,
+        compare_round=report.compare_round,
+        items=[
+            RoundVarianceItemResponse(
+                product_id=i.product_id,
+                code=i.code,
+                description=i.description,
+                units_by_round=i.units_by_round,
+                base_units=i.base_units,
+                compare_units=i.compare_units,
+                difference=i.difference,
+                difference_pct=i.difference_pct,
+            )
+            for i in report.items
+        ],
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ProductSummary(BaseModel):
@@ -20,6 +20,14 @@ class CreateInventoryCountRequest(BaseModel):
     product_id: UUID
     packaging_quantity: int
     measure_unit_id: UUID | None = None  # Optional: default from product.packaging_unit_id
+    recount: bool = False  # Overwrite an existing count (ENABLE_INVENTORY_RECOUNT must be on)
+
+
+class CreateInventoryCountByCodeRequest(BaseModel):
+    product_code: str = Field(..., min_length=1, max_length=100)  # As emitted by the scanner
+    packaging_quantity: int
+    measure_unit_id: UUID | None = None
+    recount: bool = False
 
 
 class InventoryCountResponse(BaseModel):
@@ -28,3 +36,4 @@ class InventoryCountResponse(BaseModel):
     packaging_quantity: int
     total_units: int
     created_at: datetime
+    updated_at: datetime | None = None
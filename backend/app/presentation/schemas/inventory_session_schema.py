@@ -40,4 +40,21 @@ class InventorySessionListResponse(BaseModel):
 
 
 class AddSessionProductsRequest(BaseModel):
-    product_ids: list[UUID]
\ No newline at end of file
+    product_ids: list[UUID]
+
+
+class SessionUnitTotalResponse(BaseModel):
+    inventory_unit_id: UUID
+    inventory_unit_abbreviation: str
+    total_units: int
+
+
+class InventorySessionSummaryResponse(BaseModel):
+    session_id: UUID
+    status: SessionStatus
+    total_products: int
+    counted_products: int
+    uncounted_products: int
+    total_packages: int
+    unit_totals: list[SessionUnitTotalResponse]
+    computed_at: datetime
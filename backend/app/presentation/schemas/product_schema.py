@@ -9,3 +9,11 @@ class ProductResponse(BaseModel):
     inventory_unit_id: UUID | None = None
     packaging_unit_id: UUID | None = None
     conversion_factor: float | None = None
+
+
+class ProductImportResponse(BaseModel):
+    received: int
+    inserted: int
+    updated: int
+    rejected: int
+    errors: list[str]  # First rejected rows, "line N: reason"
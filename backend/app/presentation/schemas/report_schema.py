@@ -0,0 +1,25 @@
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class ReportSessionResponse(BaseModel):
+    warehouse_id: UUID
+    session_id: UUID
+    count_number: int
+
+
+class MonthlyInventoryItemResponse(BaseModel):
+    product_id: UUID
+    code: str
+    description: str
+    inventory_unit_id: UUID
+    total_packages: int
+    total_units: int
+    warehouses_count: int
+
+
+class MonthlyInventoryReportResponse(BaseModel):
+    month: str  # YYYY-MM
+    is_final: bool
+    sessions: list[ReportSessionResponse]
+    items: list[MonthlyInventoryItemResponse]
@@ -0,0 +1,17 @@
+from uuid import UUID
+from pydantic import BaseModel, Field
+
+
+class UnitConversionResponse(BaseModel):
+    id: UUID
+    from_unit_id: UUID
+    to_unit_id: UUID
+    factor: float  # 1 from_unit = factor to_unit
+    product_id: UUID | None = None  # None: applies to every product
+
+
+class CreateUnitConversionRequest(BaseModel):
+    from_unit_id: UUID
+    to_unit_id: UUID
+    factor: float = Field(..., gt=0)
+    product_id: UUID | None = None
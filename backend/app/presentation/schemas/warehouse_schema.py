@@ -7,3 +7,22 @@ class WarehouseResponse(BaseModel):
     code: str
     description: str
     status: str
+
+
+class RoundVarianceItemResponse(BaseModel):
+    product_id: UUID
+    code: str
+    description: str
+    units_by_round: dict[int, int | None]
+    base_units: int
+    compare_units: int
+    difference: int
+    difference_pct: float | None
+
+
+class RoundVarianceReportResponse(BaseModel):
+    warehouse_id: UUID
+    month: str  # YYYY-MM
+    base_round: int
+    compare_round: int
+    items: list[RoundVarianceItemResponse]
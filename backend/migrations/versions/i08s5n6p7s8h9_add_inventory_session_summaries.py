@@ -0,0 +1,51 @@
+"""Add inventory_session_summaries and inventory_session_summary_units tables
+
+Revision ID: i08s5n6p7s8h9
+Revises: h07n3f4b5c6d7
+Create Date: 2026-10-19
+
+Frozen per-session totals written by CloseInventorySessionUseCase in the same
+transaction as closed_at. Sessions closed before this migration have no row;
+readers fall back to aggregating inventory_counts for them.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.infrastructure.database.database import GUID
+
+revision: str = "i08s5n6p7s8h9"
+down_revision: Union[str, Sequence[str], None] = "h07n3f4b5c6d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_session_summaries",
+        sa.Column("session_id", GUID(length=36), nullable=False),
+        sa.Column("total_products", sa.Integer(), nullable=False),
+        sa.Column("counted_products", sa.Integer(), nullable=False),
+        sa.Column("uncounted_products", sa.Integer(), nullable=False),
+        sa.Column("total_packages", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["session_id"], ["inventory_sessions.id"]),
+        sa.PrimaryKeyConstraint("session_id"),
+    )
+    op.create_table(
+        "inventory_session_summary_units",
+        sa.Column("session_id", GUID(length=36), nullable=False),
+        sa.Column("inventory_unit_id", GUID(length=36), nullable=False),
+        sa.Column("total_units", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["session_id"], ["inventory_session_summaries.session_id"]
+        ),
+        sa.ForeignKeyConstraint(["inventory_unit_id"], ["measurement_units.id"]),
+        sa.PrimaryKeyConstraint("session_id", "inventory_unit_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("inventory_session_summary_units")
+    op.drop_table("inventory_session_summaries")
@@ -0,0 +1,29 @@
+"""Add (session_id, updated_at) index on inventory_counts
+
+Revision ID: j09d5s6y7n8c9
+Revises: i08s5n6p7s8h9
+Create Date: 2026-10-19
+
+Serves GET /inventory-sessions/{id}/counts?since=: delta polls read only the rows
+changed after the client's watermark instead of the whole session.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "j09d5s6y7n8c9"
+down_revision: Union[str, Sequence[str], None] = "i08s5n6p7s8h9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_inventory_counts_session_updated",
+        "inventory_counts",
+        ["session_id", "updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inventory_counts_session_updated", table_name="inventory_counts")
@@ -0,0 +1,33 @@
+"""Add product search indexes (pg_trgm)
+
+Revision ID: k10t6r7g8m9n0
+Revises: j09d5s6y7n8c9
+Create Date: 2026-10-19
+
+GET /products/search: upper(code) text_pattern_ops serves the code prefix LIKE, a
+pg_trgm GIN index serves ILIKE '%q%' on description. The extension stays on downgrade.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "k10t6r7g8m9n0"
+down_revision: Union[str, Sequence[str], None] = "j09d5s6y7n8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_products_code_upper_prefix ON products (upper(code) text_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_products_description_trgm ON products "
+        "USING gin (description gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_description_trgm", table_name="products")
+    op.drop_index("ix_products_code_upper_prefix", table_name="products")
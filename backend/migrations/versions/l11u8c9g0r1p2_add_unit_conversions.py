@@ -0,0 +1,45 @@
+"""Add unit_conversions table
+
+Revision ID: l11u8c9g0r1p2
+Revises: k10t6r7g8m9n0
+Create Date: 2026-10-19
+
+Edges of the unit conversion graph (1 from_unit = factor to_unit); product_id NULL
+applies to every product, otherwise the edge only exists for that product.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.database.database import GUID
+
+revision: str = "l11u8c9g0r1p2"
+down_revision: Union[str, Sequence[str], None] = "k10t6r7g8m9n0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "unit_conversions",
+        sa.Column("id", GUID(length=36), nullable=False),
+        sa.Column("from_unit_id", GUID(length=36), nullable=False),
+        sa.Column("to_unit_id", GUID(length=36), nullable=False),
+        sa.Column("factor", sa.Float(), nullable=False),
+        sa.Column("product_id", GUID(length=36), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["from_unit_id"], ["measurement_units.id"]),
+        sa.ForeignKeyConstraint(["to_unit_id"], ["measurement_units.id"]),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_unit_conversions_id", "unit_conversions", ["id"])
+    op.create_index("ix_unit_conversions_product", "unit_conversions", ["product_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_unit_conversions_product", table_name="unit_conversions")
+    op.drop_index("ix_unit_conversions_id", table_name="unit_conversions")
+    op.drop_table("unit_conversions")
@@ -0,0 +1,32 @@
+"""Add counted_at to inventory_counts
+
+Revision ID: m12c7a8d9t0e1
+Revises: l11u8c9g0r1p2
+Create Date: 2026-10-19
+
+Marks registered counts, so a real count of 0 packages is no longer mistaken for the
+uncounted row AddProductsToSession pre-creates. Existing rows are counted when they hold
+packages or were updated after being created (a pre-created row filled in); untouched
+0-package rows stay uncounted.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "m12c7a8d9t0e1"
+down_revision: Union[str, Sequence[str], None] = "l11u8c9g0r1p2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("inventory_counts", sa.Column("counted_at", sa.DateTime(), nullable=True))
+    op.execute(
+        "UPDATE inventory_counts SET counted_at = updated_at "
+        "WHERE quantity_packages <> 0 OR updated_at <> created_at"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("inventory_counts", "counted_at")
@@ -0,0 +1 @@
+"""Performance tooling (load generator, benchmarks). Not imported by the app."""
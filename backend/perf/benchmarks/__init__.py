@@ -0,0 +1 @@
+"""Micro-benchmarks for use cases and repositories (python -m perf.benchmarks)."""
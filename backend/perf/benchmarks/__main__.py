@@ -0,0 +1,126 @@
+"""
+Run the micro-benchmarks and compare against stored baselines.
+
+Each case runs --rounds times (--warmup untimed iterations, then --iterations timed ones);
+the median of the fastest round is compared with the baseline entry "<backend>:<case>" and the run fails (exit 1) when any
+median is more than --threshold slower. Baselines are machine-specific: regenerate them
+on the reference machine with --save-baseline.
+
+Usage (from backend/):
+    python -m perf.benchmarks                                   # memory + sqlite
+    python -m perf.benchmarks --backend postgres --database-url postgresql://...
+    python -m perf.benchmarks --filter count --save-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any
+
+from perf.benchmarks.cases import BACKENDS, CASES, open_context
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _run_case(build, ctx, iterations: int, warmup: int, rounds: int) -> dict[str, float]:
+    """Best-of-rounds median (like timeit's min): shared machines add noise, never speed."""
+    make = build(ctx)
+    best: list[float] | None = None
+    i = 0
+    for _ in range(rounds):
+        samples = []
+        gc.collect()
+        for n in range(warmup + iterations):
+            thunk = make(i)
+            i += 1
+            start = time.perf_counter()
+            thunk()
+            elapsed = time.perf_counter() - start
+            if n >= warmup:
+                samples.append(elapsed)
+        samples.sort()
+        if best is None or statistics.median(samples) < statistics.median(best):
+            best = samples
+    assert best is not None
+    return {
+        "median_us": round(statistics.median(best) * 1e6, 1),
+        "p95_us": round(best[int(0.95 * (len(best) - 1))] * 1e6, 1),
+        "mean_us": round(statistics.fmean(best) * 1e6, 1),
+        "iterations": iterations,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Use case and repository micro-benchmarks.")
+    parser.add_argument(
+        "--backend", action="append", choices=BACKENDS,
+        help="Repeatable; default memory and sqlite (postgres needs --database-url)",
+    )
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--filter", default="", help="Only cases whose name contains this")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3, help="Repeat each case; the fastest round counts")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed median slowdown (0.25 = +25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Merge this run into the baseline file")
+    args = parser.parse_args(argv)
+
+    backends = args.backend or ["memory", "sqlite"]
+    baseline: dict[str, Any] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results: dict[str, dict[str, float]] = {}
+    regressions = []
+    print(f"{'case':<58} {'median':>10} {'p95':>10} {'baseline':>10} {'delta':>8}")
+    for backend in backends:
+        # Read-only repository cases first: the use-case cases insert rows
+        cases = sorted(
+            (c for c in CASES if backend in c.backends and args.filter in c.name),
+            key=lambda c: c.name.startswith("use_case."),
+        )
+        if not cases:
+            continue
+        with open_context(backend, args.database_url) as ctx:
+            for bench in cases:
+                key = f"{backend}:{bench.name}"
+                if ctx.db is not None:
+                    ctx.db.expunge_all()
+                stats = _run_case(bench.build, ctx, args.iterations, args.warmup, args.rounds)
+                results[key] = stats
+                base = baseline.get(key)
+                delta = ""
+                if base:
+                    change = stats["median_us"] / base["median_us"] - 1
+                    delta = f"{change:+.0%}"
+                    if change > args.threshold:
+                        regressions.append((key, change))
+                        delta += " !"
+                print(
+                    f"{key:<58} {stats['median_us']:>8.1f}us {stats['p95_us']:>8.1f}us "
+                    f"{(str(base['median_us']) + 'us') if base else '-':>10} {delta:>8}"
+                )
+
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write("\n")
+        print(f"baseline updated: {args.baseline}")
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:", file=sys.stderr)
+        for key, change in regressions:
+            print(f"  {key}: {change:+.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+"""
+Benchmark contexts and cases.
+
+A context is one backend loaded with the same synthetic dataset (perf.dataset):
+- memory: dict-backed repositories (use-case overhead only);
+- sqlite: in-memory SQLite with the real *RepositoryImpl;
+- postgres: the real *RepositoryImpl in a throwaway schema of --database-url.
+
+A case builds make(i) -> thunk; make runs untimed (per-iteration setup), the thunk is timed.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
+from uuid import UUID, uuid4
+
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.application.services.feature_flag_service import FeatureFlagService
+from app.application.use_cases.add_products_to_session_use_case import (
+    AddProductsToSessionUseCase,
+)
+from app.application.use_cases.create_inventory_session_use_case import (
+    CreateInventorySessionUseCase,
+)
+from app.application.use_cases.inventory import RegisterInventoryCountUseCase
+from app.application.use_cases.list_inventory_sessions_use_case import (
+    ListInventorySessionsUseCase,
+)
+from app.application.use_cases.sync_users_from_api import SyncUsersFromCorporateAPIUseCase
+from app.domain.entities.inventory_session import InventorySession
+from app.infrastructure.database.database import Base
+from app.infrastructure.models import (
+    FeatureFlagModel,
+    InventoryCountModel,
+    InventorySessionModel,
+    InventorySessionSummaryModel,
+    ProductModel,
+    UserModel,
+    WarehouseModel,
+)
+from app.infrastructure.repositories.feature_flag_repository_impl import FeatureFlagRepositoryImpl
+from app.infrastructure.repositories.inventory_count_repository_impl import (
+    InventoryCountRepositoryImpl,
+)
+from app.infrastructure.repositories.inventory_session_repository_impl import (
+    InventorySessionRepositoryImpl,
+)
+from app.infrastructure.repositories.inventory_session_snapshot_repository_impl import (
+    InventorySessionSnapshotRepositoryImpl,
+)
+from app.infrastructure.repositories.measurement_unit_repository_impl import (
+    MeasurementUnitRepositoryImpl,
+)
+from app.infrastructure.repositories.product_repository_impl import ProductRepositoryImpl
+from app.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.infrastructure.repositories.warehouse_repository_impl import WarehouseRepositoryImpl
+from perf.benchmarks.memory_repositories import (
+    InMemoryCountRepository,
+    InMemoryFeatureFlagRepository,
+    InMemoryProductRepository,
+    InMemorySessionRepository,
+    InMemorySnapshotRepository,
+    InMemoryUserRepository,
+    InMemoryWarehouseRepository,
+)
+from perf.dataset import DatasetSpec, RowWriter, generate
+
+BACKENDS = ("memory", "sqlite", "postgres")
+DB_BACKENDS = ("sqlite", "postgres")
+
+# Small enough to load in a few seconds, large enough for realistic query plans
+BENCH_DATASET = DatasetSpec(
+    warehouses=8, products=600, users=40, months=3,
+    end_month=datetime(2026, 1, 1), seed=1234, password="bench",
+)
+BENCH_MONTH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+# Sessions created by the benchmarks live far from the dataset's months
+SCRATCH_YEAR = 2100
+
+
+@dataclass
+class DatasetRefs:
+    warehouse_ids: list[UUID]
+    product_ids: list[UUID]
+    creator_id: UUID
+    open_session_id: UUID
+    closed_session_ids: list[UUID]
+    user_email: str
+
+
+@dataclass
+class BenchContext:
+    backend: str
+    refs: DatasetRefs
+    session_repo: Any
+    count_repo: Any
+    product_repo: Any
+    warehouse_repo: Any
+    user_repo: Any
+    snapshot_repo: Any
+    flag_repo: Any
+    unit_repo: Any = None
+    db: Session | None = None
+
+
+def _load_refs(db: Session) -> DatasetRefs:
+    warehouse_ids = list(
+        db.execute(
+            select(WarehouseModel.id).where(WarehouseModel.is_active.is_(True)).order_by(WarehouseModel.code)
+        ).scalars()
+    )
+    product_ids = list(db.execute(select(ProductModel.id).order_by(ProductModel.code)).scalars())
+    open_session_id = db.execute(
+        select(InventorySessionModel.id).where(InventorySessionModel.closed_at.is_(None)).limit(1)
+    ).scalar_one()
+    closed = list(db.execute(select(InventorySessionSummaryModel.session_id)).scalars())
+    creator = db.execute(select(UserModel.id, UserModel.email).order_by(UserModel.email).limit(1)).one()
+    return DatasetRefs(
+        warehouse_ids=warehouse_ids,
+        product_ids=product_ids,
+        creator_id=creator.id,
+        open_session_id=open_session_id,
+        closed_session_ids=closed,
+        user_email=creator.email,
+    )
+
+
+def _sql_context(backend: str, db: Session) -> BenchContext:
+    return BenchContext(
+        backend=backend,
+        refs=_load_refs(db),
+        session_repo=InventorySessionRepositoryImpl(db),
+        count_repo=InventoryCountRepositoryImpl(db),
+        product_repo=ProductRepositoryImpl(db),
+        warehouse_repo=WarehouseRepositoryImpl(db),
+        user_repo=UserRepositoryImpl(db),
+        snapshot_repo=InventorySessionSnapshotRepositoryImpl(db),
+        flag_repo=FeatureFlagRepositoryImpl(db),
+        unit_repo=MeasurementUnitRepositoryImpl(db),
+        db=db,
+    )
+
+
+def _memory_context(db: Session) -> BenchContext:
+    """Copy the dataset out of a SQL session into dict-backed repositories."""
+    sql = _sql_context("sqlite", db)
+    products = {
+        p.id: p for p in (sql.product_repo._to_domain(m) for m in db.query(ProductModel))
+    }
+    return BenchContext(
+        backend="memory",
+        refs=sql.refs,
+        session_repo=InMemorySessionRepository(
+            [sql.session_repo._to_domain(m) for m in db.query(InventorySessionModel)]
+        ),
+        count_repo=InMemoryCountRepository(
+            [sql.count_repo._to_domain(m) for m in db.query(InventoryCountModel)], products
+        ),
+        product_repo=InMemoryProductRepository(products),
+        warehouse_repo=InMemoryWarehouseRepository(
+            [sql.warehouse_repo._to_domain(m) for m in db.query(WarehouseModel)]
+        ),
+        user_repo=InMemoryUserRepository(
+            [sql.user_repo._to_domain(m) for m in db.query(UserModel)]
+        ),
+        snapshot_repo=InMemorySnapshotRepository(
+            [InventorySessionSnapshotRepositoryImpl.to_domain(m) for m in db.query(InventorySessionSummaryModel)]
+        ),
+        flag_repo=InMemoryFeatureFlagRepository(
+            [sql.flag_repo._to_domain(m) for m in db.query(FeatureFlagModel)]
+        ),
+    )
+
+
+@contextmanager
+def open_context(backend: str, database_url: str | None = None) -> Iterator[BenchContext]:
+    """Create the schema, load BENCH_DATASET and yield a context; drops everything on exit."""
+    schema = None
+    if backend == "postgres":
+        if not database_url:
+            raise SystemExit("--database-url is required for the postgres backend")
+        schema = f"bench_{uuid4().hex[:8]}"
+        engine = create_engine(database_url, connect_args={"options": f"-csearch_path={schema}"})
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA {schema}"))
+    else:
+        engine = create_engine(
+            "sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}
+        )
+    try:
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            writer = RowWriter(conn, batch_size=5000, use_copy=backend == "postgres")
+            generate(conn, BENCH_DATASET, writer)
+            writer.flush()
+            if backend == "postgres":
+                conn.execute(text("ANALYZE"))
+        db = sessionmaker(bind=engine, autoflush=False)()
+        try:
+            yield _memory_context(db) if backend == "memory" else _sql_context(backend, db)
+        finally:
+            db.close()
+    finally:
+        if schema:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        engine.dispose()
+
+
+@dataclass
+class Case:
+    name: str
+    backends: tuple[str, ...]
+    build: Callable[[BenchContext], Callable[[int], Callable[[], Any]]]
+
+
+CASES: list[Case] = []
+
+
+def case(name: str, backends: tuple[str, ...] = BACKENDS):
+    def register(build):
+        CASES.append(Case(name, backends, build))
+        return build
+    return register
+
+
+def _scratch_month(i: int) -> datetime:
+    return datetime(SCRATCH_YEAR + i // 12, i % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _open_scratch_session(ctx: BenchContext, i: int) -> InventorySession:
+    session = InventorySession(
+        id=uuid4(),
+        warehouse_id=ctx.refs.warehouse_ids[0],
+        month=_scratch_month(i),
+        count_number=1,
+        created_by=ctx.refs.creator_id,
+        created_at=datetime.now(timezone.utc),
+        closed_at=None,
+    )
+    return ctx.session_repo.save(session)
+
+
+# --- use cases ---------------------------------------------------------------------------
+
+
+@case("use_case.register_inventory_count")
+def _register_count(ctx: BenchContext):
+    use_case = RegisterInventoryCountUseCase(ctx.session_repo, ctx.product_repo, ctx.count_repo)
+    products = ctx.refs.product_ids
+    sessions: list[InventorySession] = []
+
+    def make(i: int):
+        # One scratch session per pass over the catalog: each product is counted once
+        if i % len(products) == 0:
+            sessions.append(_open_scratch_session(ctx, 10_000 + len(sessions)))
+        return lambda: use_case.execute(
+            session_id=sessions[-1].id,
+            product_id=products[i % len(products)],
+            packaging_quantity=i % 50 + 1,
+            user_warehouse_ids=[],
+            is_admin=True,
+        )
+    return make
+
+
+@case("use_case.add_products_to_session")
+def _add_products(ctx: BenchContext):
+    use_case = AddProductsToSessionUseCase(ctx.session_repo, ctx.count_repo, ctx.product_repo)
+    batch = ctx.refs.product_ids[:25]
+
+    def make(i: int):
+        session = _open_scratch_session(ctx, 20_000 + i)
+        return lambda: use_case.execute(session.id, batch)
+    return make
+
+
+@case("use_case.list_inventory_sessions")
+def _list_sessions(ctx: BenchContext):
+    use_case = ListInventorySessionsUseCase(
+        ctx.session_repo, ctx.warehouse_repo, ctx.count_repo, ctx.user_repo, ctx.snapshot_repo
+    )
+    return lambda i: lambda: use_case.execute(month=BENCH_MONTH)
+
+
+@case("use_case.create_inventory_session")
+def _create_session(ctx: BenchContext):
+    use_case = CreateInventorySessionUseCase(ctx.session_repo, FeatureFlagService(ctx.flag_repo))
+    warehouses = ctx.refs.warehouse_ids
+
+    def make(i: int):
+        return lambda: use_case.execute(
+            warehouse_id=warehouses[i % len(warehouses)],
+            month=_scratch_month(30_000 + i // len(warehouses)),
+            created_by=ctx.refs.creator_id,
+            is_admin=True,
+        )
+    return make
+
+
+@case("use_case.sync_users_from_api")
+def _sync_users(ctx: BenchContext):
+    def make(i: int):
+        results = [
+            {
+                "email": f"bench{i}.{j}@bench.local",
+                "name": {"first": "Bench", "last": str(j)},
+                "login": {"uuid": str(uuid4())},
+            }
+            for j in range(20)
+        ]
+        use_case = SyncUsersFromCorporateAPIUseCase(ctx.user_repo, lambda limit: {"results": results})
+        return lambda: use_case.execute(len(results))
+    return make
+
+
+# --- repositories (hot methods) -----------------------------------------------------------
+
+
+def _repo_case(name: str, call: Callable[[BenchContext], Callable[[int], Any]]):
+    @case(f"repository.{name}", DB_BACKENDS)
+    def build(ctx: BenchContext):
+        fn = call(ctx)
+        return lambda i: lambda: fn(i)
+    return build
+
+
+_repo_case("session.get_by_id", lambda c: lambda i: c.session_repo.get_by_id(c.refs.open_session_id))
+_repo_case(
+    "session.list_filtered_month",
+    lambda c: lambda i: c.session_repo.list_filtered(month=BENCH_MONTH),
+)
+_repo_case(
+    "session.get_month_allocation",
+    lambda c: lambda i: c.session_repo.get_month_allocation(c.refs.warehouse_ids[0], BENCH_MONTH),
+)
+_repo_case(
+    "count.exists_by_session_and_product",
+    lambda c: lambda i: c.count_repo.exists_by_session_and_product(
+        c.refs.open_session_id, c.refs.product_ids[i % len(c.refs.product_ids)]
+    ),
+)
+_repo_case("count.count_by_session", lambda c: lambda i: c.count_repo.count_by_session(c.refs.open_session_id))
+_repo_case("count.list_by_session", lambda c: lambda i: c.count_repo.list_by_session(c.refs.open_session_id))
+_repo_case(
+    "count.summarize_by_session",
+    lambda c: lambda i: c.count_repo.summarize_by_session(c.refs.open_session_id),
+)
+_repo_case(
+    "count.units_by_round",
+    lambda c: lambda i: c.count_repo.units_by_round(c.refs.warehouse_ids[0], BENCH_MONTH),
+)
+_repo_case(
+    "count.product_totals",
+    lambda c: lambda i: c.count_repo.product_totals(c.refs.closed_session_ids[:10]),
+)
+_repo_case(
+    "snapshot.get_by_session_ids",
+    lambda c: lambda i: c.snapshot_repo.get_by_session_ids(c.refs.closed_session_ids),
+)
+_repo_case(
+    "product.get_by_id",
+    lambda c: lambda i: c.product_repo.get_by_id(c.refs.product_ids[i % len(c.refs.product_ids)]),
+)
+_repo_case("product.list_active", lambda c: lambda i: c.product_repo.list_active())
+_repo_case(
+    "product.search_active",
+    lambda c: lambda i: c.product_repo.search_active(("SYN-P00", "product 4", "uct 12")[i % 3], 20),
+)
+_repo_case("warehouse.get_by_id", lambda c: lambda i: c.warehouse_repo.get_by_id(c.refs.warehouse_ids[0]))
+_repo_case("warehouse.list_active", lambda c: lambda i: c.warehouse_repo.list_active())
+_repo_case("user.get_by_email", lambda c: lambda i: c.user_repo.get_by_email(c.refs.user_email))
+_repo_case("user.list_all", lambda c: lambda i: c.user_repo.list_all())
+_repo_case("measurement_unit.list_active", lambda c: lambda i: c.unit_repo.list_active())
+_repo_case(
+    "feature_flag.get_by_key",
+    lambda c: lambda i: c.flag_repo.get_by_key("ENABLE_INVENTORY_DATE_RESTRICTION"),
+)
@@ -0,0 +1,181 @@
+"""
+Dict-backed repositories for the 'memory' benchmark backend.
+
+Same idea as the fakes in tests/unit, but complete enough to drive the benchmarked use
+cases over a full dataset: they isolate use-case overhead from database cost.
+"""
+
+from collections import defaultdict
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.entities.feature_flag import FeatureFlag
+from app.domain.entities.inventory_count import InventoryCount
+from app.domain.entities.inventory_session import InventorySession
+from app.domain.entities.inventory_session_snapshot import (
+    InventorySessionSnapshot,
+    SnapshotUnitTotal,
+)
+from app.domain.entities.product import Product
+from app.domain.entities.user import User
+from app.domain.entities.warehouse import Warehouse
+from app.domain.exceptions.business_exceptions import ConcurrencyConflict
+
+
+class InMemorySessionRepository:
+    def __init__(self, sessions: List[InventorySession]):
+        self.sessions = {s.id: s for s in sessions}
+
+    def save(self, session: InventorySession) -> InventorySession:
+        for s in self.sessions.values():
+            if (s.warehouse_id, s.month, s.count_number) == (
+                session.warehouse_id, session.month, session.count_number
+            ):
+                raise ConcurrencyConflict("Session number already taken")
+        self.sessions[session.id] = session
+        return session
+
+    def close(
+        self, session: InventorySession, summarize: Callable[[], InventorySessionSnapshot]
+    ) -> Tuple[InventorySession, InventorySessionSnapshot]:
+        self.sessions[session.id] = session
+        return session, summarize()
+
+    def get_by_id(self, session_id: UUID) -> Optional[InventorySession]:
+        return self.sessions.get(session_id)
+
+    def get_month_allocation(self, warehouse_id: UUID, month: datetime) -> Tuple[int, int]:
+        numbers = [
+            s.count_number
+            for s in self.sessions.values()
+            if s.warehouse_id == warehouse_id and _same_month(s.month, month)
+        ]
+        return len(numbers), max(numbers, default=0)
+
+    def list_filtered(
+        self,
+        warehouse_id: Optional[UUID] = None,
+        warehouse_ids: Optional[List[UUID]] = None,
+        month: Optional[datetime] = None,
+        status: Optional[str] = None,
+    ) -> List[InventorySession]:
+        result = []
+        for s in self.sessions.values():
+            if warehouse_id is not None and s.warehouse_id != warehouse_id:
+                continue
+            if warehouse_ids is not None and s.warehouse_id not in warehouse_ids:
+                continue
+            if month is not None and not _same_month(s.month, month):
+                continue
+            if status == "open" and s.closed_at is not None:
+                continue
+            if status == "closed" and s.closed_at is None:
+                continue
+            result.append(s)
+        return sorted(result, key=lambda s: s.created_at, reverse=True)
+
+
+class InMemoryCountRepository:
+    def __init__(self, counts: List[InventoryCount], products: dict[UUID, Product]):
+        self.by_session: dict[UUID, dict[UUID, InventoryCount]] = defaultdict(dict)
+        self.products = products
+        for c in counts:
+            self.by_session[c.session_id][c.product_id] = c
+
+    def save(self, count: InventoryCount) -> InventoryCount:
+        self.by_session[count.session_id][count.product_id] = count
+        return count
+
+    def register(self, count: InventoryCount, allow_recount: bool = False) -> Optional[InventoryCount]:
+        existing = self.by_session[count.session_id].get(count.product_id)
+        if existing is not None and existing.counted_at is not None and not allow_recount:
+            return None
+        if existing is not None:
+            count = replace(count, id=existing.id, created_at=existing.created_at)
+        return self.save(count)
+
+    def list_by_session(self, session_id: UUID) -> list[InventoryCount]:
+        return list(self.by_session.get(session_id, {}).values())
+
+    def exists_by_session_and_product(self, session_id: UUID, product_id: UUID) -> bool:
+        return product_id in self.by_session.get(session_id, {})
+
+    def count_by_session(self, session_id: UUID) -> int:
+        return len(self.by_session.get(session_id, {}))
+
+    def summarize_by_session(self, session_id: UUID) -> InventorySessionSnapshot:
+        counts = self.list_by_session(session_id)
+        units: dict[UUID, int] = defaultdict(int)
+        for c in counts:
+            units[self.products[c.product_id].inventory_unit] += c.quantity_units
+        counted = sum(1 for c in counts if c.counted_at is not None)
+        return InventorySessionSnapshot(
+            session_id=session_id,
+            total_products=len(counts),
+            counted_products=counted,
+            uncounted_products=len(counts) - counted,
+            total_packages=sum(c.quantity_packages for c in counts),
+            created_at=datetime.now(timezone.utc),
+            unit_totals=[SnapshotUnitTotal(inventory_unit_id=u, total_units=t) for u, t in units.items()],
+        )
+
+
+class InMemorySnapshotRepository:
+    def __init__(self, snapshots: List[InventorySessionSnapshot]):
+        self.snapshots = {s.session_id: s for s in snapshots}
+
+    def get_by_session_id(self, session_id: UUID) -> Optional[InventorySessionSnapshot]:
+        return self.snapshots.get(session_id)
+
+    def get_by_session_ids(self, session_ids: List[UUID]) -> List[InventorySessionSnapshot]:
+        return [self.snapshots[i] for i in session_ids if i in self.snapshots]
+
+
+class InMemoryProductRepository:
+    def __init__(self, products: dict[UUID, Product]):
+        self.products = products
+
+    def get_by_id(self, product_id: UUID) -> Optional[Product]:
+        return self.products.get(product_id)
+
+    def list_active(self) -> List[Product]:
+        return [p for p in self.products.values() if p.is_active]
+
+
+class InMemoryWarehouseRepository:
+    def __init__(self, warehouses: List[Warehouse]):
+        self.warehouses = {w.id: w for w in warehouses}
+
+    def get_by_id(self, warehouse_id: UUID) -> Optional[Warehouse]:
+        return self.warehouses.get(warehouse_id)
+
+
+class InMemoryUserRepository:
+    def __init__(self, users: List[User]):
+        self.users = {u.id: u for u in users}
+        self.by_email = {u.email: u for u in users}
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        return self.by_email.get(email)
+
+    def get_by_ids(self, user_ids: list[UUID]) -> list[User]:
+        return [self.users[i] for i in user_ids if i in self.users]
+
+    def create(self, user: User) -> User:
+        self.users[user.id] = user
+        self.by_email[user.email] = user
+        return user
+
+
+class InMemoryFeatureFlagRepository:
+    def __init__(self, flags: List[FeatureFlag]):
+        self.flags = {f.key: f for f in flags}
+
+    def get_by_key(self, key: str) -> Optional[FeatureFlag]:
+        return self.flags.get(key)
+
+
+def _same_month(a: datetime, b: datetime) -> bool:
+    return (a.year, a.month) == (b.year, b.month)
@@ -0,0 +1,390 @@
+"""
+Deterministic synthetic dataset for benchmarks and capacity planning.
+
+Generates N warehouses, M products, U users (with warehouse assignments) and K months of
+inventory sessions with their counts. Sessions follow the business rules (1-3 rounds per
+warehouse-month, one count row per product in the warehouse assortment, closed sessions
+carry their frozen summary); the latest round of the last month is left open.
+
+Rows are written with Core executemany in batches, or COPY FROM STDIN on Postgres.
+Everything (ids, timestamps, quantities) derives from --seed and --end-month, so two runs
+with the same arguments produce identical data. Synthetic rows are tagged (codes prefixed
+SYN-, emails @synthetic.local) and --replace removes a previous synthetic load first.
+
+Usage (from backend/, schema already migrated):
+    python -m perf.dataset --warehouses 20 --products 5000 --users 200 --months 6 --seed 42
+"""
+
+import argparse
+import csv
+import io
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import numpy as np
+from sqlalchemy import Table, create_engine, delete, func, or_, select
+from sqlalchemy.engine import Connection
+
+from app.domain.entities.user_role import UserRole
+from app.domain.entities.warehouse_status import WarehouseStatus
+from app.domain.services.unit_conversion_service import UnitConversionService
+from app.infrastructure.database.database import DATABASE_URL
+from app.infrastructure.models import (
+    InventoryCountModel,
+    InventorySessionModel,
+    InventorySessionSummaryModel,
+    InventorySessionSummaryUnitModel,
+    MeasurementUnitModel,
+    ProductModel,
+    UserModel,
+    WarehouseModel,
+    user_warehouses,
+)
+from app.infrastructure.security.password_hasher import PasswordHasher
+
+SYNTHETIC_CODE_PREFIX = "SYN-"
+SYNTHETIC_EMAIL_DOMAIN = "synthetic.local"
+
+# Same units as master_data_seeder; reused by name when they already exist
+UNITS = [("Unidad", "UND"), ("Caja", "CJ"), ("Arroba", "ARR")]
+CONVERSION_FACTORS = np.array([1, 6, 12, 24, 48])
+CONVERSION_FACTOR_WEIGHTS = np.array([0.1, 0.3, 0.3, 0.2, 0.1])
+ROUNDS_PER_MONTH_WEIGHTS = np.array([0.5, 0.35, 0.15])  # P(1 round), P(2), P(3)
+
+warehouses_table: Table = WarehouseModel.__table__  # type: ignore[assignment]
+products_table: Table = ProductModel.__table__  # type: ignore[assignment]
+units_table: Table = MeasurementUnitModel.__table__  # type: ignore[assignment]
+users_table: Table = UserModel.__table__  # type: ignore[assignment]
+sessions_table: Table = InventorySessionModel.__table__  # type: ignore[assignment]
+counts_table: Table = InventoryCountModel.__table__  # type: ignore[assignment]
+summaries_table: Table = InventorySessionSummaryModel.__table__  # type: ignore[assignment]
+summary_units_table: Table = InventorySessionSummaryUnitModel.__table__  # type: ignore[assignment]
+
+
+@dataclass
+class DatasetSpec:
+    warehouses: int
+    products: int
+    users: int
+    months: int
+    end_month: datetime
+    seed: int
+    password: str
+
+
+class RowWriter:
+    """Batches rows per table; COPY on Postgres, executemany elsewhere."""
+
+    def __init__(self, conn: Connection, batch_size: int, use_copy: bool):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.use_copy = use_copy
+        self.pending: dict[str, list[dict[str, Any]]] = {}
+        self.tables: dict[str, Table] = {}
+        self.written: dict[str, int] = {}
+
+    def add(self, table: Table, row: dict[str, Any]) -> None:
+        rows = self.pending.setdefault(table.name, [])
+        self.tables[table.name] = table
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        # Parents before children: tables are flushed in first-seen order, all at once,
+        # so a full child batch never lands before the parent rows it references
+        for name in list(self.pending):
+            self._flush_table(name)
+
+    def _flush_table(self, name: str) -> None:
+        rows = self.pending.get(name)
+        if not rows:
+            return
+        table = self.tables[name]
+        if self.use_copy:
+            self._copy(table, rows)
+        else:
+            self.conn.execute(table.insert(), rows)
+        self.written[name] = self.written.get(name, 0) + len(rows)
+        self.pending[name] = []
+
+    def _copy(self, table: Table, rows: list[dict[str, Any]]) -> None:
+        columns = list(rows[0])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(["" if row[c] is None else str(row[c]) for c in columns])
+        buffer.seek(0)
+        cursor = self.conn.connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        finally:
+            cursor.close()
+
+
+def _month_starts(end_month: datetime, months: int) -> list[datetime]:
+    starts = []
+    year, month = end_month.year, end_month.month
+    for _ in range(months):
+        starts.append(datetime(year, month, 1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return list(reversed(starts))
+
+
+def _synthetic_session_ids(conn: Connection) -> list:
+    synthetic_warehouses = select(WarehouseModel.id).where(
+        WarehouseModel.code.like(f"{SYNTHETIC_CODE_PREFIX}%")
+    )
+    synthetic_users = select(UserModel.id).where(
+        UserModel.email.like(f"%@{SYNTHETIC_EMAIL_DOMAIN}")
+    )
+    return list(
+        conn.execute(
+            select(InventorySessionModel.id).where(
+                or_(
+                    InventorySessionModel.warehouse_id.in_(synthetic_warehouses),
+                    InventorySessionModel.created_by.in_(synthetic_users),
+                )
+            )
+        ).scalars()
+    )
+
+
+def purge_synthetic(conn: Connection) -> None:
+    """Delete rows from a previous synthetic load, children first."""
+    session_ids = _synthetic_session_ids(conn)
+    synthetic_products = select(ProductModel.id).where(
+        ProductModel.code.like(f"{SYNTHETIC_CODE_PREFIX}%")
+    )
+    synthetic_users = select(UserModel.id).where(
+        UserModel.email.like(f"%@{SYNTHETIC_EMAIL_DOMAIN}")
+    )
+    for start in range(0, len(session_ids), 500):
+        chunk = session_ids[start : start + 500]
+        conn.execute(delete(summary_units_table).where(summary_units_table.c.session_id.in_(chunk)))
+        conn.execute(delete(summaries_table).where(summaries_table.c.session_id.in_(chunk)))
+        conn.execute(delete(counts_table).where(counts_table.c.session_id.in_(chunk)))
+        conn.execute(delete(sessions_table).where(sessions_table.c.id.in_(chunk)))
+    conn.execute(delete(counts_table).where(counts_table.c.product_id.in_(synthetic_products)))
+    conn.execute(delete(user_warehouses).where(user_warehouses.c.user_id.in_(synthetic_users)))
+    conn.execute(
+        delete(user_warehouses).where(
+            user_warehouses.c.warehouse_id.in_(
+                select(WarehouseModel.id).where(WarehouseModel.code.like(f"{SYNTHETIC_CODE_PREFIX}%"))
+            )
+        )
+    )
+    conn.execute(delete(users_table).where(users_table.c.email.like(f"%@{SYNTHETIC_EMAIL_DOMAIN}")))
+    conn.execute(delete(products_table).where(products_table.c.code.like(f"{SYNTHETIC_CODE_PREFIX}%")))
+    conn.execute(delete(warehouses_table).where(warehouses_table.c.code.like(f"{SYNTHETIC_CODE_PREFIX}%")))
+
+
+def _ensure_units(conn: Connection, writer: RowWriter, uid, now: datetime) -> dict[str, Any]:
+    existing = {
+        row.abbreviation: row.id
+        for row in conn.execute(select(MeasurementUnitModel.abbreviation, MeasurementUnitModel.id))
+    }
+    units = {}
+    for name, abbreviation in UNITS:
+        unit_id = uid()  # drawn even when reused, so later ids don't depend on existing units
+        if abbreviation in existing:
+            units[abbreviation] = existing[abbreviation]
+            continue
+        writer.add(units_table, {
+            "id": unit_id, "name": name, "abbreviation": abbreviation,
+            "is_active": True, "created_at": now, "updated_at": now,
+        })
+        units[abbreviation] = unit_id
+    return units
+
+
+def generate(conn: Connection, spec: DatasetSpec, writer: RowWriter) -> None:
+    rnd = random.Random(spec.seed)
+    rng = np.random.default_rng(spec.seed)
+
+    def uid() -> UUID:
+        return UUID(int=rnd.getrandbits(128), version=4)
+
+    month_starts = _month_starts(spec.end_month, spec.months)
+    created = month_starts[0] - timedelta(days=30)
+    units = _ensure_units(conn, writer, uid, created)
+
+    # Warehouses: a few inactive, like production
+    warehouse_ids = [uid() for _ in range(spec.warehouses)]
+    active = rng.random(spec.warehouses) >= 0.1
+    for i, warehouse_id in enumerate(warehouse_ids):
+        status = WarehouseStatus.ACTIVE if active[i] else WarehouseStatus.INACTIVE
+        writer.add(warehouses_table, {
+            "id": warehouse_id, "code": f"{SYNTHETIC_CODE_PREFIX}{i:05d}",
+            "description": f"Synthetic warehouse {i}", "is_active": bool(active[i]),
+            "status": status.value, "status_description": None,
+            "created_at": created, "updated_at": created,
+        })
+
+    # Products: inventory unit UND, packaging CJ or ARR, skewed conversion factors
+    product_ids = [uid() for _ in range(spec.products)]
+    factors = rng.choice(CONVERSION_FACTORS, size=spec.products, p=CONVERSION_FACTOR_WEIGHTS)
+    packaging = rng.random(spec.products) < 0.8
+    for i, product_id in enumerate(product_ids):
+        writer.add(products_table, {
+            "id": product_id, "code": f"{SYNTHETIC_CODE_PREFIX}P{i:06d}",
+            "description": f"Synthetic product {i}", "inventory_unit_id": units["UND"],
+            "packaging_unit_id": units["CJ"] if packaging[i] else units["ARR"],
+            "conversion_factor": float(factors[i]), "is_active": True,
+            "created_at": created, "updated_at": created,
+        })
+
+    # Users: ~2% admins, ~10% process leaders, rest warehouse managers (1-2 warehouses each)
+    hashed_password = PasswordHasher().hash_password(spec.password)
+    roles = rng.choice(
+        [UserRole.ADMIN.value, UserRole.PROCESS_LEADER.value, UserRole.WAREHOUSE_MANAGER.value],
+        size=spec.users, p=[0.02, 0.10, 0.88],
+    )
+    managers_by_warehouse: dict[int, list[UUID]] = {i: [] for i in range(spec.warehouses)}
+    user_ids = [uid() for _ in range(spec.users)]
+    assignments: list[tuple[UUID, int]] = []
+    for i, user_id in enumerate(user_ids):
+        role = str(roles[i])
+        writer.add(users_table, {
+            "id": user_id, "identification": f"{SYNTHETIC_CODE_PREFIX}{i:06d}",
+            "name": f"Synthetic user {i}", "email": f"user{i:05d}@{SYNTHETIC_EMAIL_DOMAIN}",
+            "hashed_password": hashed_password, "role": role, "is_active": True,
+            "last_login": None, "created_at": created, "updated_at": created,
+        })
+        if role == UserRole.ADMIN.value:
+            assigned = range(spec.warehouses)
+        else:
+            size = int(rng.integers(1, 3)) if role == UserRole.WAREHOUSE_MANAGER.value else int(rng.integers(3, 9))
+            assigned = rng.choice(spec.warehouses, size=min(size, spec.warehouses), replace=False)
+        for w in assigned:
+            assignments.append((user_id, int(w)))
+            if role == UserRole.WAREHOUSE_MANAGER.value:
+                managers_by_warehouse[int(w)].append(user_id)
+    for user_id, w in assignments:
+        writer.add(user_warehouses, {"user_id": user_id, "warehouse_id": warehouse_ids[w]})
+    writer.flush()
+    fallback_creator = user_ids[0] if user_ids else None
+
+    # Assortment: each warehouse stocks 50-100% of the catalog at its own base level
+    for w, warehouse_id in enumerate(warehouse_ids):
+        if not active[w]:
+            continue
+        creators = managers_by_warehouse[w] or ([fallback_creator] if fallback_creator else [])
+        if not creators:
+            raise SystemExit("--users must be at least 1 to create sessions")
+        assortment = np.flatnonzero(rng.random(spec.products) < rng.uniform(0.5, 1.0))
+        base_level = rng.lognormal(mean=3.0, sigma=1.2, size=assortment.size)
+
+        for m, month in enumerate(month_starts):
+            is_last_month = m == len(month_starts) - 1
+            level = base_level * rng.lognormal(0.0, 0.15, size=assortment.size)
+            rounds = int(rng.choice([1, 2, 3], p=ROUNDS_PER_MONTH_WEIGHTS))
+            for count_number in range(1, rounds + 1):
+                session_id = uid()
+                opened = month + timedelta(days=count_number - 1, hours=int(rng.integers(6, 10)))
+                is_open = is_last_month and count_number == rounds
+                closed = None if is_open else opened + timedelta(hours=int(rng.integers(4, 30)))
+                writer.add(sessions_table, {
+                    "id": session_id, "warehouse_id": warehouse_id, "month": month,
+                    "count_number": count_number,
+                    "created_by": creators[int(rng.integers(len(creators)))],
+                    "created_at": opened, "closed_at": closed,
+                })
+
+                # Closed rounds are almost fully counted; the open one is mid-count.
+                # Recounts mostly agree with the previous round, some drift a few percent.
+                coverage = rng.uniform(0.2, 0.8) if is_open else rng.beta(18, 2)
+                counted = rng.random(assortment.size) < coverage
+                noise = np.where(rng.random(assortment.size) < 0.7, 1.0, rng.normal(1.0, 0.05, assortment.size))
+                packages = np.where(counted, np.maximum(np.rint(level * noise), 1), 0).astype(np.int64)
+                units_total = UnitConversionService.calculate_total_units_batch(packages, factors[assortment])
+                offsets = rng.integers(0, 3600 * 4, size=assortment.size)
+                for j, p in enumerate(assortment):
+                    stamp = opened + timedelta(seconds=int(offsets[j]))
+                    writer.add(counts_table, {
+                        "id": uid(), "session_id": session_id, "product_id": product_ids[p],
+                        "measure_unit_id": units["CJ"] if packaging[p] else units["ARR"],
+                        "quantity_packages": int(packages[j]), "quantity_units": int(units_total[j]),
+                        "created_at": stamp, "updated_at": stamp,
+                        "counted_at": stamp if counted[j] else None,
+                    })
+                if closed is not None:
+                    writer.add(summaries_table, {
+                        "session_id": session_id, "total_products": int(assortment.size),
+                        "counted_products": int(counted.sum()),
+                        "uncounted_products": int(assortment.size - counted.sum()),
+                        "total_packages": int(packages.sum()), "created_at": closed,
+                    })
+                    writer.add(summary_units_table, {
+                        "session_id": session_id, "inventory_unit_id": units["UND"],
+                        "total_units": int(units_total.sum()),
+                    })
+        writer.flush()
+
+
+def _has_synthetic_data(conn: Connection) -> bool:
+    return bool(
+        conn.execute(
+            select(func.count()).select_from(warehouses_table).where(
+                warehouses_table.c.code.like(f"{SYNTHETIC_CODE_PREFIX}%")
+            )
+        ).scalar()
+    )
+
+
+def _parse_month(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m")
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic dataset.")
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--warehouses", type=int, default=20)
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--months", type=int, default=6)
+    parser.add_argument("--end-month", type=_parse_month, default=None, help="YYYY-MM (default: current month)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--password", default="synthetic", help="Password for every generated user")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--no-copy", action="store_true", help="Use executemany even on Postgres")
+    parser.add_argument("--replace", action="store_true", help="Delete a previous synthetic load first")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    end_month = args.end_month or datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    spec = DatasetSpec(
+        warehouses=args.warehouses, products=args.products, users=args.users,
+        months=args.months, end_month=end_month, seed=args.seed, password=args.password,
+    )
+    engine = create_engine(args.database_url)
+    use_copy = engine.dialect.name == "postgresql" and not args.no_copy
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        if _has_synthetic_data(conn):
+            if not args.replace:
+                print("Synthetic data already present; rerun with --replace", file=sys.stderr)
+                return 1
+            purge_synthetic(conn)
+        writer = RowWriter(conn, args.batch_size, use_copy)
+        generate(conn, spec, writer)
+        writer.flush()
+    elapsed = time.perf_counter() - started
+    for name, rows in writer.written.items():
+        print(f"{name:<32} {rows:>10}")
+    print(f"done in {elapsed:.1f}s ({'COPY' if use_copy else 'executemany'})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+"""
+Load generator that replays a counting-day workload against a running API.
+
+Scenarios (all concurrent, after the shift-start login storm):
+- login storm: every counter and supervisor logs in at once;
+- counters: WAREHOUSE_MANAGER users post /counts for their warehouse's open session
+  until the session has no uncounted products left or --duration elapses;
+- supervisors: PROCESS_LEADER users poll the session list every --poll-interval seconds;
+- admin export: the admin downloads the monthly CSV report every --export-interval seconds.
+
+Setup uses the admin account only: load-test users are created through /users and one
+open session per active warehouse is reused or created through /inventory-sessions.
+
+Usage (from backend/, server already running against SQLite or Postgres):
+    python -m perf.load_test --base-url http://127.0.0.1:8000 --counters 40 --supervisors 5
+    python -m perf.load_test ... --json out.json --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import numpy as np
+
+LOADTEST_EMAIL_DOMAIN = "loadtest.local"
+
+
+@dataclass
+class Recorder:
+    """Collects latency samples per endpoint label (method + route template)."""
+
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    statuses: dict[str, dict[int, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )
+
+    def add(self, label: str, status: int, elapsed: float) -> None:
+        self.latencies[label].append(elapsed)
+        self.statuses[label][status] += 1
+        if status >= 400 or status == 0:
+            self.errors[label] += 1
+
+    def summary(self, wall_seconds: float) -> dict[str, dict[str, Any]]:
+        result: dict[str, dict[str, Any]] = {}
+        for label, samples in sorted(self.latencies.items()):
+            ms = np.asarray(samples) * 1000.0
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            result[label] = {
+                "requests": int(ms.size),
+                "errors": self.errors.get(label, 0),
+                "statuses": {str(k): v for k, v in sorted(self.statuses[label].items())},
+                "throughput_rps": round(ms.size / wall_seconds, 2) if wall_seconds else 0.0,
+                "p50_ms": round(float(p50), 2),
+                "p95_ms": round(float(p95), 2),
+                "p99_ms": round(float(p99), 2),
+                "max_ms": round(float(ms.max()), 2),
+            }
+        return result
+
+
+class LoadClient:
+    """Thin timing wrapper over httpx.AsyncClient; every call is recorded under a label."""
+
+    def __init__(self, http: httpx.AsyncClient, recorder: Recorder):
+        self.http = http
+        self.recorder = recorder
+
+    async def request(
+        self, label: str, method: str, url: str, token: str | None = None, **kwargs: Any
+    ) -> httpx.Response | None:
+        headers = kwargs.pop("headers", {})
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        start = time.perf_counter()
+        try:
+            response = await self.http.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.add(label, 0, time.perf_counter() - start)
+            return None
+        self.recorder.add(label, response.status_code, time.perf_counter() - start)
+        return response
+
+    async def login(self, email: str, password: str) -> str | None:
+        response = await self.request(
+            "POST /auth/login", "POST", "/auth/login", json={"email": email, "password": password}
+        )
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()["access_token"]
+
+
+@dataclass
+class Actor:
+    email: str
+    role: str
+    warehouse_id: str
+    token: str | None = None
+
+
+@dataclass
+class Plan:
+    """Everything the scenarios need, resolved during setup."""
+
+    admin_token: str
+    month: str
+    counters: list[Actor]
+    supervisors: list[Actor]
+    # warehouse_id -> (session_id, queue of uncounted product ids)
+    sessions: dict[str, tuple[str, asyncio.Queue]]
+
+
+def _token_subject(token: str) -> str:
+    """Read the 'sub' claim without verifying (the server already did)."""
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload))["sub"]
+
+
+async def _ensure_users(
+    client: LoadClient, admin_token: str, role: str, prefix: str, count: int,
+    warehouse_ids: list[str], password: str,
+) -> list[Actor]:
+    response = await client.request("setup", "GET", "/users/", admin_token)
+    existing = {u["email"] for u in response.json()} if response is not None else set()
+    actors = []
+    for i in range(count):
+        email = f"{prefix}{i:03d}@{LOADTEST_EMAIL_DOMAIN}"
+        warehouse_id = warehouse_ids[i % len(warehouse_ids)]
+        if email not in existing:
+            await client.request(
+                "setup", "POST", "/users/", admin_token,
+                json={
+                    "identification": f"{prefix}{i:03d}",
+                    "name": f"Load test {prefix}{i:03d}",
+                    "email": email,
+                    "role": role,
+                    "password": password,
+                    "warehouses": warehouse_ids,
+                },
+            )
+        actors.append(Actor(email=email, role=role, warehouse_id=warehouse_id))
+    return actors
+
+
+async def _ensure_open_session(
+    client: LoadClient, admin_token: str, admin_id: str, warehouse_id: str, month: str
+) -> str:
+    response = await client.request(
+        "setup", "GET", "/inventory-sessions/", admin_token,
+        params={"warehouse_id": warehouse_id, "month": month, "status": "open"},
+    )
+    if response is not None and response.status_code == 200:
+        open_sessions = [s for s in response.json() if s["status"] == "OPEN"]
+        if open_sessions:
+            return open_sessions[0]["id"]
+    response = await client.request(
+        "setup", "POST", "/inventory-sessions/", admin_token,
+        json={"warehouse_id": warehouse_id, "month": f"{month}-01T00:00:00Z", "created_by": admin_id},
+    )
+    if response is None or response.status_code != 200:
+        detail = response.text if response is not None else "connection error"
+        raise SystemExit(
+            f"Cannot open a session for warehouse {warehouse_id}: {detail} "
+            "(outside days 1-3, disable the ENABLE_INVENTORY_DATE_RESTRICTION feature flag)"
+        )
+    return response.json()["id"]
+
+
+async def prepare(client: LoadClient, args: argparse.Namespace) -> Plan:
+    admin_token = await client.login(args.admin_email, args.admin_password)
+    if not admin_token:
+        raise SystemExit("Admin login failed; check --admin-email/--admin-password")
+    admin_id = _token_subject(admin_token)
+
+    warehouses = (await client.request("setup", "GET", "/warehouses/", admin_token)).json()
+    warehouse_ids = [w["id"] for w in warehouses if w["status"] == "ACTIVE"][: args.warehouses]
+    if not warehouse_ids:
+        raise SystemExit("No active warehouses to count")
+    products = (await client.request("setup", "GET", "/products/", admin_token)).json()
+
+    sessions: dict[str, tuple[str, asyncio.Queue]] = {}
+    for warehouse_id in warehouse_ids:
+        session_id = await _ensure_open_session(client, admin_token, admin_id, warehouse_id, args.month)
+        counted_response = await client.request(
+            "setup", "GET", f"/inventory-sessions/{session_id}/counts", admin_token
+        )
+        counted = {c["product"]["id"] for c in counted_response.json()} if counted_response else set()
+        pending = [p["id"] for p in products if p["id"] not in counted]
+        random.shuffle(pending)
+        queue: asyncio.Queue = asyncio.Queue()
+        for product_id in pending:
+            queue.put_nowait(product_id)
+        sessions[warehouse_id] = (session_id, queue)
+
+    counters = await _ensure_users(
+        client, admin_token, "WAREHOUSE_MANAGER", "counter", args.counters, warehouse_ids, args.user_password
+    )
+    supervisors = await _ensure_users(
+        client, admin_token, "PROCESS_LEADER", "supervisor", args.supervisors, warehouse_ids, args.user_password
+    )
+    return Plan(admin_token, args.month, counters, supervisors, sessions)
+
+
+async def login_storm(client: LoadClient, actors: list[Actor], password: str) -> None:
+    tokens = await asyncio.gather(*(client.login(a.email, password) for a in actors))
+    for actor, token in zip(actors, tokens):
+        actor.token = token
+
+
+async def counter_loop(client: LoadClient, plan: Plan, actor: Actor, deadline: float, think: float) -> None:
+    session_id, queue = plan.sessions[actor.warehouse_id]
+    while time.monotonic() < deadline:
+        try:
+            product_id = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        await client.request(
+            "POST /inventory-sessions/{id}/counts", "POST",
+            f"/inventory-sessions/{session_id}/counts", actor.token,
+            json={"product_id": product_id, "packaging_quantity": random.randint(0, 200)},
+        )
+        if think:
+            await asyncio.sleep(random.uniform(0, 2 * think))
+
+
+async def supervisor_loop(
+    client: LoadClient, plan: Plan, actor: Actor, stop: asyncio.Event, interval: float
+) -> None:
+    while not stop.is_set():
+        await client.request(
+            "GET /inventory-sessions/", "GET", "/inventory-sessions/", actor.token,
+            params={"month": plan.month},
+        )
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=random.uniform(0.5 * interval, 1.5 * interval))
+        except asyncio.TimeoutError:
+            pass
+
+
+async def export_loop(client: LoadClient, plan: Plan, stop: asyncio.Event, interval: float) -> None:
+    while not stop.is_set():
+        await client.request(
+            "GET /reports/monthly-inventory.csv", "GET", "/reports/monthly-inventory.csv",
+            plan.admin_token, params={"month": plan.month},
+        )
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as http:
+        setup_client = LoadClient(http, Recorder())
+        plan = await prepare(setup_client, args)
+
+        recorder = Recorder()
+        client = LoadClient(http, recorder)
+        started = time.perf_counter()
+        await login_storm(client, plan.counters + plan.supervisors, args.user_password)
+
+        stop = asyncio.Event()
+        deadline = time.monotonic() + args.duration
+        background = [
+            asyncio.create_task(supervisor_loop(client, plan, s, stop, args.poll_interval))
+            for s in plan.supervisors if s.token
+        ]
+        if args.export_interval > 0:
+            background.append(asyncio.create_task(export_loop(client, plan, stop, args.export_interval)))
+        await asyncio.gather(*(
+            counter_loop(client, plan, c, deadline, args.think_time)
+            for c in plan.counters if c.token
+        ))
+        stop.set()
+        await asyncio.gather(*background)
+        wall = time.perf_counter() - started
+
+    return {
+        "meta": {
+            "base_url": args.base_url,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "wall_seconds": round(wall, 2),
+            "counters": args.counters,
+            "supervisors": args.supervisors,
+            "month": args.month,
+        },
+        "endpoints": recorder.summary(wall),
+    }
+
+
+def print_report(report: dict[str, Any], baseline: dict[str, Any] | None = None) -> None:
+    meta = report["meta"]
+    print(f"\n{meta['base_url']}  wall={meta['wall_seconds']}s  counters={meta['counters']}  supervisors={meta['supervisors']}")
+    header = f"{'endpoint':<40} {'reqs':>6} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    print(header)
+    print("-" * len(header))
+    base_endpoints = (baseline or {}).get("endpoints", {})
+    for label, s in report["endpoints"].items():
+        line = (
+            f"{label:<40} {s['requests']:>6} {s['errors']:>5} {s['throughput_rps']:>8} "
+            f"{s['p50_ms']:>8} {s['p95_ms']:>8} {s['p99_ms']:>8} {s['max_ms']:>8}"
+        )
+        base = base_endpoints.get(label)
+        if base and base["p95_ms"]:
+            delta = (s["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100
+            line += f"   p95 {delta:+.1f}% vs baseline"
+        print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a counting-day workload against the API.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--admin-email", default="admin@admin.com")
+    parser.add_argument("--admin-password", default="admin")
+    parser.add_argument("--user-password", default="loadtest", help="Password for created load-test users")
+    parser.add_argument("--month", default=datetime.now(timezone.utc).strftime("%Y-%m"), help="YYYY-MM")
+    parser.add_argument("--warehouses", type=int, default=10, help="Max active warehouses to count")
+    parser.add_argument("--counters", type=int, default=20)
+    parser.add_argument("--supervisors", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=60.0, help="Max seconds for the counting phase")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Mean seconds between a counter's posts")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Mean seconds between supervisor polls")
+    parser.add_argument("--export-interval", type=float, default=15.0, help="Seconds between admin exports; 0 disables")
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducible runs")
+    parser.add_argument("--json", dest="json_path", help="Write the report as JSON")
+    parser.add_argument("--compare", help="Baseline JSON report to diff p95 against")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    report = asyncio.run(run(args))
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Read-path cost per 10k rows: ORM instances + _to_domain versus Core rows mapped straight
+to the (slotted, frozen) entities, on the benchmark dataset (perf.benchmarks).
+
+For each entity both paths read the same --rows rows in a fresh Session; reported are
+the best-of --repeat time, the tracemalloc peak while reading and the memory still held
+by the returned entities, all scaled to 10k rows.
+
+Usage (from backend/):
+    python -m perf.row_mapping                                   # in-memory SQLite
+    python -m perf.row_mapping --backend postgres --database-url postgresql://...
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.domain.entities.inventory_count import InventoryCount
+from app.domain.entities.inventory_session import InventorySession
+from app.domain.entities.product import Product
+from app.infrastructure.models import InventoryCountModel, InventorySessionModel, ProductModel
+from app.infrastructure.repositories.inventory_count_repository_impl import (
+    _COUNT_COLUMNS,
+    InventoryCountRepositoryImpl,
+)
+from app.infrastructure.repositories.inventory_session_repository_impl import (
+    _SESSION_COLUMNS,
+    InventorySessionRepositoryImpl,
+)
+from app.infrastructure.repositories.product_repository_impl import (
+    _PRODUCT_COLUMNS,
+    ProductRepositoryImpl,
+)
+from perf.benchmarks.cases import DB_BACKENDS, open_context
+
+# name, entity, model, Core columns, repository (for its ORM _to_domain)
+ENTITIES = [
+    ("inventory_count", InventoryCount, InventoryCountModel, _COUNT_COLUMNS, InventoryCountRepositoryImpl),
+    ("product", Product, ProductModel, _PRODUCT_COLUMNS, ProductRepositoryImpl),
+    ("inventory_session", InventorySession, InventorySessionModel, _SESSION_COLUMNS, InventorySessionRepositoryImpl),
+]
+
+
+def _paths(entity, model, columns, repository, rows: int) -> dict[str, Callable[[Session], list]]:
+    def orm(db: Session) -> list:
+        to_domain = repository(db)._to_domain
+        return [to_domain(m) for m in db.query(model).order_by(model.id).limit(rows)]
+
+    def core(db: Session) -> list:
+        return [entity(*row) for row in db.execute(select(*columns).order_by(model.id).limit(rows))]
+
+    return {"orm": orm, "core": core}
+
+
+def _measure(make_session: Callable[[], Session], read: Callable[[Session], list], repeat: int) -> dict[str, Any]:
+    best = float("inf")
+    for _ in range(repeat):
+        db = make_session()
+        gc.collect()
+        start = time.perf_counter()
+        result = read(db)
+        best = min(best, time.perf_counter() - start)
+        db.close()
+    db = make_session()
+    gc.collect()
+    tracemalloc.start()
+    result = read(db)
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+    return {"rows": len(result), "seconds": best, "peak": peak, "held": held}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="ORM versus Core row mapping on read paths.")
+    parser.add_argument("--backend", choices=DB_BACKENDS, default="sqlite")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'entity':<18} {'path':<5} {'rows':>6} {'time/10k':>10} {'peak/10k':>10} {'held/10k':>10}")
+    with open_context(args.backend, args.database_url) as ctx:
+        make_session = sessionmaker(bind=ctx.db.get_bind())
+        for name, entity, model, columns, repository in ENTITIES:
+            for path, read in _paths(entity, model, columns, repository, args.rows).items():
+                m = _measure(make_session, read, args.repeat)
+                scale = 10_000 / max(m["rows"], 1)
+                print(
+                    f"{name:<18} {path:<5} {m['rows']:>6} {m['seconds'] * 1e3 * scale:>8.1f}ms "
+                    f"{m['peak'] * scale / 2**20:>8.2f}MB {m['held'] * scale / 2**20:>8.2f}MB"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
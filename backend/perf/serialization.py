@@ -0,0 +1,192 @@
+"""
+Response serialization cost of the large list endpoints, per --rows rows.
+
+For each list schema three paths render the same synthetic rows:
+- validated: build the Pydantic rows, then what FastAPI does for response_model
+  (validate, serialize to JSON-able Python) and the stdlib JSONResponse render;
+- orjson_render: same as validated but rendered by ORJSONResponse (the app default);
+- trusted: plain dict rows rendered by ORJSONResponse (trusted_json).
+The outputs are checked to be the same JSON before anything is timed.
+
+Usage (from backend/):
+    python -m perf.serialization --rows 10000 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+from uuid import UUID, uuid4
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.presentation.responses import ORJSONResponse
+from app.presentation.routes.user_managment_routes import UserResponse, WarehouseRefResponse
+from app.presentation.schemas.inventory_count_schema import (
+    InventoryCountResponse,
+    MeasureUnitSummary,
+    ProductSummary,
+)
+from app.presentation.schemas.inventory_session_schema import InventorySessionListResponse
+from app.presentation.schemas.product_schema import ProductResponse
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _ids(n: int) -> list[UUID]:
+    return [uuid4() for _ in range(n)]
+
+
+def _count_rows(n: int) -> list[dict[str, Any]]:
+    units = [{"id": i, "name": "Unidad", "abbreviation": "UND"} for i in _ids(3)]
+    return [
+        {
+            "product": {
+                "id": pid,
+                "code": f"SYN-{i:06d}",
+                "description": f"Producto sintético {i}",
+                "conversion_factor": 12.5,
+            },
+            "measure_unit": units[i % 3],
+            "packaging_quantity": i % 50,
+            "total_units": (i % 50) * 12,
+            "created_at": START + timedelta(seconds=i),
+            "updated_at": None if i % 4 else START + timedelta(seconds=2 * i),
+        }
+        for i, pid in enumerate(_ids(n))
+    ]
+
+
+def _product_rows(n: int) -> list[dict[str, Any]]:
+    inventory_unit, packaging_unit = _ids(2)
+    return [
+        {
+            "id": pid,
+            "code": f"SYN-{i:06d}",
+            "description": f"Producto sintético {i}",
+            "inventory_unit_id": inventory_unit,
+            "packaging_unit_id": packaging_unit if i % 5 else None,
+            "conversion_factor": 0.333 if i % 2 else 24.0,
+        }
+        for i, pid in enumerate(_ids(n))
+    ]
+
+
+def _session_rows(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": sid,
+            "warehouse_id": sid,
+            "warehouse_description": f"Bodega {i % 20}",
+            "month": datetime(2026, i % 12 + 1, 1),
+            "count_number": i % 3 + 1,
+            "created_by_id": sid,
+            "created_by_name": f"Usuario {i}",
+            "created_at": START + timedelta(minutes=i),
+            "closed_at": None if i % 3 == 0 else START + timedelta(days=1, minutes=i),
+            "status": "OPEN" if i % 3 == 0 else "CLOSED",
+            "products_count": i % 5000,
+        }
+        for i, sid in enumerate(_ids(n))
+    ]
+
+
+def _user_rows(n: int) -> list[dict[str, Any]]:
+    warehouses = [{"id": str(w), "name": f"Bodega {j}"} for j, w in enumerate(_ids(20))]
+    return [
+        {
+            "id": str(uid),
+            "identification": str(10_000_000 + i),
+            "name": f"Usuario {i}",
+            "email": f"user{i}@synthetic.local",
+            "role": "WAREHOUSE_MANAGER",
+            "warehouses": warehouses[i % 20 : i % 20 + 2],
+            "is_active": bool(i % 7),
+        }
+        for i, uid in enumerate(_ids(n))
+    ]
+
+
+def _count_model(row: dict[str, Any]) -> InventoryCountResponse:
+    mu = row["measure_unit"]
+    return InventoryCountResponse(
+        product=ProductSummary(**row["product"]),
+        measure_unit=MeasureUnitSummary(**mu) if mu else None,
+        packaging_quantity=row["packaging_quantity"],
+        total_units=row["total_units"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def _user_model(row: dict[str, Any]) -> UserResponse:
+    return UserResponse(
+        **{**row, "warehouses": [WarehouseRefResponse(**w) for w in row["warehouses"]]}
+    )
+
+
+# name, response_model row type, rows, row -> response model (as the routes built them)
+SCHEMAS: list[tuple[str, type[BaseModel], Callable, Callable]] = [
+    ("inventory_counts", InventoryCountResponse, _count_rows, _count_model),
+    ("products", ProductResponse, _product_rows, lambda r: ProductResponse(**r)),
+    ("inventory_sessions", InventorySessionListResponse, _session_rows,
+     lambda r: InventorySessionListResponse(**r)),
+    ("users", UserResponse, _user_rows, _user_model),
+]
+
+
+def _paths(schema: type[BaseModel], build_model: Callable) -> dict[str, Callable[[list], bytes]]:
+    adapter = TypeAdapter(list[schema])
+    stdlib, fast = JSONResponse(None), ORJSONResponse(None)
+
+    def validated(rows: list) -> bytes:
+        # FastAPI response_model: field.validate + field.serialize, then response_class.render
+        content = adapter.dump_python(adapter.validate_python([build_model(r) for r in rows]), mode="json")
+        return stdlib.render(content)
+
+    def orjson_render(rows: list) -> bytes:
+        content = adapter.dump_python(adapter.validate_python([build_model(r) for r in rows]), mode="json")
+        return fast.render(content)
+
+    def trusted(rows: list) -> bytes:
+        return fast.render(rows)
+
+    return {"validated": validated, "orjson_render": orjson_render, "trusted": trusted}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serialization time of list responses.")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path; the median is shown")
+    args = parser.parse_args(argv)
+
+    print(f"{'schema':<20} {'path':<14} {'median':>10} {'per 10k rows':>14} {'speedup':>8}")
+    for name, schema, make_rows, build_model in SCHEMAS:
+        rows = make_rows(args.rows)
+        paths = _paths(schema, build_model)
+        outputs = {path: json.loads(fn(rows)) for path, fn in paths.items()}
+        if any(out != outputs["validated"] for out in outputs.values()):
+            print(f"{name}: paths disagree on the JSON output", file=sys.stderr)
+            return 1
+        base = None
+        for path, fn in paths.items():
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                fn(rows)
+                samples.append(time.perf_counter() - start)
+            median = statistics.median(samples)
+            base = base or median
+            print(
+                f"{name:<20} {path:<14} {median * 1e3:>8.1f}ms "
+                f"{median * 1e3 * 10_000 / args.rows:>12.1f}ms {base / median:>7.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
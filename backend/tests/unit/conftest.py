@@ -0,0 +1,42 @@
+"""Shared fixtures: an in-memory SQLite database with the full schema, and route clients on it."""
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities.user_role import UserRole
+from app.infrastructure.database.database import Base
+import app.infrastructure.models  # noqa: F401  (registers every table on Base.metadata)
+from app.presentation.dependencies.auth_dependencies import get_current_user
+from app.presentation.dependencies.database import get_db
+
+
+@pytest.fixture
+def sqlite_db():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield db
+    finally:
+        db.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def api_client(sqlite_db):
+    """TestClient factory: one router on sqlite_db, authenticated as an ADMIN by default."""
+
+    def make(router, current_user=None):
+        app = FastAPI()
+        app.include_router(router)
+        user = current_user or {"sub": str(uuid4()), "role": UserRole.ADMIN.value}
+        app.dependency_overrides[get_db] = lambda: sqlite_db
+        app.dependency_overrides[get_current_user] = lambda: user
+        return TestClient(app)
+
+    return make
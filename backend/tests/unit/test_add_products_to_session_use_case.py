@@ -1,4 +1,5 @@
 """Unit tests for AddProductsToSessionUseCase: add via 0-quantity counts, no duplicates."""
+import json
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -54,11 +55,11 @@ class _FakeCountRepo:
 
 class _FakeProductRepo:
     def __init__(self, product_ids=None, now=None):
-        self.product_ids = set(product_ids or [])
+        self.product_ids = {str(p) for p in product_ids or []}
         self.now = now or datetime.now(timezone.utc)
 
     def get_by_id(self, product_id):
-        if str(product_id) not in {str(p) for p in self.product_ids}:
+        if str(product_id) not in self.product_ids:
             return None
         unit_id = uuid4()
         return Product(
@@ -172,3 +173,38 @@ def test_add_products_product_not_found_raises():
         exc_info.value
     ).lower()
     assert len(count_repo.saved) == 0
+
+
+class _RecordingPublisher:
+    def __init__(self):
+        self.events = []
+
+    def publish(self, event):
+        self.events.append(event)
+
+
+def test_large_batch_publishes_a_count_that_fits_in_notify():
+    """Adding thousands of products sends one small event, well under the NOTIFY payload limit."""
+    session = InventorySession(
+        id=uuid4(),
+        warehouse_id=uuid4(),
+        month=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        count_number=1,
+        created_by=uuid4(),
+        created_at=datetime.now(timezone.utc),
+        closed_at=None,
+    )
+    product_ids = [uuid4() for _ in range(5000)]
+    publisher = _RecordingPublisher()
+    use_case = AddProductsToSessionUseCase(
+        _FakeSessionRepo(session=session),
+        _FakeCountRepo(),
+        _FakeProductRepo(product_ids),
+        event_publisher=publisher,
+    )
+
+    use_case.execute(session.id, product_ids)
+
+    [event] = publisher.events
+    assert event.data == {"count": 5000}
+    assert len(json.dumps(event.to_dict()).encode()) < 8000
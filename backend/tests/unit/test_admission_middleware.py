@@ -0,0 +1,116 @@
+"""Unit tests for admission control: route priorities, bounded queue, priority hand-off and 503s."""
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from app.presentation.middleware.admission_middleware import (
+    AdmissionController,
+    AdmissionMetrics,
+    AdmissionMiddleware,
+    Priority,
+    classify,
+)
+
+
+def test_classify_puts_counts_first_and_reports_last():
+    """Count registration is HIGH, reports/exports LOW, health and SSE skip admission."""
+    assert classify("POST", "/inventory-sessions/abc/counts") == Priority.HIGH
+    assert classify("POST", "/inventory-sessions/abc/counts/by-code") == Priority.HIGH
+    assert classify("GET", "/inventory-sessions/abc/counts") == Priority.NORMAL
+    assert classify("GET", "/reports/monthly-inventory.csv") == Priority.LOW
+    assert classify("POST", "/products/import") == Priority.LOW
+    assert classify("GET", "/health") is None
+    assert classify("GET", "/inventory-sessions/abc/events") is None
+
+
+def test_released_slot_goes_to_highest_priority_waiter():
+    """A LOW report queued first still waits behind a HIGH count queued later."""
+
+    async def scenario():
+        controller = AdmissionController(1, queue_size=4, queue_timeout=1, metrics=AdmissionMetrics())
+        order = []
+
+        async def request(priority):
+            assert await controller.acquire(priority)
+            order.append(priority)
+            controller.release(priority)
+
+        assert await controller.acquire(Priority.NORMAL)
+        low = asyncio.create_task(request(Priority.LOW))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(request(Priority.HIGH))
+        await asyncio.sleep(0)
+        controller.release(Priority.NORMAL)
+        await asyncio.gather(low, high)
+        return order
+
+    assert asyncio.run(scenario()) == [Priority.HIGH, Priority.LOW]
+
+
+def test_full_queue_sheds_or_displaces_lower_priority():
+    """With the queue full, another LOW request is shed but a HIGH one displaces the LOW waiter."""
+
+    async def scenario():
+        metrics = AdmissionMetrics()
+        controller = AdmissionController(1, queue_size=1, queue_timeout=1, metrics=metrics)
+        assert await controller.acquire(Priority.NORMAL)
+        low = asyncio.create_task(controller.acquire(Priority.LOW))
+        await asyncio.sleep(0)
+        shed = await controller.acquire(Priority.LOW)
+        high = asyncio.create_task(controller.acquire(Priority.HIGH))
+        await asyncio.sleep(0)
+        controller.release(Priority.NORMAL)
+        return shed, await low, await high, metrics.snapshot()
+
+    shed, low, high, snapshot = asyncio.run(scenario())
+    assert (shed, low, high) == (False, False, True)
+    assert snapshot.by_priority["LOW"].shed_queue_full == 2
+    assert snapshot.by_priority["HIGH"].queued == 1
+    assert (snapshot.in_flight, snapshot.waiting) == (1, 0)
+
+
+def test_low_priority_cap_leaves_slots_for_other_requests():
+    """LOW requests beyond low_priority_limit wait even while general slots are free."""
+
+    async def scenario():
+        controller = AdmissionController(
+            3, queue_size=4, queue_timeout=0.01, low_priority_limit=1, metrics=AdmissionMetrics()
+        )
+        first_low = await controller.acquire(Priority.LOW)
+        second_low = await controller.acquire(Priority.LOW)
+        normal = await controller.acquire(Priority.NORMAL)
+        return first_low, second_low, normal, controller.metrics.snapshot()
+
+    first_low, second_low, normal, snapshot = asyncio.run(scenario())
+    assert (first_low, second_low, normal) == (True, False, True)
+    assert snapshot.by_priority["LOW"].shed_timeout == 1
+
+
+def test_saturated_middleware_answers_503_with_retry_after():
+    """Past max_concurrency plus queue_size, requests fail fast instead of waiting."""
+    app = FastAPI()
+    gate = asyncio.Event()
+
+    @app.get("/slow")
+    async def slow():
+        await gate.wait()
+        return {"ok": True}
+
+    app.add_middleware(
+        AdmissionMiddleware, max_concurrency=1, queue_size=0, retry_after=3, metrics=AdmissionMetrics()
+    )
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/slow"))
+            await asyncio.sleep(0.01)
+            shed = await client.get("/slow")
+            gate.set()
+            return await first, shed
+
+    first, shed = asyncio.run(scenario())
+    assert first.status_code == 200
+    assert shed.status_code == 503
+    assert shed.headers["retry-after"] == "3"
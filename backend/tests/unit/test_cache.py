@@ -0,0 +1,125 @@
+"""Unit tests for the cache package: LRU/TTL/tags, Redis backend, single flight."""
+import threading
+import time
+
+import pytest
+
+from app.infrastructure.cache import Cache, InMemoryCacheBackend, RedisCacheBackend
+
+
+class _FakeRedis:
+    """Dict-backed subset of the redis-py client used by RedisCacheBackend."""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, px=None):
+        self.values[key] = value
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member.encode())
+
+    def smembers(self, key):
+        return set(self.sets.get(key, ()))
+
+    def expire(self, key, seconds):
+        pass
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            key = key.decode() if isinstance(key, bytes) else key
+            deleted += (self.values.pop(key, None) is not None) + (self.sets.pop(key, None) is not None)
+        return deleted
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class _BrokenBackend(InMemoryCacheBackend):
+    def get(self, key):
+        raise ConnectionError("down")
+
+
+def test_memory_backend_expires_and_evicts_least_recently_used():
+    """Entries expire after their TTL; the LRU entry goes first when full."""
+    now = [0.0]
+    backend = InMemoryCacheBackend(max_entries=2, clock=lambda: now[0])
+    backend.set("a", 1, ttl_seconds=10)
+    backend.set("b", 2, ttl_seconds=None)
+    backend.get("a")
+    backend.set("c", 3, ttl_seconds=None)
+
+    assert backend.get("b") is None
+    now[0] = 10.0
+    assert backend.get("a") is None
+    assert backend.get("c") == 3
+
+
+@pytest.mark.parametrize("backend_factory", [InMemoryCacheBackend, lambda: RedisCacheBackend(_FakeRedis())])
+def test_invalidate_tags_drops_only_tagged_entries(backend_factory):
+    """Both backends drop every entry under a tag and keep the rest."""
+    cache = Cache(backend_factory(), "sessions")
+    cache.set("wh-1:open", ["s1"], tags=["wh-1"])
+    cache.set("wh-1:all", ["s1", "s2"], tags=["wh-1", "all"])
+    cache.set("wh-2:open", ["s3"], tags=["wh-2"])
+
+    assert cache.invalidate_tags("wh-1") == 2
+    assert cache.get("wh-1:open") is None and cache.get("wh-1:all") is None
+    assert cache.get("wh-2:open") == ["s3"]
+
+
+def test_concurrent_misses_share_one_load():
+    """Single flight: callers missing the same key wait for the first caller's load."""
+    cache = Cache(InMemoryCacheBackend(), "reports")
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "report"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("k", load))) for _ in range(4)]
+    threads[0].start()
+    started.wait(5)
+    for t in threads[1:]:
+        t.start()
+    deadline = time.monotonic() + 5
+    while cache.metrics().coalesced < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join(5)
+
+    assert results == ["report"] * 4
+    assert len(calls) == 1
+    metrics = cache.metrics()
+    assert (metrics.loads, metrics.coalesced) == (1, 3)
+    assert cache.get_or_load("k", load) == "report" and cache.metrics().hits == 1
+
+
+def test_backend_errors_degrade_to_misses():
+    """An unreachable backend counts as a miss: the loader still answers."""
+    cache = Cache(_BrokenBackend(), "flags")
+
+    assert cache.get_or_load("k", lambda: 42) == 42
+    assert cache.metrics().backend_errors == 1
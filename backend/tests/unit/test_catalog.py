@@ -0,0 +1,74 @@
+"""Unit tests for the catalog caches on SQLite: product writes invalidate only after commit."""
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.catalog import get_product_code_index
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.repositories.product_repository_impl import ProductRepositoryImpl
+
+NOW = datetime(2025, 2, 1)
+
+
+@pytest.fixture
+def product(sqlite_db):
+    unit_id = uuid4()
+    model = ProductModel(
+        id=uuid4(),
+        code="P-1",
+        description="Product",
+        inventory_unit_id=unit_id,
+        packaging_unit_id=unit_id,
+        conversion_factor=1.0,
+        is_active=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    sqlite_db.add(model)
+    sqlite_db.commit()
+    get_product_code_index().invalidate()
+    return model
+
+
+def _lookup(sqlite_db):
+    return get_product_code_index().lookup("P-1", ProductRepositoryImpl(sqlite_db).list_active_codes)
+
+
+def test_reload_between_flush_and_commit_does_not_outlive_the_commit(sqlite_db, product):
+    """A reload that still sees the old row is dropped when the deactivation commits."""
+    assert _lookup(sqlite_db) == product.id
+
+    product.is_active = False
+    sqlite_db.flush()
+    get_product_code_index().invalidate()  # As if the TTL ran out
+    # Another worker's reload in the window only sees committed rows: the code is still active
+    get_product_code_index().lookup("P-1", lambda: {"P-1": product.id})
+    sqlite_db.commit()
+
+    assert _lookup(sqlite_db) is None
+
+
+def test_rolled_back_and_savepoint_writes_wait_for_the_outer_commit(sqlite_db, product):
+    """Neither a rollback nor a released savepoint invalidates; the outer commit does."""
+    loads = []
+
+    def load():
+        loads.append(1)
+        return {"P-1": product.id}
+
+    get_product_code_index().lookup("P-1", load)
+    product.description = "Renamed"
+    sqlite_db.flush()
+    sqlite_db.rollback()
+    get_product_code_index().lookup("P-1", load)
+    assert len(loads) == 1
+
+    with sqlite_db.begin_nested():
+        product.description = "Renamed"
+    get_product_code_index().lookup("P-1", load)
+    assert len(loads) == 1
+
+    sqlite_db.commit()
+    get_product_code_index().lookup("P-1", load)
+    assert len(loads) == 2
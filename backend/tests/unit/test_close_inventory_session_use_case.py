@@ -0,0 +1,101 @@
+"""Unit tests for CloseInventorySessionUseCase: snapshot written together with closed_at."""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.session_event_publisher import SESSION_CLOSED
+from app.application.use_cases.close_inventory_session_use_case import (
+    CloseInventorySessionUseCase,
+)
+from app.domain.entities.inventory_session import InventorySession
+from app.domain.entities.inventory_session_snapshot import (
+    InventorySessionSnapshot,
+    SnapshotUnitTotal,
+)
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation
+
+
+class _FakeSessionRepo:
+    def __init__(self, session):
+        self.session = session
+        self.closed = []
+
+    def get_by_id(self, session_id):
+        return self.session
+
+    def close(self, session, summarize):
+        snapshot = summarize()
+        self.closed.append((session, snapshot))
+        return session, snapshot
+
+
+class _RecordingPublisher:
+    def __init__(self):
+        self.events = []
+
+    def publish(self, event):
+        self.events.append(event)
+
+
+class _FakeCountRepo:
+    def summarize_by_session(self, session_id):
+        return InventorySessionSnapshot(
+            session_id=session_id,
+            total_products=3,
+            counted_products=2,
+            uncounted_products=1,
+            total_packages=7,
+            created_at=datetime(2000, 1, 1, tzinfo=timezone.utc),
+            unit_totals=[SnapshotUnitTotal(inventory_unit_id=uuid4(), total_units=84)],
+        )
+
+
+def _session(closed_at=None):
+    return InventorySession(
+        id=uuid4(),
+        warehouse_id=uuid4(),
+        month=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        count_number=1,
+        created_by=uuid4(),
+        created_at=datetime.now(timezone.utc),
+        closed_at=closed_at,
+    )
+
+
+def test_close_persists_snapshot_with_close_timestamp():
+    """Closing passes the aggregated snapshot, stamped with closed_at, to the repository."""
+    session_repo = _FakeSessionRepo(_session())
+    use_case = CloseInventorySessionUseCase(session_repo, _FakeCountRepo())
+
+    result = use_case.execute(session_repo.session.id)
+
+    assert result.closed_at is not None
+    assert len(session_repo.closed) == 1
+    _, snapshot = session_repo.closed[0]
+    assert snapshot.total_products == 3
+    assert snapshot.uncounted_products == 1
+    assert snapshot.created_at == result.closed_at
+
+
+def test_close_already_closed_session_raises():
+    """An already closed session is rejected and no snapshot is written."""
+    session_repo = _FakeSessionRepo(_session(closed_at=datetime.now(timezone.utc)))
+    use_case = CloseInventorySessionUseCase(session_repo, _FakeCountRepo())
+
+    with pytest.raises(BusinessRuleViolation):
+        use_case.execute(session_repo.session.id)
+    assert session_repo.closed == []
+
+
+def test_close_publishes_session_closed_event():
+    """A successful close emits one session_closed event with the frozen totals."""
+    session_repo = _FakeSessionRepo(_session())
+    publisher = _RecordingPublisher()
+    use_case = CloseInventorySessionUseCase(session_repo, _FakeCountRepo(), publisher)
+
+    use_case.execute(session_repo.session.id)
+
+    assert [e.type for e in publisher.events] == [SESSION_CLOSED]
+    assert publisher.events[0].session_id == session_repo.session.id
+    assert publisher.events[0].data["counted_products"] == 2
@@ -0,0 +1,82 @@
+"""Unit tests for CompressionMiddleware: negotiation, size threshold, streams and metrics."""
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.presentation.middleware.compression_middleware import (
+    CompressionMetrics,
+    CompressionMiddleware,
+    choose_encoding,
+)
+
+BIG = "x" * 5000
+
+
+def _client(metrics: CompressionMetrics) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"id": item_id, "payload": BIG}
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BIG, BIG]), media_type="text/csv")
+
+    @app.get("/encoded")
+    def encoded():
+        body = gzip.compress(BIG.encode())
+        return PlainTextResponse(body, headers={"Content-Encoding": "gzip"})
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, encodings=("gzip",), metrics=metrics)
+    return TestClient(app)
+
+
+def test_choose_encoding_follows_q_values_then_server_order():
+    """q=0 refuses an encoding, "*" accepts any, equal q keeps the server's preference."""
+    assert choose_encoding("gzip, br", ["br", "gzip"]) == "br"
+    assert choose_encoding("gzip;q=1.0, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("gzip;q=0, identity", ["gzip"]) is None
+    assert choose_encoding("*", ["gzip"]) == "gzip"
+    assert choose_encoding("", ["gzip"]) is None
+
+
+def test_large_json_is_gzipped_and_counted_per_route():
+    """Bodies over the threshold are compressed; metrics use the route template."""
+    metrics = CompressionMetrics()
+    client = _client(metrics)
+
+    response = client.get("/items/7", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json()["payload"] == BIG
+    stats = metrics.snapshot()["GET /items/{item_id}"]
+    assert stats.compressed == 1
+    assert stats.bytes_out == int(response.headers["content-length"]) < stats.bytes_in
+
+
+def test_identity_small_streaming_and_encoded_bodies_pass_through():
+    """No compression without gzip in Accept-Encoding, below the threshold, or for streams."""
+    metrics = CompressionMetrics()
+    client = _client(metrics)
+
+    identity = client.get("/items/1", headers={"Accept-Encoding": "identity"})
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    stream = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    encoded = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in stream.headers
+    assert stream.text == BIG + BIG
+    assert encoded.text == BIG  # decoded once by the client: not compressed twice
+    assert set(metrics.snapshot()) == {"GET /items/{item_id}"}
+    assert metrics.snapshot()["GET /items/{item_id}"].compressed == 0
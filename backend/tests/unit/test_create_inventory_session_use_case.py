@@ -9,7 +9,10 @@ from app.application.use_cases.create_inventory_session_use_case import (
     CreateInventorySessionUseCase,
 )
 from app.domain.entities.inventory_session import InventorySession
-from app.domain.exceptions.business_exceptions import BusinessRuleViolation
+from app.domain.exceptions.business_exceptions import (
+    BusinessRuleViolation,
+    ConcurrencyConflict,
+)
 
 
 class _FakeRepo:
@@ -17,14 +20,35 @@ class _FakeRepo:
         self.sessions_by_warehouse = sessions_by_warehouse or {}
         self.saved = []
 
-    def list_by_warehouse(self, warehouse_id):
-        return self.sessions_by_warehouse.get(warehouse_id, [])
+    def get_month_allocation(self, warehouse_id, month):
+        monthly = [
+            s for s in self.sessions_by_warehouse.get(warehouse_id, [])
+            if s.month.year == month.year and s.month.month == month.month
+        ]
+        return len(monthly), max((s.count_number for s in monthly), default=0)
 
     def save(self, session: InventorySession) -> InventorySession:
         self.saved.append(session)
         return session
 
 
+class _RacingRepo(_FakeRepo):
+    """Simulates a concurrent create taking the allocated count_number before our save."""
+
+    def __init__(self, sessions_by_warehouse=None, conflicts=1):
+        super().__init__(sessions_by_warehouse)
+        self.conflicts = conflicts
+
+    def save(self, session: InventorySession) -> InventorySession:
+        if self.conflicts > 0:
+            self.conflicts -= 1
+            self.sessions_by_warehouse.setdefault(session.warehouse_id, []).append(
+                _session(session.warehouse_id, (session.month.year, session.month.month), session.count_number)
+            )
+            raise ConcurrencyConflict("taken")
+        return super().save(session)
+
+
 class _FakeFeatureFlagService:
     """Returns False for is_enabled so date-restriction rule is not applied in these tests."""
 
@@ -127,3 +151,38 @@ def test_max_three_sessions_per_month_raises():
             use_case.execute(warehouse_id=wh_id, month=month, created_by=created_by)
     assert "Maximum 3" in str(exc_info.value)
     assert len(repo.saved) == 0
+
+
+def test_concurrent_create_retries_with_next_count_number():
+    """When save loses the race on count_number, allocation is re-read and the next number is used."""
+    wh_id = uuid4()
+    repo = _RacingRepo({wh_id: [_session(wh_id, (2025, 2), 1)]}, conflicts=1)
+    use_case = CreateInventorySessionUseCase(repo, _FakeFeatureFlagService())
+    month = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+    with patch(
+        "app.application.use_cases.create_inventory_session_use_case.datetime"
+    ) as m_dt:
+        m_dt.now.return_value = datetime(2025, 2, 2, 12, 0, 0, tzinfo=timezone.utc)
+        result = use_case.execute(warehouse_id=wh_id, month=month, created_by=uuid4())
+
+    assert result.count_number == 3
+    assert len(repo.saved) == 1
+
+
+def test_concurrent_create_hitting_monthly_limit_raises():
+    """When the racing create fills the month, the retry reports the monthly limit."""
+    wh_id = uuid4()
+    existing = [_session(wh_id, (2025, 2), 1), _session(wh_id, (2025, 2), 2)]
+    repo = _RacingRepo({wh_id: existing}, conflicts=1)
+    use_case = CreateInventorySessionUseCase(repo, _FakeFeatureFlagService())
+    month = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+    with patch(
+        "app.application.use_cases.create_inventory_session_use_case.datetime"
+    ) as m_dt:
+        m_dt.now.return_value = datetime(2025, 2, 2, 12, 0, 0, tzinfo=timezone.utc)
+        with pytest.raises(BusinessRuleViolation) as exc_info:
+            use_case.execute(warehouse_id=wh_id, month=month, created_by=uuid4())
+    assert "Maximum 3" in str(exc_info.value)
+    assert len(repo.saved) == 0
@@ -0,0 +1,86 @@
+"""Unit tests for GetRoundVarianceUseCase: round resolution, thresholds and ordering."""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.inventory import GetRoundVarianceUseCase
+from app.application.use_cases.inventory.round_variance_query import ProductRoundUnits
+from app.domain.entities.inventory_session import InventorySession
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation
+
+MONTH = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+
+class _FakeSessionRepo:
+    def __init__(self, rounds):
+        self.rounds = rounds
+
+    def list_filtered(self, warehouse_id=None, month=None, **_):
+        return [
+            InventorySession(
+                id=uuid4(),
+                warehouse_id=warehouse_id,
+                month=MONTH,
+                count_number=n,
+                created_by=uuid4(),
+                created_at=MONTH,
+                closed_at=None,
+            )
+            for n in self.rounds
+        ]
+
+
+class _FakeWarehouseRepo:
+    def get_by_id(self, warehouse_id):
+        return object()
+
+
+class _FakeVarianceQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def units_by_round(self, warehouse_id, month):
+        return self.rows
+
+
+def _row(code, r1, r2, r3=None):
+    return ProductRoundUnits(
+        product_id=uuid4(), code=code, description=code, units_by_round={1: r1, 2: r2, 3: r3}
+    )
+
+
+def _use_case(rounds, rows):
+    return GetRoundVarianceUseCase(
+        _FakeSessionRepo(rounds), _FakeWarehouseRepo(), _FakeVarianceQuery(rows)
+    )
+
+
+def test_default_compares_latest_two_rounds_sorted_by_absolute_difference():
+    """Without explicit rounds, round 2 is compared to round 1, largest |difference| first."""
+    rows = [_row("A", 100, 110), _row("B", 10, 40), _row("C", 50, 50)]
+
+    report = _use_case([1, 2], rows).execute(uuid4(), MONTH)
+
+    assert (report.base_round, report.compare_round) == (1, 2)
+    assert [i.code for i in report.items] == ["B", "A", "C"]
+    assert report.items[0].difference == 30
+    assert report.items[0].difference_pct == 300.0
+
+
+def test_thresholds_and_percentage_sort():
+    """min_abs_difference filters rows; pct ordering puts products new in the round first."""
+    rows = [_row("A", 100, 110), _row("B", 10, 40), _row("C", 50, 50), _row("D", None, 5)]
+
+    report = _use_case([1, 2], rows).execute(
+        uuid4(), MONTH, min_abs_difference=5, sort_by="pct"
+    )
+
+    assert [i.code for i in report.items] == ["D", "B", "A"]
+    assert report.items[0].difference_pct is None
+
+
+def test_single_round_raises():
+    """Variance needs two rounds in the month."""
+    with pytest.raises(BusinessRuleViolation):
+        _use_case([1], [_row("A", 1, None)]).execute(uuid4(), MONTH)
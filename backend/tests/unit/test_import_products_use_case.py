@@ -0,0 +1,102 @@
+"""Unit tests for ImportProductsUseCase: validation, unit lookup and chunking."""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.import_products_use_case import ImportProductsUseCase
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation
+
+COLUMNS = ["code", "description", "inventory_unit", "packaging_unit", "conversion_factor"]
+
+
+class _FakeProductRepo:
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.chunks = []
+
+    def upsert_many(self, products):
+        self.chunks.append(products)
+        updated = sum(1 for p in products if p.code in self.existing)
+        self.existing.update(p.code for p in products)
+        return len(products) - updated, updated
+
+
+class _FakeUnitRepo:
+    def __init__(self, *abbreviations):
+        self.units = {a: SimpleNamespace(id=uuid4()) for a in abbreviations}
+        self.lookups = []
+
+    def get_by_abbreviation(self, abbreviation):
+        self.lookups.append(abbreviation)
+        return self.units.get(abbreviation)
+
+
+def _row(code, factor="12", unit="UN", pack="CJ", **extra):
+    return {
+        "code": code,
+        "description": f"Product {code}",
+        "inventory_unit": unit,
+        "packaging_unit": pack,
+        "conversion_factor": factor,
+        **extra,
+    }
+
+
+def test_missing_column_is_rejected():
+    """A header without a required column fails before any row is read."""
+    use_case = ImportProductsUseCase(_FakeProductRepo(), _FakeUnitRepo("UN", "CJ"))
+
+    with pytest.raises(BusinessRuleViolation):
+        use_case.execute(COLUMNS[:-1], [])
+
+
+def test_invalid_rows_are_reported_and_skipped():
+    """Bad factors and unknown units are rejected with their CSV line number."""
+    products = _FakeProductRepo(existing={"A1"})
+    use_case = ImportProductsUseCase(products, _FakeUnitRepo("UN", "CJ"))
+
+    result = use_case.execute(
+        COLUMNS,
+        [_row("A1"), _row("A2", factor="x"), _row("A3", unit="KG"), _row("A4", is_active="no")],
+    )
+
+    assert (result.received, result.inserted, result.updated, result.rejected) == (4, 1, 1, 2)
+    assert result.errors == [
+        "line 3: conversion_factor must be a number",
+        "line 4: unknown measurement unit 'KG'",
+    ]
+    assert [p.is_active for p in products.chunks[0]] == [True, False]
+
+
+def test_non_finite_factors_are_rejected():
+    """nan and inf parse as floats but are not factors: the rows are reported, not imported."""
+    products = _FakeProductRepo()
+    use_case = ImportProductsUseCase(products, _FakeUnitRepo("UN", "CJ"))
+
+    result = use_case.execute(
+        COLUMNS, [_row("A1", factor="nan"), _row("A2", factor="inf"), _row("A3", factor="-Infinity")]
+    )
+
+    assert (result.received, result.rejected, products.chunks) == (3, 3, [])
+    assert result.errors == [
+        "line 2: conversion_factor must be a finite number",
+        "line 3: conversion_factor must be a finite number",
+        "line 4: conversion_factor must be a finite number",
+    ]
+
+
+def test_units_resolved_once_and_rows_chunked():
+    """Each abbreviation is looked up once; a code repeated in a chunk keeps its last row."""
+    products = _FakeProductRepo()
+    units = _FakeUnitRepo("UN", "CJ")
+    use_case = ImportProductsUseCase(products, units, chunk_size=2)
+
+    result = use_case.execute(
+        COLUMNS, [_row("A1", factor="6"), _row("A1", factor="24"), _row("A2"), _row("A3")]
+    )
+
+    assert sorted(units.lookups) == ["CJ", "UN"]
+    assert [[p.code for p in chunk] for chunk in products.chunks] == [["A1", "A2"], ["A3"]]
+    assert products.chunks[0][0].conversion_factor == 24.0
+    assert result.inserted == 3
@@ -0,0 +1,53 @@
+"""Unit tests for InMemoryIdempotencyStore: claim / complete / release and TTL eviction."""
+from app.application.services.idempotency_store import StoredResponse
+from app.infrastructure.idempotency.in_memory_store import InMemoryIdempotencyStore
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_second_claim_returns_stored_response_after_complete():
+    """First claim owns the key; once completed, later claims get the stored response."""
+    store = InMemoryIdempotencyStore(ttl_seconds=60, clock=_Clock())
+
+    assert store.claim("k", b"fp") is None
+    in_flight = store.claim("k", b"fp")
+    assert in_flight is not None and in_flight.response is None
+
+    store.complete("k", StoredResponse(200, b'{"ok":true}'))
+    replay = store.claim("k", b"fp")
+    assert replay is not None
+    assert replay.fingerprint == b"fp"
+    assert replay.response == StoredResponse(200, b'{"ok":true}')
+
+
+def test_released_key_can_be_claimed_again():
+    """A failed request releases its claim so the client's retry runs normally."""
+    store = InMemoryIdempotencyStore(ttl_seconds=60, clock=_Clock())
+    store.claim("k", b"fp")
+    store.release("k")
+
+    assert store.claim("k", b"fp") is None
+
+
+def test_entries_expire_after_ttl_and_size_is_bounded():
+    """Expired keys are evicted oldest first; max_entries caps memory within one TTL."""
+    clock = _Clock()
+    store = InMemoryIdempotencyStore(ttl_seconds=60, max_entries=3, clock=clock)
+    store.claim("a", b"1")
+    clock.now = 30
+    store.claim("b", b"2")
+    clock.now = 61
+
+    assert store.claim("c", b"3") is None
+    assert len(store) == 2  # "a" expired
+
+    for key in ("d", "e"):
+        store.claim(key, b"x")
+    assert len(store) == 3
+    assert store.claim("b", b"2") is None  # evicted by the cap, claimable again
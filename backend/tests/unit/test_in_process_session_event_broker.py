@@ -0,0 +1,52 @@
+"""Unit tests for InProcessSessionEventBroker: cross-thread fan-out per session."""
+import asyncio
+import threading
+from uuid import uuid4
+
+from app.application.services.session_event_publisher import (
+    COUNT_REGISTERED,
+    SessionEvent,
+)
+from app.infrastructure.events.in_process_broker import InProcessSessionEventBroker
+
+
+def test_event_published_from_worker_thread_reaches_subscribers_of_that_session():
+    """Use cases publish from the threadpool; only subscribers of the same session receive it."""
+    broker = InProcessSessionEventBroker()
+    session_id = uuid4()
+
+    async def scenario():
+        watching = [broker.subscribe(session_id), broker.subscribe(session_id)]
+        other = broker.subscribe(uuid4())
+        event = SessionEvent(type=COUNT_REGISTERED, session_id=session_id)
+        thread = threading.Thread(target=broker.publish, args=(event,))
+        thread.start()
+        thread.join()
+        received = [await asyncio.wait_for(s.get(), timeout=1) for s in watching]
+        await asyncio.sleep(0)
+        return received, other.queue.empty()
+
+    received, other_empty = asyncio.run(scenario())
+
+    assert [e.type for e in received] == [COUNT_REGISTERED, COUNT_REGISTERED]
+    assert other_empty
+
+
+def test_slow_subscriber_keeps_latest_events_and_unsubscribe_stops_delivery():
+    """A full queue drops the oldest event; after unsubscribe nothing is delivered."""
+    broker = InProcessSessionEventBroker()
+    session_id = uuid4()
+
+    async def scenario():
+        subscription = broker.subscribe(session_id)
+        for i in range(subscription.queue.maxsize + 5):
+            broker.publish(SessionEvent(type=COUNT_REGISTERED, session_id=session_id, data={"i": i}))
+        await asyncio.sleep(0)
+        first = subscription.queue.get_nowait()
+        broker.unsubscribe(subscription)
+        return first.data["i"], broker.subscriber_count(session_id)
+
+    first_index, remaining = asyncio.run(scenario())
+
+    assert first_index == 5
+    assert remaining == 0
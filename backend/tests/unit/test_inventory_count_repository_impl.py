@@ -0,0 +1,101 @@
+"""Unit tests for InventoryCountRepositoryImpl on SQLite: the real ON CONFLICT guard and aggregates."""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.domain.entities.inventory_count import InventoryCount
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.repositories.inventory_count_repository_impl import (
+    InventoryCountRepositoryImpl,
+)
+
+NOW = datetime(2026, 3, 2, 10, 0, tzinfo=timezone.utc)
+INVENTORY_UNIT, PACKAGING_UNIT = uuid4(), uuid4()
+
+
+def _count(session_id, product_id, packages, counted_at=NOW, unit_id=PACKAGING_UNIT, units=None):
+    return InventoryCount(
+        id=uuid4(),
+        session_id=session_id,
+        product_id=product_id,
+        measure_unit_id=unit_id,
+        quantity_packages=packages,
+        quantity_units=packages * 12 if units is None else units,
+        created_at=NOW,
+        updated_at=NOW,
+        counted_at=counted_at,
+    )
+
+
+def _product(db):
+    product = ProductModel(
+        id=uuid4(),
+        code=f"P-{uuid4().hex[:6]}",
+        description="Product",
+        inventory_unit_id=INVENTORY_UNIT,
+        packaging_unit_id=PACKAGING_UNIT,
+        conversion_factor=12.0,
+        is_active=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    db.add(product)
+    db.commit()
+    return product.id
+
+
+def test_register_fills_pre_created_row_in_place(sqlite_db):
+    """The uncounted row AddProductsToSession saved is filled: same id, now counted."""
+    repo = InventoryCountRepositoryImpl(sqlite_db)
+    session_id, product_id = uuid4(), uuid4()
+    pre_created = repo.save(_count(session_id, product_id, 0, counted_at=None))
+
+    saved = repo.register(_count(session_id, product_id, 3))
+
+    assert saved is not None
+    assert saved.id == pre_created.id
+    assert (saved.quantity_packages, saved.quantity_units) == (3, 36)
+    assert saved.counted_at is not None
+
+
+def test_zero_count_is_not_overwritten_without_recount(sqlite_db):
+    """A product counted as 0 packages is counted: a second register returns None."""
+    repo = InventoryCountRepositoryImpl(sqlite_db)
+    session_id, product_id = uuid4(), uuid4()
+    first = repo.register(_count(session_id, product_id, 0))
+
+    assert repo.register(_count(session_id, product_id, 4)) is None
+    assert [c.quantity_packages for c in repo.list_by_session(session_id)] == [0]
+
+    recounted = repo.register(_count(session_id, product_id, 4), allow_recount=True)
+    assert recounted is not None
+    assert (recounted.id, recounted.quantity_packages) == (first.id, 4)
+
+
+def test_summary_counts_zero_counts_as_counted(sqlite_db):
+    """The close snapshot tells counted (counted_at set, even 0 packages) from pre-created rows."""
+    repo = InventoryCountRepositoryImpl(sqlite_db)
+    session_id = uuid4()
+    repo.save(_count(session_id, _product(sqlite_db), 0, counted_at=None))
+    repo.register(_count(session_id, _product(sqlite_db), 0))
+    repo.register(_count(session_id, _product(sqlite_db), 2))
+
+    snapshot = repo.summarize_by_session(session_id)
+
+    assert (snapshot.total_products, snapshot.counted_products, snapshot.uncounted_products) == (3, 2, 1)
+
+
+def test_totals_use_stored_units_and_packages_of_every_count(sqlite_db):
+    """Units are the registered quantity_units; packages add every count's stored packages."""
+    repo = InventoryCountRepositoryImpl(sqlite_db)
+    first, second = uuid4(), uuid4()
+    product_id = _product(sqlite_db)
+    repo.register(_count(first, product_id, 2))
+    # 30 entered in the inventory unit: 30 units, stored as 3 (rounded) packages
+    repo.register(_count(second, product_id, 3, unit_id=INVENTORY_UNIT, units=30))
+
+    [total] = repo.product_totals([first, second])
+    snapshot = repo.summarize_by_session(second)
+
+    assert (total.total_packages, total.total_units, total.warehouses_count) == (5, 54, 2)
+    assert snapshot.total_packages == 3
+    assert [u.total_units for u in snapshot.unit_totals] == [30]
@@ -0,0 +1,227 @@
+"""Unit tests for InventorySessionRepositoryImpl on SQLite: save conflicts, closes, counts racing a close, get_summary."""
+from dataclasses import replace
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.application.use_cases.close_inventory_session_use_case import (
+    CloseInventorySessionUseCase,
+)
+from app.domain.entities.inventory_count import InventoryCount
+from app.domain.entities.inventory_session import InventorySession
+from app.domain.entities.inventory_session_snapshot import InventorySessionSnapshot
+from app.domain.entities.user_role import UserRole
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation, ConcurrencyConflict
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.models.user_model import UserModel
+from app.infrastructure.models.warehouse_model import WarehouseModel
+from app.infrastructure.repositories.inventory_count_repository_impl import (
+    InventoryCountRepositoryImpl,
+)
+from app.infrastructure.repositories.inventory_session_repository_impl import (
+    InventorySessionRepositoryImpl,
+)
+from app.infrastructure.repositories.inventory_session_snapshot_repository_impl import (
+    InventorySessionSnapshotRepositoryImpl,
+)
+
+
+def _session(warehouse_id, count_number=1):
+    return InventorySession(
+        id=uuid4(),
+        warehouse_id=warehouse_id,
+        month=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        count_number=count_number,
+        created_by=uuid4(),
+        created_at=datetime.now(timezone.utc),
+        closed_at=None,
+    )
+
+
+def _count(session_id, product_id, counted_at):
+    now = datetime.now(timezone.utc)
+    return InventoryCount(
+        id=uuid4(),
+        session_id=session_id,
+        product_id=product_id,
+        measure_unit_id=uuid4(),
+        quantity_packages=2,
+        quantity_units=24,
+        created_at=now,
+        updated_at=now,
+        counted_at=counted_at,
+    )
+
+
+def _product(db):
+    now = datetime.now(timezone.utc)
+    product = ProductModel(
+        id=uuid4(),
+        code=f"P-{uuid4().hex[:6]}",
+        description="Product",
+        inventory_unit_id=uuid4(),
+        packaging_unit_id=uuid4(),
+        conversion_factor=12.0,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    db.add(product)
+    db.commit()
+    return product.id
+
+
+def test_taken_count_number_becomes_concurrency_conflict(sqlite_db):
+    """A uq_inventory_session violation is the race the use case retries."""
+    repo = InventorySessionRepositoryImpl(sqlite_db)
+    warehouse_id = uuid4()
+    repo.save(_session(warehouse_id))
+
+    with pytest.raises(ConcurrencyConflict):
+        repo.save(_session(warehouse_id))
+
+
+def test_other_integrity_errors_are_raised_unchanged(sqlite_db):
+    """NOT NULL and primary key violations are bugs, not races: no ConcurrencyConflict."""
+    repo = InventorySessionRepositoryImpl(sqlite_db)
+    saved = repo.save(_session(uuid4()))
+
+    with pytest.raises(IntegrityError):
+        repo.save(replace(_session(uuid4()), created_by=None))
+    with pytest.raises(IntegrityError):
+        repo.save(replace(_session(uuid4(), count_number=2), id=saved.id))
+
+
+def test_second_close_is_rejected_as_already_closed(sqlite_db):
+    """A close that loses the race gets "already closed", not an IntegrityError on the snapshot."""
+    repo = InventorySessionRepositoryImpl(sqlite_db)
+    session = repo.save(_session(uuid4()))
+    closed = replace(session, closed_at=datetime.now(timezone.utc))
+    snapshot = InventorySessionSnapshot(
+        session_id=session.id,
+        total_products=0,
+        counted_products=0,
+        uncounted_products=0,
+        total_packages=0,
+        created_at=closed.closed_at,
+    )
+    repo.close(closed, lambda: snapshot)
+
+    with pytest.raises(BusinessRuleViolation, match="already closed"):
+        repo.close(closed, lambda: snapshot)
+
+
+def test_count_committed_while_closing_is_in_the_snapshot(sqlite_db):
+    """A count that commits after the close request read the session is summarized, not lost."""
+    session_repo = InventorySessionRepositoryImpl(sqlite_db)
+    count_repo = InventoryCountRepositoryImpl(sqlite_db)
+    session = session_repo.save(_session(uuid4()))
+    close = session_repo.close
+
+    def close_after_a_late_count(closed, summarize):
+        count_repo.register(_count(session.id, _product(sqlite_db), datetime.now(timezone.utc)))
+        return close(closed, summarize)
+
+    session_repo.close = close_after_a_late_count
+    CloseInventorySessionUseCase(session_repo, count_repo).execute(session.id)
+
+    snapshot = InventorySessionSnapshotRepositoryImpl(sqlite_db).get_by_session_id(session.id)
+    assert (snapshot.total_products, snapshot.counted_products) == (1, 1)
+
+
+def test_counts_written_after_close_are_rejected(sqlite_db):
+    """Register and AddProducts writes re-check closed_at, even when the caller's read was stale."""
+    session_repo = InventorySessionRepositoryImpl(sqlite_db)
+    count_repo = InventoryCountRepositoryImpl(sqlite_db)
+    session = session_repo.save(_session(uuid4()))
+    CloseInventorySessionUseCase(session_repo, count_repo).execute(session.id)
+
+    with pytest.raises(BusinessRuleViolation, match="closed"):
+        count_repo.register(_count(session.id, _product(sqlite_db), datetime.now(timezone.utc)))
+    with pytest.raises(BusinessRuleViolation, match="closed"):
+        count_repo.save(_count(session.id, _product(sqlite_db), None))
+    assert count_repo.list_by_session(session.id) == []
+
+
+def _creator_and_warehouse(db):
+    now = datetime.now(timezone.utc)
+    user_id, warehouse_id = uuid4(), uuid4()
+    db.add(
+        UserModel(
+            id=user_id,
+            identification="1",
+            name="Admin",
+            email="admin@example.com",
+            role=UserRole.ADMIN.value,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    db.add(
+        WarehouseModel(
+            id=warehouse_id,
+            code="W1",
+            description="Warehouse 1",
+            status="ACTIVE",
+            created_at=now,
+            updated_at=now,
+        )
+    )
+    db.commit()
+    return user_id, warehouse_id
+
+
+def test_summary_of_open_session_counts_its_rows(sqlite_db):
+    """Without a snapshot, products_count falls back to the correlated count of inventory_counts."""
+    repo = InventorySessionRepositoryImpl(sqlite_db)
+    count_repo = InventoryCountRepositoryImpl(sqlite_db)
+    user_id, warehouse_id = _creator_and_warehouse(sqlite_db)
+    session = repo.save(replace(_session(warehouse_id), created_by=user_id))
+    for _ in range(2):
+        count_repo.save(_count(session.id, _product(sqlite_db), None))
+
+    summary = repo.get_summary(session.id)
+
+    assert (summary.warehouse_description, summary.created_by_name) == ("Warehouse 1", "Admin")
+    assert (summary.products_count, summary.closed_at) == (2, None)
+    assert repo.get_summary(uuid4()) is None
+
+
+def test_summary_of_closed_session_reads_the_snapshot(sqlite_db):
+    """A closed session's products_count is the snapshot total, not a fresh count of rows."""
+    repo = InventorySessionRepositoryImpl(sqlite_db)
+    count_repo = InventoryCountRepositoryImpl(sqlite_db)
+    user_id, warehouse_id = _creator_and_warehouse(sqlite_db)
+    session = repo.save(replace(_session(warehouse_id), created_by=user_id))
+    count_repo.save(_count(session.id, _product(sqlite_db), None))
+    closed = replace(session, closed_at=datetime.now(timezone.utc))
+    repo.close(
+        closed,
+        lambda: InventorySessionSnapshot(
+            session_id=session.id,
+            total_products=5,
+            counted_products=0,
+            uncounted_products=5,
+            total_packages=0,
+            created_at=closed.closed_at,
+        ),
+    )
+
+    summary = repo.get_summary(session.id)
+
+    assert summary.products_count == 5
+    assert summary.closed_at is not None
+
+
+def test_summary_keeps_sessions_whose_creator_or_warehouse_is_gone(sqlite_db):
+    """Outer joins: a missing user or warehouse gives empty names, not a missing session."""
+    repo = InventorySessionRepositoryImpl(sqlite_db)
+    session = repo.save(_session(uuid4()))
+
+    summary = repo.get_summary(session.id)
+
+    assert summary.id == session.id
+    assert (summary.warehouse_description, summary.created_by_name) == ("", "")
+    assert summary.products_count == 0
@@ -0,0 +1,203 @@
+"""Route tests for the session list cache: normalized keys, tag invalidation on writes, single flight."""
+import asyncio
+import threading
+from datetime import datetime
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.domain.entities.user_role import UserRole
+from app.infrastructure.cache import Cache, InMemoryCacheBackend
+from app.infrastructure.models.measurement_unit_model import MeasurementUnitModel
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.models.user_model import UserModel
+from app.infrastructure.models.warehouse_model import WarehouseModel
+from app.presentation.routes import inventory_session_routes
+
+NOW = datetime(2025, 2, 1)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A fresh in-memory session list cache per test."""
+    cache = Cache(InMemoryCacheBackend(), "session-list", 30)
+    monkeypatch.setattr(inventory_session_routes, "_session_list_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def world(sqlite_db):
+    """One admin user, two warehouses and two products with a measurement unit."""
+    user_id, unit_id = uuid4(), uuid4()
+    warehouses = [uuid4(), uuid4()]
+    products = [uuid4(), uuid4()]
+    sqlite_db.add(
+        UserModel(
+            id=user_id,
+            identification="1",
+            name="Admin",
+            email="admin@example.com",
+            role=UserRole.ADMIN.value,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+    )
+    sqlite_db.add(
+        MeasurementUnitModel(
+            id=unit_id, name="Unidad", abbreviation="UN", created_at=NOW, updated_at=NOW
+        )
+    )
+    for n, warehouse_id in enumerate(warehouses):
+        sqlite_db.add(
+            WarehouseModel(
+                id=warehouse_id,
+                code=f"W{n}",
+                description=f"Warehouse {n}",
+                status="ACTIVE",
+                created_at=NOW,
+                updated_at=NOW,
+            )
+        )
+    for n, product_id in enumerate(products):
+        sqlite_db.add(
+            ProductModel(
+                id=product_id,
+                code=f"P{n}",
+                description=f"Product {n}",
+                inventory_unit_id=unit_id,
+                packaging_unit_id=unit_id,
+                conversion_factor=1.0,
+                is_active=True,
+                created_at=NOW,
+                updated_at=NOW,
+            )
+        )
+    sqlite_db.commit()
+    return {"user_id": user_id, "warehouses": warehouses, "products": products}
+
+
+@pytest.fixture
+def client(api_client, world):
+    return api_client(
+        inventory_session_routes.router,
+        current_user={"sub": str(world["user_id"]), "role": UserRole.ADMIN.value},
+    )
+
+
+def _create_session(client, world):
+    response = client.post(
+        "/inventory-sessions/",
+        json={
+            "warehouse_id": str(world["warehouses"][0]),
+            "month": "2025-02-01T00:00:00Z",
+            "created_by": str(world["user_id"]),
+        },
+    )
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def _list(client, **params):
+    response = client.get("/inventory-sessions/", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_equivalent_queries_share_one_cache_entry(api_client, world, cache):
+    """Month spelling, unknown status values and warehouse order do not split the cache."""
+    first, second = world["warehouses"]
+
+    def leader(warehouses):
+        user = {"sub": str(uuid4()), "role": UserRole.PROCESS_LEADER.value, "warehouses": warehouses}
+        return api_client(inventory_session_routes.router, current_user=user)
+
+    _list(leader([str(first), str(second)]), month="2025-02")
+    _list(leader([str(second), str(first)]), month="2025-2", status="bogus")
+
+    metrics = cache.metrics()
+    assert (metrics.loads, metrics.hits) == (1, 1)
+
+
+def test_create_close_and_add_products_invalidate_the_list(client, world, cache):
+    """Each session write drops the cached lists that could include its warehouse."""
+    assert _list(client) == []
+
+    session_id = _create_session(client, world)
+    [row] = _list(client)
+    assert (row["id"], row["products_count"]) == (session_id, 0)
+
+    added = client.post(
+        f"/inventory-sessions/{session_id}/products",
+        json={"product_ids": [str(world["products"][0])]},
+    )
+    assert added.status_code == 200
+    assert _list(client)[0]["products_count"] == 1
+
+    assert client.put(f"/inventory-sessions/{session_id}/close").status_code == 200
+    assert _list(client)[0]["status"] == "CLOSED"
+    assert cache.metrics().loads == 4
+
+
+def test_only_counts_that_insert_a_row_invalidate_the_list(client, world, cache):
+    """A count on a new product changes products_count; filling a pre-created row does not."""
+    session_id = _create_session(client, world)
+    pre_created, new = world["products"]
+    client.post(
+        f"/inventory-sessions/{session_id}/products", json={"product_ids": [str(pre_created)]}
+    )
+    assert _list(client)[0]["products_count"] == 1
+    loads = cache.metrics().loads
+
+    filled = client.post(
+        f"/inventory-sessions/{session_id}/counts",
+        json={"product_id": str(pre_created), "packaging_quantity": 4},
+    )
+    assert filled.status_code == 200
+    _list(client)
+    assert cache.metrics().loads == loads
+
+    inserted = client.post(
+        f"/inventory-sessions/{session_id}/counts",
+        json={"product_id": str(new), "packaging_quantity": 0},
+    )
+    assert inserted.status_code == 200
+    assert _list(client)[0]["products_count"] == 2
+    assert cache.metrics().loads == loads + 1
+
+
+def test_concurrent_identical_requests_run_one_load(client, cache, monkeypatch):
+    """Misses on the same key wait for the first caller's load instead of querying again."""
+    release = threading.Event()
+    executions = []
+
+    class _SlowListUseCase:
+        def __init__(self, *repositories):
+            pass
+
+        def execute(self, **filters):
+            executions.append(filters)
+            release.wait(timeout=5)
+            return []
+
+    monkeypatch.setattr(inventory_session_routes, "ListInventorySessionsUseCase", _SlowListUseCase)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            requests = [
+                asyncio.create_task(http.get("/inventory-sessions/", params={"month": "2025-02"}))
+                for _ in range(4)
+            ]
+            for _ in range(500):
+                if cache.metrics().coalesced == 3:
+                    break
+                await asyncio.sleep(0.01)
+            release.set()
+            return await asyncio.gather(*requests)
+
+    responses = asyncio.run(scenario())
+
+    assert [r.json() for r in responses] == [[]] * 4
+    assert len(executions) == 1
+    assert (cache.metrics().loads, cache.metrics().coalesced) == (1, 3)
@@ -0,0 +1,76 @@
+"""Unit tests for the orjson responses: same JSON as the Pydantic response_model path."""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from app.presentation.responses import ORJSONResponse, dump_json, trusted_json
+from app.presentation.schemas.inventory_count_schema import InventoryCountResponse
+from app.presentation.schemas.inventory_session_schema import InventorySessionListResponse
+
+
+def _count_row(**overrides):
+    row = {
+        "product": {"id": uuid4(), "code": "P001", "description": "Azúcar 1kg", "conversion_factor": 0.333},
+        "measure_unit": None,
+        "packaging_quantity": 3,
+        "total_units": 1,
+        "created_at": datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        "updated_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_trusted_rows_render_like_response_model():
+    """Dict rows through orjson give the bytes Pydantic gives for the validated models."""
+    rows = [
+        _count_row(),
+        _count_row(
+            measure_unit={"id": uuid4(), "name": "Unidad", "abbreviation": "UND"},
+            created_at=datetime(2026, 1, 2, 3, 4, 5),
+            updated_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-5))),
+        ),
+    ]
+    adapter = TypeAdapter(list[InventoryCountResponse])
+
+    assert dump_json(rows) == adapter.dump_json(adapter.validate_python(rows))
+
+
+def test_utc_datetimes_use_z_suffix():
+    """UTC renders as "Z" like Pydantic, not "+00:00"."""
+    month = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    row = {
+        "id": uuid4(),
+        "warehouse_id": uuid4(),
+        "warehouse_description": "Bodega Central",
+        "month": month,
+        "count_number": 1,
+        "created_by_id": uuid4(),
+        "created_by_name": "Admin",
+        "created_at": month,
+        "closed_at": None,
+        "status": "OPEN",
+        "products_count": 0,
+    }
+    adapter = TypeAdapter(InventorySessionListResponse)
+
+    assert b'"month":"2026-03-01T00:00:00Z"' in dump_json(row)
+    assert dump_json(row) == adapter.dump_json(adapter.validate_python(row))
+
+
+def test_trusted_json_serializes_dataclasses_and_keeps_headers():
+    """Dataclasses need no conversion; extra headers (e.g. sync watermark) are kept."""
+
+    @dataclass
+    class Row:
+        id: str
+        total: int
+
+    response = trusted_json([Row("a", 1)], headers={"X-Sync-Watermark": "w"})
+
+    assert isinstance(response, ORJSONResponse)
+    assert response.body == b'[{"id":"a","total":1}]'
+    assert response.headers["x-sync-watermark"] == "w"
+    assert response.media_type == "application/json"
@@ -0,0 +1,86 @@
+"""Unit tests for ListInventoryCountsUseCase: delta reads by watermark (?since=)."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.inventory.list_inventory_counts_use_case import (
+    SYNC_OVERLAP,
+    ListInventoryCountsUseCase,
+    next_watermark,
+)
+from app.domain.entities.inventory_count import InventoryCount
+from app.domain.exceptions.business_exceptions import NotFoundException
+
+T0 = datetime(2025, 2, 1, 10, 0, tzinfo=timezone.utc)
+
+
+class _FakeSessionRepo:
+    def __init__(self, exists=True):
+        self.exists = exists
+
+    def get_by_id(self, session_id):
+        return object() if self.exists else None
+
+
+class _FakeCountRepo:
+    def __init__(self, counts):
+        self.counts = counts
+        self.since_calls = []
+
+    def list_by_session(self, session_id):
+        return list(self.counts)
+
+    def list_by_session_updated_since(self, session_id, since):
+        self.since_calls.append(since)
+        return [c for c in self.counts if c.updated_at > since]
+
+
+def _count(updated_at):
+    return InventoryCount(
+        id=uuid4(),
+        session_id=uuid4(),
+        product_id=uuid4(),
+        measure_unit_id=uuid4(),
+        quantity_packages=1,
+        quantity_units=12,
+        created_at=updated_at,
+        updated_at=updated_at,
+    )
+
+
+def test_without_since_returns_full_list():
+    """No watermark: same full list as before."""
+    counts = [_count(T0), _count(T0 + timedelta(minutes=1))]
+    use_case = ListInventoryCountsUseCase(_FakeSessionRepo(), _FakeCountRepo(counts))
+
+    assert use_case.execute(uuid4()) == counts
+
+
+def test_since_reads_changes_with_overlap_window():
+    """Rows older than the overlap window are skipped; the window itself is re-read."""
+    old = _count(T0 - timedelta(minutes=10))
+    in_window = _count(T0 - timedelta(seconds=1))
+    new = _count(T0 + timedelta(seconds=30))
+    count_repo = _FakeCountRepo([old, in_window, new])
+    use_case = ListInventoryCountsUseCase(_FakeSessionRepo(), count_repo)
+
+    result = use_case.execute(uuid4(), since=T0)
+
+    assert result == [in_window, new]
+    assert count_repo.since_calls == [T0 - SYNC_OVERLAP]
+
+
+def test_since_on_missing_session_raises():
+    """Unknown session is 404 regardless of since."""
+    use_case = ListInventoryCountsUseCase(_FakeSessionRepo(exists=False), _FakeCountRepo([]))
+
+    with pytest.raises(NotFoundException):
+        use_case.execute(uuid4(), since=T0)
+
+
+def test_watermark_never_moves_backwards():
+    """Only overlap rows returned: the watermark stays at since; naive stamps read as UTC."""
+    assert next_watermark([_count(T0 - timedelta(seconds=2))], T0) == T0
+    assert next_watermark([_count(datetime(2025, 2, 1, 11, 0))], T0) == T0 + timedelta(hours=1)
+    assert next_watermark([], None) is None
@@ -0,0 +1,97 @@
+"""Unit tests for MonthlyInventoryReportUseCase: latest closed round per warehouse, caching, streaming."""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.application.services.immutable_result_cache import ImmutableResultCache
+from app.application.use_cases.reports import MonthlyInventoryReportUseCase
+from app.domain.entities.inventory_session import InventorySession
+
+MONTH = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+
+def _session(warehouse_id, count_number, closed=True):
+    return InventorySession(
+        id=uuid4(),
+        warehouse_id=warehouse_id,
+        month=MONTH,
+        count_number=count_number,
+        created_by=uuid4(),
+        created_at=MONTH,
+        closed_at=MONTH if closed else None,
+    )
+
+
+class _FakeSessionRepo:
+    def __init__(self, sessions):
+        self.sessions = sessions
+
+    def list_filtered(self, month=None, **_):
+        return self.sessions
+
+
+class _FakeQuery:
+    def __init__(self):
+        self.calls = []
+        self.streamed = []
+
+    def product_totals(self, session_ids):
+        self.calls.append(list(session_ids))
+        return []
+
+    def iter_product_totals(self, session_ids):
+        self.streamed.append(list(session_ids))
+        return iter([])
+
+
+def test_uses_latest_closed_round_per_warehouse():
+    """Open rounds are skipped; the highest closed count_number is used per warehouse."""
+    wh_a, wh_b = uuid4(), uuid4()
+    a1, a2, a3 = _session(wh_a, 1), _session(wh_a, 2), _session(wh_a, 3, closed=False)
+    b1 = _session(wh_b, 1)
+    query = _FakeQuery()
+    use_case = MonthlyInventoryReportUseCase(_FakeSessionRepo([a1, a2, a3, b1]), query)
+
+    report = use_case.execute(MONTH)
+
+    assert set(query.calls[0]) == {a2.id, b1.id}
+    assert report.is_final is False
+
+
+def test_final_month_is_cached_and_open_month_is_not():
+    """Reports are served from cache only when every session of the month is closed."""
+    wh = uuid4()
+    cache = ImmutableResultCache()
+    closed_query = _FakeQuery()
+    closed_use_case = MonthlyInventoryReportUseCase(
+        _FakeSessionRepo([_session(wh, 1)]), closed_query, cache=cache
+    )
+    closed_use_case.execute(MONTH)
+    closed_use_case.execute(MONTH)
+    assert len(closed_query.calls) == 1
+
+    open_query = _FakeQuery()
+    open_use_case = MonthlyInventoryReportUseCase(
+        _FakeSessionRepo([_session(wh, 1), _session(wh, 2, closed=False)]),
+        open_query,
+        cache=cache,
+    )
+    open_use_case.execute(MONTH)
+    open_use_case.execute(MONTH)
+    assert len(open_query.calls) == 2
+
+
+def test_iter_items_streams_open_months_and_replays_cached_reports():
+    """Exports read rows straight from the query, unless the final report is already cached."""
+    wh = uuid4()
+    cache = ImmutableResultCache()
+    query = _FakeQuery()
+    use_case = MonthlyInventoryReportUseCase(
+        _FakeSessionRepo([_session(wh, 1)]), query, cache=cache
+    )
+
+    assert list(use_case.iter_items(MONTH)) == []
+    assert (len(query.calls), len(query.streamed)) == (0, 1)
+
+    use_case.execute(MONTH)
+    assert list(use_case.iter_items(MONTH)) == []
+    assert (len(query.calls), len(query.streamed)) == (1, 1)
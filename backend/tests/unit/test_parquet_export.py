@@ -0,0 +1,161 @@
+"""Unit tests for the incremental Parquet export on SQLite: layout, schema, manifest and watermark."""
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pyarrow.parquet as pq
+import pytest
+
+from app.infrastructure.export.parquet_export import (
+    EXPORT_SCHEMA,
+    MANIFEST_FILE,
+    MANIFEST_LOG_FILE,
+    WATERMARK_OVERLAP,
+    export_closed_sessions,
+)
+from app.infrastructure.models.inventory_count_model import InventoryCountModel
+from app.infrastructure.models.inventory_session_model import InventorySessionModel
+from app.infrastructure.models.measurement_unit_model import MeasurementUnitModel
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.models.warehouse_model import WarehouseModel
+
+MONTH = datetime(2025, 2, 1)
+CLOSED = datetime(2025, 2, 20, 18, 0)
+
+
+@pytest.fixture
+def world(sqlite_db):
+    """One warehouse (W1), two units and three products."""
+    warehouse_id, unit_id, box_id = uuid4(), uuid4(), uuid4()
+    sqlite_db.add(
+        WarehouseModel(
+            id=warehouse_id,
+            code="W1",
+            description="Warehouse 1",
+            status="ACTIVE",
+            created_at=MONTH,
+            updated_at=MONTH,
+        )
+    )
+    for id_, abbreviation in [(unit_id, "UN"), (box_id, "CJ")]:
+        sqlite_db.add(
+            MeasurementUnitModel(
+                id=id_, name=abbreviation, abbreviation=abbreviation, created_at=MONTH, updated_at=MONTH
+            )
+        )
+    products = [uuid4() for _ in range(3)]
+    for n, product_id in enumerate(products):
+        sqlite_db.add(
+            ProductModel(
+                id=product_id,
+                code=f"P-{n}",
+                description=f"Product {n}",
+                inventory_unit_id=unit_id,
+                packaging_unit_id=box_id,
+                conversion_factor=12.0,
+                is_active=True,
+                created_at=MONTH,
+                updated_at=MONTH,
+            )
+        )
+    sqlite_db.commit()
+    return {"db": sqlite_db, "warehouse_id": warehouse_id, "box_id": box_id, "products": products}
+
+
+def _session(world, count_number, closed_at=None, month=MONTH):
+    db = world["db"]
+    session = InventorySessionModel(
+        id=uuid4(),
+        warehouse_id=world["warehouse_id"],
+        month=month,
+        count_number=count_number,
+        created_by=uuid4(),
+        created_at=month,
+        closed_at=closed_at,
+    )
+    db.add(session)
+    for packages, product_id in enumerate(world["products"], start=1):
+        db.add(
+            InventoryCountModel(
+                id=uuid4(),
+                session_id=session.id,
+                product_id=product_id,
+                measure_unit_id=world["box_id"],
+                quantity_packages=packages,
+                quantity_units=packages * 12,
+                created_at=month,
+                updated_at=month,
+                counted_at=month,
+            )
+        )
+    db.commit()
+    return session
+
+
+def _export(world, tmp_path):
+    return export_closed_sessions(str(tmp_path), batch_rows=2, db=world["db"])
+
+
+def _manifest(tmp_path):
+    return json.loads((tmp_path / MANIFEST_FILE).read_text())
+
+
+def test_closed_session_is_written_to_its_partition(world, tmp_path):
+    """One file per closed session under period=/warehouse=, in EXPORT_SCHEMA; open sessions wait."""
+    closed = _session(world, 1, closed_at=CLOSED)
+    _session(world, 2)
+
+    assert _export(world, tmp_path) == {"sessions_exported": 1, "rows_exported": 3}
+
+    path = tmp_path / "period=2025-02" / "warehouse=W1" / f"session-{closed.id}.parquet"
+    table = pq.ParquetFile(path).read()
+    assert table.schema.equals(EXPORT_SCHEMA)
+    assert table.column("product_code").to_pylist() == ["P-0", "P-1", "P-2"]
+    assert table.column("quantity_units").to_pylist() == [12, 24, 36]
+    manifest = _manifest(tmp_path)
+    assert manifest["sessions"][str(closed.id)]["rows"] == 3
+    assert manifest["closed_at_watermark"] == CLOSED.isoformat()
+    assert not (tmp_path / MANIFEST_LOG_FILE).exists()
+
+
+def test_second_run_writes_only_the_newly_closed_session(world, tmp_path):
+    """Closing another session and exporting again leaves the first partition untouched."""
+    first = _session(world, 1, closed_at=CLOSED)
+    second = _session(world, 2, month=datetime(2025, 3, 1))
+    _export(world, tmp_path)
+    first_path = tmp_path / _manifest(tmp_path)["sessions"][str(first.id)]["path"]
+    first_written = first_path.stat().st_mtime_ns
+
+    second.closed_at = CLOSED + timedelta(days=30)
+    world["db"].commit()
+
+    assert _export(world, tmp_path) == {"sessions_exported": 1, "rows_exported": 3}
+    assert first_path.stat().st_mtime_ns == first_written
+    assert (tmp_path / "period=2025-03" / "warehouse=W1" / f"session-{second.id}.parquet").exists()
+    assert _manifest(tmp_path)["closed_at_watermark"] == second.closed_at.isoformat()
+    assert _export(world, tmp_path) == {"sessions_exported": 0, "rows_exported": 0}
+
+
+def test_interrupted_run_resumes_from_the_log(world, tmp_path):
+    """Sessions appended to the log before a crash are not exported again; a torn line is."""
+    logged = _session(world, 1, closed_at=CLOSED)
+    torn = _session(world, 2, closed_at=CLOSED + timedelta(seconds=1))
+    entry = {"session_id": str(logged.id), "path": "p", "rows": 3, "closed_at": CLOSED.isoformat()}
+    (tmp_path / MANIFEST_LOG_FILE).write_text(json.dumps(entry) + '\n{"session_id": "')
+
+    assert _export(world, tmp_path) == {"sessions_exported": 1, "rows_exported": 3}
+    assert set(_manifest(tmp_path)["sessions"]) == {str(logged.id), str(torn.id)}
+    assert not (tmp_path / MANIFEST_LOG_FILE).exists()
+
+
+def test_sessions_behind_the_watermark_are_not_queried(world, tmp_path):
+    """Only sessions closed after the watermark (minus the overlap) are read from the database."""
+    _session(world, 1, closed_at=CLOSED)
+    _export(world, tmp_path)
+    behind = _session(world, 2, closed_at=CLOSED - WATERMARK_OVERLAP - timedelta(seconds=1))
+    late = _session(world, 3, closed_at=CLOSED - WATERMARK_OVERLAP + timedelta(seconds=1))
+
+    assert _export(world, tmp_path)["sessions_exported"] == 1
+    sessions = _manifest(tmp_path)["sessions"]
+    assert str(late.id) in sessions
+    assert str(behind.id) not in sessions
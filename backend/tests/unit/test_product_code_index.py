@@ -0,0 +1,66 @@
+"""Unit tests for ProductCodeIndex: lazy load, invalidation, TTL and throttled miss reloads."""
+from uuid import uuid4
+
+from app.application.services.product_code_index import ProductCodeIndex
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Loader:
+    def __init__(self, codes):
+        self.codes = dict(codes)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return dict(self.codes)
+
+
+def test_loads_once_and_reloads_after_invalidate():
+    """Hits are served from memory; invalidate() forces the next lookup to reload."""
+    product_id = uuid4()
+    loader = _Loader({"P001": product_id})
+    index = ProductCodeIndex(clock=_Clock())
+
+    assert index.lookup("P001", loader) == product_id
+    assert index.lookup("P001", loader) == product_id
+    assert loader.calls == 1
+
+    index.invalidate()
+    index.lookup("P001", loader)
+    assert loader.calls == 2
+
+
+def test_miss_reloads_at_most_once_per_interval():
+    """A product created by another worker is found on miss; repeated bad scans do not reload."""
+    clock = _Clock()
+    loader = _Loader({})
+    index = ProductCodeIndex(ttl_seconds=300, miss_reload_seconds=5, clock=clock)
+    assert index.lookup("NEW", loader) is None
+
+    new_id = uuid4()
+    loader.codes["NEW"] = new_id
+    clock.now = 1
+    assert index.lookup("NEW", loader) is None  # within the miss interval
+    clock.now = 6
+    assert index.lookup("NEW", loader) == new_id
+    assert loader.calls == 2
+
+
+def test_entries_expire_after_ttl():
+    """Codes changed elsewhere are picked up once the TTL elapses."""
+    clock = _Clock()
+    old_id, new_id = uuid4(), uuid4()
+    loader = _Loader({"P001": old_id})
+    index = ProductCodeIndex(ttl_seconds=300, clock=clock)
+    index.lookup("P001", loader)
+
+    loader.codes["P001"] = new_id
+    clock.now = 301
+    assert index.lookup("P001", loader) == new_id
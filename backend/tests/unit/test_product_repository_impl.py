@@ -0,0 +1,73 @@
+"""Unit tests for ProductRepositoryImpl.search_active on SQLite: FTS5 trigram, LIKE fallback, escaping."""
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.infrastructure.database.product_search_index import ensure_product_search_index
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.repositories.product_repository_impl import ProductRepositoryImpl
+
+NOW = datetime(2025, 2, 1)
+
+
+@pytest.fixture
+def repo(sqlite_db):
+    # create_all already made products_fts; the startup hook must be a safe re-run on top
+    ensure_product_search_index(sqlite_db.get_bind())
+    unit_id = uuid4()
+    for code, description, is_active in [
+        ("JU-01", "Jugo de naranja 1L", True),
+        ("NA-02", "Naranja fresca", True),
+        ("NA-03", "Naranja descontinuada", False),
+        ("DS-10", "Descuento 50% caja", True),
+        ("DS-11", "Descuento 50 pct caja", True),
+        ("AB_1", "Tubo a_b", True),
+        ("ABX1", "Tubo axb", True),
+        ("TB-12", 'Tubo 1/2" PVC', True),
+    ]:
+        sqlite_db.add(
+            ProductModel(
+                id=uuid4(),
+                code=code,
+                description=description,
+                inventory_unit_id=unit_id,
+                packaging_unit_id=unit_id,
+                conversion_factor=1.0,
+                is_active=is_active,
+                created_at=NOW,
+                updated_at=NOW,
+            )
+        )
+    sqlite_db.commit()
+    return ProductRepositoryImpl(sqlite_db)
+
+
+def _codes(repo, query, limit=20):
+    return [p.code for p in repo.search_active(query, limit)]
+
+
+def test_trigram_search_matches_substrings_and_ranks_code_prefixes_first(repo):
+    """3+ characters go through products_fts: case-insensitive substrings, active products only."""
+    assert _codes(repo, "ARANJ") == ["NA-02", "JU-01"]
+    assert _codes(repo, "NA-") == ["NA-02"]
+
+
+def test_short_queries_fall_back_to_like(repo):
+    """Trigrams cannot match under 3 characters, so short queries use LIKE on description."""
+    assert _codes(repo, "fr") == ["NA-02"]
+    assert _codes(repo, "ju") == ["JU-01"]
+
+
+def test_like_wildcards_are_matched_literally(repo):
+    """% and _ in a query are plain characters, both in the code prefix and the description."""
+    assert _codes(repo, "%") == ["DS-10"]
+    assert _codes(repo, "_") == ["AB_1"]
+    assert _codes(repo, "AB_") == ["AB_1"]
+    assert _codes(repo, "50%") == ["DS-10"]
+
+
+def test_double_quotes_are_escaped_in_both_paths(repo):
+    """A quote neither breaks the FTS phrase nor the LIKE pattern."""
+    assert _codes(repo, '"') == ["TB-12"]
+    assert _codes(repo, '1/2"') == ["TB-12"]
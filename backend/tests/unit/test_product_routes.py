@@ -0,0 +1,88 @@
+"""Route tests for POST /products/import: encoding checked up front, code index always invalidated."""
+from datetime import datetime
+from functools import partial
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.import_products_use_case import ImportProductsUseCase
+from app.infrastructure.models.measurement_unit_model import MeasurementUnitModel
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.repositories.product_repository_impl import ProductRepositoryImpl
+from app.presentation.routes import product_routes
+
+NOW = datetime(2025, 2, 1)
+HEADER = b"code,description,inventory_unit,packaging_unit,conversion_factor\n"
+
+
+class _FakeCodeIndex:
+    def __init__(self):
+        self.invalidations = 0
+
+    def invalidate(self):
+        self.invalidations += 1
+
+
+@pytest.fixture
+def code_index(monkeypatch):
+    index = _FakeCodeIndex()
+    monkeypatch.setattr(product_routes, "get_product_code_index", lambda: index)
+    return index
+
+
+def _units(db):
+    for abbreviation in ("UN", "CJ"):
+        db.add(
+            MeasurementUnitModel(
+                id=uuid4(), name=abbreviation, abbreviation=abbreviation, created_at=NOW, updated_at=NOW
+            )
+        )
+    db.commit()
+
+
+def _csv(rows):
+    return HEADER + b"".join(f"P-{n},Product {n},UN,CJ,12\n".encode() for n in range(rows))
+
+
+def test_invalid_utf8_is_rejected_before_any_row_is_imported(
+    sqlite_db, api_client, code_index, monkeypatch
+):
+    """A bad byte late in the body answers 400 with nothing committed, not a partial import."""
+    _units(sqlite_db)
+    monkeypatch.setattr(
+        product_routes, "ImportProductsUseCase", partial(ImportProductsUseCase, chunk_size=10)
+    )
+
+    response = api_client(product_routes.router).post(
+        "/products/import", content=_csv(1000) + b"P-X,Caf\xe9,UN,CJ,12\n"
+    )
+
+    assert response.status_code == 400
+    assert sqlite_db.query(ProductModel).count() == 0
+
+
+def test_code_index_is_invalidated_when_a_later_chunk_fails(
+    sqlite_db, api_client, code_index, monkeypatch
+):
+    """Chunks already committed reach scanner lookups even though the import then fails."""
+    _units(sqlite_db)
+    upsert_many = ProductRepositoryImpl.upsert_many
+    calls = []
+
+    def fail_second_chunk(self, products):
+        calls.append(len(products))
+        if len(calls) == 2:
+            raise RuntimeError("database went away")
+        return upsert_many(self, products)
+
+    monkeypatch.setattr(ProductRepositoryImpl, "upsert_many", fail_second_chunk)
+    monkeypatch.setattr(
+        product_routes, "ImportProductsUseCase", partial(ImportProductsUseCase, chunk_size=2)
+    )
+
+    with pytest.raises(RuntimeError):
+        api_client(product_routes.router).post("/products/import", content=_csv(3))
+
+    assert sqlite_db.query(ProductModel).count() == 2
+    assert code_index.invalidations == 1
+
@@ -0,0 +1,53 @@
+"""Unit tests for RegisterInventoryCountByCodeUseCase: code resolution before registering."""
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.product_code_index import ProductCodeIndex
+from app.application.use_cases.inventory.register_inventory_count_by_code_use_case import (
+    RegisterInventoryCountByCodeUseCase,
+)
+from app.domain.exceptions.business_exceptions import NotFoundException
+
+
+class _RecordingRegisterUseCase:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, **kwargs):
+        self.calls.append(kwargs)
+        return kwargs
+
+
+class _FakeProductRepo:
+    def __init__(self, codes):
+        self.codes = codes
+
+    def list_active_codes(self):
+        return dict(self.codes)
+
+
+def test_scanned_code_is_resolved_and_registered():
+    """Surrounding whitespace from the scanner is ignored; the product id is passed on."""
+    product_id = uuid4()
+    register = _RecordingRegisterUseCase()
+    use_case = RegisterInventoryCountByCodeUseCase(
+        register, _FakeProductRepo({"P001": product_id}), ProductCodeIndex()
+    )
+
+    use_case.execute(uuid4(), " P001\n", 4, user_warehouse_ids=[], is_admin=True)
+
+    assert register.calls[0]["product_id"] == product_id
+    assert register.calls[0]["packaging_quantity"] == 4
+
+
+def test_unknown_code_raises_not_found():
+    """Unknown or inactive codes never reach registration."""
+    register = _RecordingRegisterUseCase()
+    use_case = RegisterInventoryCountByCodeUseCase(
+        register, _FakeProductRepo({}), ProductCodeIndex()
+    )
+
+    with pytest.raises(NotFoundException):
+        use_case.execute(uuid4(), "NOPE", 1, user_warehouse_ids=[], is_admin=True)
+    assert register.calls == []
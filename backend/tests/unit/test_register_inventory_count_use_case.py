@@ -0,0 +1,196 @@
+"""Unit tests for RegisterInventoryCountUseCase: upsert over pre-created rows, new-row signal, recount flag."""
+from dataclasses import replace
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.application.use_cases.inventory.register_inventory_count_use_case import (
+    FEATURE_FLAG_INVENTORY_RECOUNT,
+    RegisterInventoryCountUseCase,
+)
+from app.domain.entities.inventory_count import InventoryCount
+from app.domain.entities.inventory_session import InventorySession
+from app.domain.entities.product import Product
+from app.domain.exceptions.business_exceptions import BusinessRuleViolation
+
+NOW = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+
+class _FakeSessionRepo:
+    def __init__(self, session):
+        self.session = session
+
+    def get_by_id(self, session_id):
+        return self.session
+
+
+class _FakeProductRepo:
+    def __init__(self, product):
+        self.product = product
+
+    def get_by_id(self, product_id):
+        return self.product
+
+
+class _FakeCountRepo:
+    """Mirrors the ON CONFLICT guard: only uncounted (counted_at None) rows are overwritten."""
+
+    def __init__(self, existing=None):
+        self.rows = {c.product_id: c for c in existing or []}
+
+    def register(self, count, allow_recount=False):
+        current = self.rows.get(count.product_id)
+        if current is not None and current.counted_at is not None and not allow_recount:
+            return None
+        if current is not None:
+            count = replace(count, id=current.id, created_at=current.created_at)
+        self.rows[count.product_id] = count
+        return count
+
+
+class _FakeFeatureFlagService:
+    def __init__(self, enabled_keys=()):
+        self.enabled_keys = set(enabled_keys)
+
+    def is_enabled(self, key):
+        return key in self.enabled_keys
+
+
+def _session():
+    return InventorySession(
+        id=uuid4(),
+        warehouse_id=uuid4(),
+        month=NOW,
+        count_number=1,
+        created_by=uuid4(),
+        created_at=NOW,
+        closed_at=None,
+    )
+
+
+def _product():
+    return Product(
+        id=uuid4(),
+        code="P-1",
+        description="Product",
+        inventory_unit=uuid4(),
+        packaging_unit=uuid4(),
+        conversion_factor=12.0,
+        is_active=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _row(session, product, packages, counted=True):
+    return InventoryCount(
+        id=uuid4(),
+        session_id=session.id,
+        product_id=product.id,
+        measure_unit_id=product.packaging_unit,
+        quantity_packages=packages,
+        quantity_units=packages * 12,
+        created_at=NOW,
+        updated_at=NOW,
+        counted_at=NOW if counted else None,
+    )
+
+
+def _use_case(session, product, count_repo, enabled_keys=()):
+    return RegisterInventoryCountUseCase(
+        _FakeSessionRepo(session),
+        _FakeProductRepo(product),
+        count_repo,
+        feature_flag_service=_FakeFeatureFlagService(enabled_keys),
+    )
+
+
+def test_register_fills_row_pre_created_by_add_products():
+    """An uncounted pre-created row is updated in place: same id, new quantities."""
+    session, product = _session(), _product()
+    pre_created = _row(session, product, 0, counted=False)
+    count_repo = _FakeCountRepo([pre_created])
+
+    registered = _use_case(session, product, count_repo).execute(
+        session.id, product.id, 3, user_warehouse_ids=[], is_admin=True
+    )
+
+    saved = registered.count
+    assert saved.id == pre_created.id
+    assert (saved.quantity_packages, saved.quantity_units) == (3, 36)
+    assert registered.created is False
+
+
+def test_register_rejects_already_counted_product():
+    """Without recount, a counted row is left alone and the request is rejected."""
+    session, product = _session(), _product()
+    count_repo = _FakeCountRepo([_row(session, product, 2)])
+
+    with pytest.raises(BusinessRuleViolation, match="already been counted"):
+        _use_case(session, product, count_repo).execute(
+            session.id, product.id, 5, user_warehouse_ids=[], is_admin=True
+        )
+    assert count_repo.rows[product.id].quantity_packages == 2
+
+
+def test_register_rejects_inactive_product():
+    """A deactivated product (possibly still in a code index) cannot be counted."""
+    session, product = _session(), replace(_product(), is_active=False)
+    count_repo = _FakeCountRepo()
+
+    with pytest.raises(BusinessRuleViolation, match="inactive"):
+        _use_case(session, product, count_repo).execute(
+            session.id, product.id, 1, user_warehouse_ids=[], is_admin=True
+        )
+    assert count_repo.rows == {}
+
+
+def test_register_rejects_product_counted_as_zero():
+    """A real count of 0 packages is a count: a second POST without recount is rejected."""
+    session, product = _session(), _product()
+    count_repo = _FakeCountRepo()
+    use_case = _use_case(session, product, count_repo)
+    first = use_case.execute(session.id, product.id, 0, user_warehouse_ids=[], is_admin=True)
+    assert first.created is True
+
+    with pytest.raises(BusinessRuleViolation, match="already been counted"):
+        use_case.execute(session.id, product.id, 4, user_warehouse_ids=[], is_admin=True)
+    assert first.count.counted_at is not None
+    assert count_repo.rows[product.id].quantity_packages == 0
+
+
+def test_recount_requires_feature_flag():
+    """recount=True overwrites only when ENABLE_INVENTORY_RECOUNT is on."""
+    session, product = _session(), _product()
+    count_repo = _FakeCountRepo([_row(session, product, 2)])
+
+    with pytest.raises(BusinessRuleViolation, match="not enabled"):
+        _use_case(session, product, count_repo).execute(
+            session.id, product.id, 5, user_warehouse_ids=[], is_admin=True, recount=True
+        )
+
+    recounted = _use_case(session, product, count_repo, [FEATURE_FLAG_INVENTORY_RECOUNT]).execute(
+        session.id, product.id, 5, user_warehouse_ids=[], is_admin=True, recount=True
+    )
+    assert (recounted.count.quantity_packages, recounted.created) == (5, False)
+
+
+def test_count_in_inventory_unit_stores_packaging_units():
+    """Units entered directly are kept exact; quantity_packages stays in (rounded) packages."""
+    session, product = _session(), _product()
+
+    saved = _use_case(session, product, _FakeCountRepo()).execute(
+        session.id,
+        product.id,
+        30,
+        user_warehouse_ids=[],
+        is_admin=True,
+        measure_unit_id=product.inventory_unit,
+    ).count
+
+    assert (saved.measure_unit_id, saved.quantity_packages, saved.quantity_units) == (
+        product.inventory_unit,
+        3,
+        30,
+    )
@@ -0,0 +1,85 @@
+"""Route tests for the monthly inventory report CSV: rows streamed from the query result."""
+from datetime import datetime
+from uuid import uuid4
+
+from app.infrastructure.models.inventory_count_model import InventoryCountModel
+from app.infrastructure.models.inventory_session_model import InventorySessionModel
+from app.infrastructure.models.product_model import ProductModel
+from app.infrastructure.repositories.inventory_count_repository_impl import (
+    InventoryCountRepositoryImpl,
+)
+from app.presentation.routes import report_routes
+
+MONTH = datetime(2025, 2, 1)
+UNIT = uuid4()
+
+
+def _closed_session(db, count_number=1):
+    session = InventorySessionModel(
+        id=uuid4(),
+        warehouse_id=uuid4(),
+        month=MONTH,
+        count_number=count_number,
+        created_by=uuid4(),
+        created_at=MONTH,
+        closed_at=MONTH,
+    )
+    db.add(session)
+    return session.id
+
+
+def _counted_product(db, code, session_ids, packages):
+    product_id = uuid4()
+    db.add(
+        ProductModel(
+            id=product_id,
+            code=code,
+            description=f"Product {code}",
+            inventory_unit_id=UNIT,
+            packaging_unit_id=UNIT,
+            conversion_factor=1.0,
+            is_active=True,
+            created_at=MONTH,
+            updated_at=MONTH,
+        )
+    )
+    for session_id in session_ids:
+        db.add(
+            InventoryCountModel(
+                id=uuid4(),
+                session_id=session_id,
+                product_id=product_id,
+                measure_unit_id=UNIT,
+                quantity_packages=packages,
+                quantity_units=packages,
+                created_at=MONTH,
+                updated_at=MONTH,
+                counted_at=MONTH,
+            )
+        )
+
+
+def test_csv_streams_rows_from_the_query_without_building_the_report(
+    sqlite_db, api_client, monkeypatch
+):
+    """The CSV iterates iter_product_totals; the list-building product_totals is never called."""
+    first, second = _closed_session(sqlite_db), _closed_session(sqlite_db)
+    _counted_product(sqlite_db, "B-2", [first], 5)
+    _counted_product(sqlite_db, "A-1", [first, second], 3)
+    sqlite_db.commit()
+
+    def fail(self, session_ids):
+        raise AssertionError("CSV export materialized the report")
+
+    monkeypatch.setattr(InventoryCountRepositoryImpl, "product_totals", fail)
+    monkeypatch.setattr(report_routes, "_monthly_report_cache", report_routes.ImmutableResultCache())
+    response = api_client(report_routes.router).get(
+        "/reports/monthly-inventory.csv", params={"month": "2025-02"}
+    )
+
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "code,description,total_packages,total_units,warehouses_count",
+        "A-1,Product A-1,6,6,2",
+        "B-2,Product B-2,5,5,1",
+    ]
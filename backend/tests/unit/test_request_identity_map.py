@@ -0,0 +1,89 @@
+"""Unit tests for the request identity map: one load per key, writes refresh, opt-in per Session."""
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from app.infrastructure.repositories.identity_map import (
+    cached_get,
+    cached_get_many,
+    enable_identity_map,
+    forget,
+    remember,
+)
+
+
+class _Loader:
+    def __init__(self, values):
+        self.values = dict(values)
+        self.calls = []
+
+    def one(self, key):
+        def load():
+            self.calls.append([key])
+            return self.values.get(key)
+
+        return load
+
+    def many(self, keys):
+        self.calls.append(list(keys))
+        return [self.values[k] for k in keys if k in self.values]
+
+
+def test_repeated_lookups_load_once_including_misses():
+    """The second get_by_id for a key, found or missing, never calls the loader."""
+    db = Session()
+    entries = enable_identity_map(db)
+    found, missing = uuid4(), uuid4()
+    loader = _Loader({found: "product"})
+
+    for _ in range(2):
+        assert cached_get(db, str, found, loader.one(found)) == "product"
+        assert cached_get(db, str, missing, loader.one(missing)) is None
+
+    assert loader.calls == [[found], [missing]]
+    assert (entries.hits, entries.misses) == (2, 2)
+
+
+def test_get_many_loads_only_unknown_keys_and_feeds_get_by_id():
+    """Bulk lookups reuse cached entries, and their results serve later single lookups."""
+    db = Session()
+    enable_identity_map(db)
+    a, b, c = uuid4(), uuid4(), uuid4()
+    loader = _Loader({a: ("a", a), b: ("b", b)})
+
+    assert cached_get(db, tuple, a, loader.one(a)) == ("a", a)
+    result = cached_get_many(db, tuple, [a, b, c, b], loader.many, lambda v: v[1])
+
+    assert result == [("a", a), ("b", b)]
+    assert cached_get(db, tuple, b, loader.one(b)) == ("b", b)
+    assert cached_get_many(db, tuple, [c], loader.many, lambda v: v[1]) == []
+    assert loader.calls == [[a], [b, c]]
+
+
+def test_writes_replace_entries_and_forget_drops_a_type():
+    """remember() serves the written state; forget() makes every key of the type reload."""
+    db = Session()
+    enable_identity_map(db)
+    key = uuid4()
+    loader = _Loader({key: "stale"})
+
+    cached_get(db, str, key, loader.one(key))
+    remember(db, str, key, "written")
+    assert cached_get(db, str, key, loader.one(key)) == "written"
+
+    forget(db, str)
+    assert cached_get(db, str, key, loader.one(key)) == "stale"
+    assert len(loader.calls) == 2
+
+
+def test_sessions_without_a_map_always_load():
+    """Sessions opened outside get_db (scripts, benchmarks) keep querying every time."""
+    db = Session()
+    key = uuid4()
+    loader = _Loader({key: "product"})
+
+    cached_get(db, str, key, loader.one(key))
+    cached_get(db, str, key, loader.one(key))
+    remember(db, str, key, "ignored")
+
+    assert loader.calls == [[key], [key]]
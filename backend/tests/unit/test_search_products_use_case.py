@@ -0,0 +1,31 @@
+"""Unit tests for SearchProductsUseCase: query trimming and result cap."""
+from app.application.use_cases.search_products_use_case import (
+    MAX_SEARCH_RESULTS,
+    SearchProductsUseCase,
+)
+
+
+class _FakeProductRepo:
+    def __init__(self):
+        self.calls = []
+
+    def search_active(self, query, limit):
+        self.calls.append((query, limit))
+        return []
+
+
+def test_blank_query_does_not_hit_repository():
+    """Whitespace-only input returns no results without querying."""
+    repo = _FakeProductRepo()
+
+    assert SearchProductsUseCase(repo).execute("   ") == []
+    assert repo.calls == []
+
+
+def test_query_is_trimmed_and_limit_capped():
+    """Surrounding whitespace is stripped; limit never exceeds MAX_SEARCH_RESULTS."""
+    repo = _FakeProductRepo()
+
+    SearchProductsUseCase(repo).execute("  arroz ", limit=500)
+
+    assert repo.calls == [("arroz", MAX_SEARCH_RESULTS)]
@@ -12,3 +12,24 @@ def test_calculate_total_units_five_boxes_factor_twelve_returns_sixty():
         factor=12,
     )
     assert result == 60
+
+
+def test_fractional_factor_is_exact_and_rounded_half_up():
+    """10 * 1.15 is 11.5 (not 11.4999…) and rounds to 12; factors are no longer truncated."""
+    assert UnitConversionService.calculate_total_units(10, 1.15) == 12
+    assert UnitConversionService.calculate_total_units(5, 2.5) == 13
+    assert UnitConversionService.calculate_total_units(3, 0.333) == 1
+
+
+def test_batch_matches_scalar_conversion():
+    """The vectorized call gives the same whole units as converting row by row."""
+    quantities = [10, 5, 3, 0, 7, 10]
+    factors = [1.15, 2.5, 0.333, 12.0, 0.35, 1.15]
+
+    totals = UnitConversionService.calculate_total_units_batch(quantities, factors)
+
+    assert totals.tolist() == [
+        UnitConversionService.calculate_total_units(q, f) for q, f in zip(quantities, factors)
+    ]
+    assert UnitConversionService.calculate_total_units_batch([], []).tolist() == []
+
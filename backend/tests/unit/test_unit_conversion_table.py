@@ -0,0 +1,75 @@
+"""Unit tests for UnitConversionTable: multi-hop factors, product overrides, cache."""
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from app.application.services.unit_conversion_table import (
+    UnitConversionTable,
+    UnitConversionTableCache,
+)
+from app.domain.entities.product import Product
+from app.domain.entities.unit_conversion import UnitConversion
+
+NOW = datetime(2025, 2, 1, tzinfo=timezone.utc)
+UND, CJ, DOC, PAQ, KG = (uuid4() for _ in range(5))
+
+
+def _edge(from_unit, to_unit, factor, product_id=None):
+    return UnitConversion(uuid4(), from_unit, to_unit, factor, product_id, NOW, NOW)
+
+
+def _product(factor=24.0):
+    return Product(uuid4(), "P-1", "Product", UND, CJ, factor, True, NOW, NOW)
+
+
+def test_packaging_and_inventory_units_need_no_edges():
+    """The product's own factor and the inventory unit itself are always convertible."""
+    product = _product()
+    table = UnitConversionTable()
+
+    assert table.to_inventory_factor(product, CJ) == Decimal("24")
+    assert table.to_inventory_factor(product, UND) == Decimal("1")
+    assert table.to_inventory_factor(product, KG) is None
+
+
+def test_multi_hop_paths_compose_exactly():
+    """PAQ -> DOC -> UND and DOC -> CJ (reversed edge) -> UND are both resolved."""
+    product = _product(factor=1.2)
+    table = UnitConversionTable([_edge(PAQ, DOC, 0.5), _edge(DOC, UND, 12)])
+
+    assert table.to_inventory_factor(product, PAQ) == Decimal("6")
+    assert table.factor(UND, PAQ) == Decimal(1) / Decimal(6)
+
+    via_packaging = UnitConversionTable([_edge(CJ, DOC, 2)])
+    assert via_packaging.to_inventory_factor(product, DOC) == Decimal("0.6")
+
+
+def test_product_override_only_applies_to_its_product():
+    """A per-product edge wins for that product; others keep the global path."""
+    product, other = _product(), _product()
+    table = UnitConversionTable(
+        [_edge(PAQ, UND, 6), _edge(PAQ, UND, 5, product_id=product.id)]
+    )
+
+    assert table.to_inventory_factor(product, PAQ) == Decimal("5")
+    assert table.to_inventory_factor(other, PAQ) == Decimal("6")
+
+
+def test_cache_rebuilds_after_invalidate_or_ttl():
+    """The loader runs once until invalidate() or the ttl forces a rebuild."""
+    now = [0.0]
+    loads = []
+    cache = UnitConversionTableCache(ttl_seconds=60, clock=lambda: now[0])
+
+    def load():
+        loads.append(now[0])
+        return [_edge(DOC, UND, 12)]
+
+    first = cache.get(load)
+    assert cache.get(load) is first
+    cache.invalidate()
+    cache.get(load)
+    now[0] = 61.0
+    cache.get(load)
+
+    assert loads == [0.0, 0.0, 61.0]
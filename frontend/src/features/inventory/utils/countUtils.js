@@ -1,7 +1,7 @@
 /**
- * Converts quantity to packaging_quantity for the backend.
- * If measure is packaging unit: packaging_quantity = quantity.
- * If measure is inventory unit: packaging_quantity = quantity / conversion_factor.
+ * Quantity sent to the backend as packaging_quantity.
+ * It is expressed in the row's measure_unit_id (packaging unit when omitted); the
+ * backend normalizes it to inventory units through the unit conversion table.
  * @param {Object} row - Row with product, measure_unit_id, quantity
  * @param {import('../services/types').ProductListItem} [row.product]
  * @param {string} [row.measure_unit_id]
@@ -11,11 +11,5 @@
 export function toPackagingQuantity(row) {
   const q = Number(row.quantity);
   if (!Number.isFinite(q) || q <= 0) return 0;
-  const product = row.product;
-  if (!product?.conversion_factor) return Math.round(q);
-  const factor = Number(product.conversion_factor) || 1;
-  const isPackaging =
-    product.packaging_unit_id && row.measure_unit_id === product.packaging_unit_id;
-  if (isPackaging) return Math.round(q);
-  return Math.max(1, Math.round(q / factor));
+  return Math.round(q);
 }